@@ -0,0 +1,50 @@
+"""Benchmarks for every public text function in ``persian.core``.
+
+Each function runs on small, medium and huge inputs of pure-Latin, pure-Persian
+and mixed text. Run with ``make bench``; results are saved under
+``.benchmarks/`` and compared with the previous run. Number parsing and
+formatting are benchmarked on numbers in ``test_numbers.py``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+import persian.core
+
+SIZES = {"small": 100, "medium": 10_000, "huge": 1_000_000}
+
+# Each script mixes the inputs its functions act on: digits, spacing affixes,
+# Arabic letters and diacritics, keyboard letters and percent-escapes.
+SCRIPTS = {
+    "latin": "Hello world 12345 sghl gd %D8%B3 convert the keyboard layout. ",
+    "persian": "كتاب شماره ٣٤٥ را می خوانم و آمده ای دِبِ زِذِ علي ۱۲۳ ",
+    "mixed": "Version 2 از كتاب ٣٤٥ می خوانم sghl %D8%B3 آمده ای 678 ",
+}
+
+
+def _make_text(script: str, size: str) -> str:
+    unit = SCRIPTS[script]
+    length = SIZES[size]
+    return (unit * (length // len(unit) + 1))[:length]
+
+
+# Functions that take a single number rather than running text
+NUMBER_FUNCTIONS = {"format_number", "parse_number"}
+TEXT_FUNCTIONS = [name for name in persian.core.__all__ if name not in NUMBER_FUNCTIONS]
+
+
+def _public_functions() -> list[tuple[str, Callable[[str], object]]]:
+    return [(name, getattr(persian.core, name)) for name in TEXT_FUNCTIONS]
+
+
+@pytest.mark.parametrize("script", list(SCRIPTS))
+@pytest.mark.parametrize("size", list(SIZES))
+@pytest.mark.parametrize(("name", "function"), _public_functions(), ids=TEXT_FUNCTIONS)
+def test_core_function(benchmark, name, function, size, script):
+    text = _make_text(script, size)
+    benchmark.group = f"{name}[{size}]"
+    benchmark.extra_info["characters"] = len(text)
+    benchmark(function, text)
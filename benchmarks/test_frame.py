@@ -0,0 +1,27 @@
+"""Column normalization with ``persian.frame`` against a per-row ``Series.map``."""
+
+from __future__ import annotations
+
+import pytest
+
+import persian
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+frame = pytest.importorskip("persian.frame")
+
+ROWS = 100_000
+VALUES = ["كتاب ٣ را می خوانم و آمده ای", "Hello world 42", "سلام دنیا", None]
+
+METHODS = {
+    "map": lambda series: series.map(persian.normalize_persian, na_action="ignore"),
+    "accessor": lambda series: series.persian.normalize(),
+}
+
+
+@pytest.mark.parametrize("method", list(METHODS))
+@pytest.mark.parametrize("dtype", ["string[pyarrow]", "object"])
+def test_normalize_column(benchmark, dtype, method):
+    series = pd.Series(VALUES * (ROWS // len(VALUES)), dtype=dtype)
+    benchmark.group = f"normalize_column[{dtype}]"
+    benchmark(METHODS[method], series)
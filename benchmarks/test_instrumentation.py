@@ -0,0 +1,34 @@
+"""Overhead of ``Instrumentation`` on ``normalize_persian`` over 10,000 short strings.
+
+``disabled`` runs after a collector was enabled and disabled again, and must match
+an uninstrumented run. ``enabled`` records every call and each of its stages.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import persian
+from persian.instrumentation import Instrumentation
+
+TEXTS = ["سلام ٣٤٥ می آیم", "كتاب ها را خوانده ام", "Hello world", "علي ۱۲۳"] * 2_500
+
+
+def _normalize_all() -> list[str]:
+    return [persian.normalize_persian(text) for text in TEXTS]
+
+
+@pytest.mark.parametrize("state", ["disabled", "enabled"])
+def test_normalize_persian(benchmark, state):
+    benchmark.group = "instrumentation"
+    expected = _normalize_all()
+    metrics = Instrumentation()
+    with metrics:
+        pass
+    if state == "enabled":
+        metrics.enable()
+    try:
+        assert benchmark(_normalize_all) == expected
+    finally:
+        metrics.disable()
+    assert metrics.enabled is False
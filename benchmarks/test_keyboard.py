@@ -0,0 +1,31 @@
+"""Fixing the keyboard layout of search queries with ``fix_keyboard_layout``.
+
+Queries come in three kinds: typed correctly, Persian typed on the English layout
+and English typed on the Persian layout. 10,000 queries of each kind are fixed one
+call at a time, as a search front end would.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import persian
+from persian.constants import EN_TO_FA_KEYBOARD_TABLE, FA_TO_EN_KEYBOARD_TABLE
+
+PERSIAN = ["خرید گوشی موبایل", "قیمت دلار امروز", "دانلود فیلم جدید", "هوای تهران"]
+ENGLISH = ["download video", "python tutorial", "weather today", "buy phone online"]
+QUERIES = {
+    "correct": PERSIAN + ENGLISH,
+    "persian_on_english": [query.translate(FA_TO_EN_KEYBOARD_TABLE) for query in PERSIAN],
+    "english_on_persian": [query.translate(EN_TO_FA_KEYBOARD_TABLE) for query in ENGLISH],
+}
+COUNT = 10_000
+
+
+@pytest.mark.parametrize("kind", list(QUERIES))
+def test_fix_keyboard_layout(benchmark, kind):
+    benchmark.group = "fix_keyboard_layout"
+    queries = QUERIES[kind] * (COUNT // len(QUERIES[kind]))
+    fixed = benchmark(lambda: [persian.fix_keyboard_layout(query) for query in queries])
+    expected = {"correct": PERSIAN + ENGLISH, "persian_on_english": PERSIAN}.get(kind, ENGLISH)
+    assert fixed[: len(expected)] == expected
@@ -0,0 +1,101 @@
+"""Number parsing, formatting and spelling against hand-written equivalents."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import persian
+from persian.constants import (
+    AR_DECIMAL_SEPARATOR,
+    AR_THOUSANDS_SEPARATOR,
+    FA_HUNDREDS_WORDS,
+    FA_ONES_WORDS,
+    FA_SCALE_WORDS,
+    FA_TEENS_WORDS,
+    FA_TENS_WORDS,
+)
+
+ROWS = 100_000
+NUMBERS = [random.Random(0).randrange(10**9) / 100 for _ in range(ROWS)]
+TEXTS = [persian.format_number(number) for number in NUMBERS]
+AMOUNTS = [random.Random(0).randrange(10**12) for _ in range(ROWS)]
+WORDS = [persian.number_to_words(amount) for amount in AMOUNTS]
+
+
+def _parse_by_hand(texts: list[str]) -> list[float]:
+    return [
+        float(
+            persian.convert_fa_numbers(text)
+            .replace(AR_THOUSANDS_SEPARATOR, "")
+            .replace(AR_DECIMAL_SEPARATOR, ".")
+        )
+        for text in texts
+    ]
+
+
+PARSERS = {
+    "by_hand": _parse_by_hand,
+    "parse_number": lambda texts: list(map(persian.parse_number, texts)),
+    "parse_number_many": lambda texts: list(persian.parse_number_many(texts)),
+}
+
+FORMATTERS = {
+    "by_hand": lambda numbers: [
+        persian.convert_en_numbers(f"{number:,}")
+        .replace(",", AR_THOUSANDS_SEPARATOR)
+        .replace(".", AR_DECIMAL_SEPARATOR)
+        for number in numbers
+    ],
+    "format_number": lambda numbers: list(map(persian.format_number, numbers)),
+    "format_number_many": lambda numbers: list(persian.format_number_many(numbers)),
+}
+
+
+@pytest.mark.parametrize("method", list(PARSERS))
+def test_parse_numbers(benchmark, method):
+    benchmark.group = "parse_number"
+    benchmark(PARSERS[method], TEXTS)
+
+
+@pytest.mark.parametrize("method", list(FORMATTERS))
+def test_format_numbers(benchmark, method):
+    benchmark.group = "format_number"
+    benchmark(FORMATTERS[method], NUMBERS)
+
+
+def _naive_words(number: int) -> str:
+    """Recursive converter that rebuilds every phrase on each call."""
+    if number < 10:
+        return FA_ONES_WORDS[number]
+    if number < 20:
+        return FA_TEENS_WORDS[number - 10]
+    if number < 1000:
+        unit = 10 if number < 100 else 100
+        head, rest = divmod(number, unit)
+        head_words = FA_TENS_WORDS[head] if unit == 10 else FA_HUNDREDS_WORDS[head]
+    else:
+        index = (len(str(number)) - 1) // 3
+        head, rest = divmod(number, 1000**index)
+        scale = FA_SCALE_WORDS[index]
+        head_words = scale if head == 1 and index == 1 else f"{_naive_words(head)} {scale}"
+    return f"{head_words} و {_naive_words(rest)}" if rest else head_words
+
+
+SPELLERS = {
+    "recursive": lambda amounts: list(map(_naive_words, amounts)),
+    "number_to_words": lambda amounts: list(map(persian.number_to_words, amounts)),
+    "number_to_words_many": lambda amounts: list(persian.number_to_words_many(amounts)),
+}
+
+
+@pytest.mark.parametrize("method", list(SPELLERS))
+def test_number_to_words(benchmark, method):
+    benchmark.group = "number_to_words"
+    assert benchmark(SPELLERS[method], AMOUNTS) == WORDS
+
+
+def test_words_to_number(benchmark):
+    benchmark.group = "words_to_number"
+    assert benchmark(lambda words: list(persian.words_to_number_many(words)), WORDS) == AMOUNTS
@@ -0,0 +1,37 @@
+"""Pathological inputs for the spacing patterns.
+
+Each input shape is benchmarked at growing lengths. With linear-time patterns
+the time per character, reported as ``ns_per_char``, stays flat across lengths
+within a group. A backtracking pattern would blow up at the larger sizes
+instead.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import persian
+
+LENGTHS = (1_000, 10_000, 100_000)
+
+SHAPES = {
+    # One long letter run followed by whitespace and no suffix.
+    "letter_run": lambda length: "ب" * length + " x",
+    # Repeated "می" prefixes with no verb stem.
+    "mi_chain": lambda length: " می" * (length // 3) + "!",
+    # A letter followed by a long whitespace run that never reaches a suffix.
+    "whitespace_run": lambda length: "ب" + " " * length + "x",
+    # Words that each almost take a suffix.
+    "near_suffix": lambda length: "کتاب اx " * (length // 7),
+}
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+@pytest.mark.parametrize("shape", list(SHAPES))
+def test_convert_fa_spaces_pathological(benchmark, shape, length):
+    text = SHAPES[shape](length)
+    benchmark.group = f"convert_fa_spaces[{shape}]"
+    benchmark(persian.convert_fa_spaces, text)
+    # No statistics are collected under --benchmark-disable.
+    if benchmark.stats is not None:
+        benchmark.extra_info["ns_per_char"] = benchmark.stats.stats.mean * 1e9 / len(text)
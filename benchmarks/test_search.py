@@ -0,0 +1,32 @@
+"""Folding documents to search keys: the multi-pass chain against ``fold_for_search``."""
+
+from __future__ import annotations
+
+import pytest
+
+import persian
+
+DOCUMENT = "من می روم و کتاب ها را می خوانم. مُحَمَّد در مدرسة إسلامی ٣٤٥ آمده ای "
+DOCUMENTS = [DOCUMENT * 4] * 10_000
+_LETTER_VARIANTS = str.maketrans({"آ": "ا", "أ": "ا", "إ": "ا", "ة": "ه", "ۀ": "ه"})
+
+
+def _chain(text: str) -> str:
+    text = persian.normalize_persian(text, normalize_presentation_forms=True)
+    text = persian.remove_arabic_diacritics(text)
+    text = persian.convert_fa_numbers(text.translate(_LETTER_VARIANTS))
+    return " ".join(text.replace("\u200c", " ").split())
+
+
+METHODS = {
+    "chain": lambda documents: [_chain(text) for text in documents],
+    "fold_for_search": lambda documents: [persian.fold_for_search(text) for text in documents],
+    "fold_for_search_many": lambda documents: list(persian.fold_for_search_many(documents)),
+}
+
+
+@pytest.mark.parametrize("method", list(METHODS))
+def test_fold_for_search(benchmark, method):
+    benchmark.group = "fold_for_search"
+    keys = benchmark(METHODS[method], DOCUMENTS)
+    assert keys == METHODS["chain"](DOCUMENTS[:1]) * len(DOCUMENTS)
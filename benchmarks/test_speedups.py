@@ -0,0 +1,44 @@
+"""The conversion kernels: ``persian._speedups`` in C against ``persian._native``.
+
+Both backends run the kernels ``persian.core`` uses, on the same mixed document
+of 1,000,000 characters. The C backend is skipped when the extension is not built.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from persian import _native
+from persian.constants import AR_TO_FA_CHARS_TABLE, EN_TO_FA_KEYBOARD_TABLE
+
+try:
+    from persian import _speedups
+except ImportError:
+    _speedups = None
+
+UNIT = "كتاب شماره ٣٤٥ را می خوانم و آمده ای علي sghl ۱۲۳ Version 2 "
+DOCUMENT = (UNIT * (1_000_000 // len(UNIT) + 1))[:1_000_000]
+PAIRS = [("ﻻ", "لا"), ("ك", "ک"), ("ي", "ی")]
+
+BACKENDS = {
+    "native": _native,
+    "speedups": _speedups,
+}
+KERNELS = {
+    "translate_ar_characters": lambda backend: backend.translator(AR_TO_FA_CHARS_TABLE),
+    "translate_en_keyboard": lambda backend: backend.translator(EN_TO_FA_KEYBOARD_TABLE),
+    "replace": lambda backend: backend.replacer(PAIRS),
+    "has_range": lambda backend: lambda text: backend.has_range(text, 0x06F0, 0x06F9),
+    "count_range": lambda backend: lambda text: backend.count_range(text, 0x0600, 0x06FF),
+}
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+@pytest.mark.parametrize("kernel", list(KERNELS))
+def test_kernel(benchmark, kernel, backend):
+    if BACKENDS[backend] is None:
+        pytest.skip("persian._speedups is not built")
+    benchmark.group = kernel
+    function = KERNELS[kernel](BACKENDS[backend])
+    result = benchmark(function, DOCUMENT)
+    assert result == KERNELS[kernel](_native)(DOCUMENT)
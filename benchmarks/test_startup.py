@@ -0,0 +1,69 @@
+"""Cold-start cost of the package, measured with ``python -X importtime``.
+
+Each round starts a fresh interpreter, so the benchmark timings include
+interpreter startup. The import cost itself is parsed from the
+``-X importtime`` report, net of what a bare interpreter imports, and kept as
+``import_us``, the best of all rounds, which must stay within the budget.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from functools import cache
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Statement and import budget in microseconds. Eager imports of every submodule used
+# to cost ~120 ms for either; a first call still has to load ``re`` and ``typing``.
+STATEMENTS = {
+    "import": ("import persian", 15_000),
+    "first_call": ("import persian; persian.normalize_persian('من می روم')", 40_000),
+}
+
+
+def _top_level_imports(statement: str) -> dict[str, int]:
+    """Run ``statement`` under ``-X importtime`` and return top-level cumulative times."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    # The first line is the "self [us] | cumulative | imported package" header.
+    for line in completed.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        # Nested entries are indented and already counted in their parent's total.
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@cache
+def _startup_modules() -> frozenset[str]:
+    return frozenset(_top_level_imports("pass"))
+
+
+def _import_time(statement: str) -> int:
+    """Microseconds spent importing what ``statement`` needs beyond interpreter startup.
+
+    Submodules loaded lazily through ``importlib`` are reported at the top level,
+    so the total covers every entry a bare interpreter does not import.
+    """
+    times = _top_level_imports(statement)
+    return sum(times[name] for name in times.keys() - _startup_modules())
+
+
+@pytest.mark.parametrize("case", list(STATEMENTS))
+def test_startup(benchmark, case):
+    benchmark.group = "startup"
+    statement, budget = STATEMENTS[case]
+    times = []
+    benchmark.pedantic(lambda: times.append(_import_time(statement)), rounds=5, iterations=1)
+    benchmark.extra_info["import_us"] = min(times)
+    assert min(times) <= budget
@@ -0,0 +1,30 @@
+"""Scaling of ``normalize_threaded`` with the number of threads.
+
+Threads only run in parallel on a free-threaded build (3.13t and later); with
+the GIL every thread count takes about as long as one.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+import persian
+
+DOCUMENTS = ["من می روم و کتاب ها را می خوانم. ٣٤٥ كتاب آمده ای " * 8] * 5_000
+GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def test_normalize_many(benchmark):
+    benchmark.group = "normalize_threaded"
+    benchmark.extra_info["gil_enabled"] = GIL_ENABLED
+    benchmark(lambda: list(persian.normalize_many(DOCUMENTS)))
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4, 8])
+def test_normalize_threaded(benchmark, workers):
+    benchmark.group = "normalize_threaded"
+    benchmark.extra_info["gil_enabled"] = GIL_ENABLED
+    result = benchmark(lambda: list(persian.normalize_threaded(DOCUMENTS, workers=workers)))
+    assert result == list(persian.normalize_many(DOCUMENTS[:1])) * len(DOCUMENTS)
@@ -0,0 +1,25 @@
+"""Tokenizing normalized text in two passes against the fused single scan."""
+
+from __future__ import annotations
+
+import pytest
+
+import persian
+
+TEXT = "من می روم و کتاب ها را می خوانم. آنها رفته اند ٣٤٥ كتاب abc، " * 16_000
+
+METHODS = {
+    "separate": lambda text: persian.tokenize_array(persian.normalize_persian(text)),
+    "fused": persian.tokenize_normalized,
+}
+
+
+@pytest.mark.parametrize("method", list(METHODS))
+def test_tokenize_normalized(benchmark, method):
+    benchmark.group = "tokenize_normalized"
+    benchmark(METHODS[method], TEXT)
+
+
+def test_tokenize_array(benchmark):
+    benchmark.group = "tokenize"
+    benchmark(persian.tokenize_array, TEXT)
@@ -1,24 +1,66 @@
-"""Public API exports for the Persian package."""
+"""Public API exports for the Persian package.
+
+Exports are resolved lazily (PEP 562): ``import persian`` only builds the
+name table below, and the submodule defining a name, with its tables and
+patterns, is imported on first attribute access.
+"""
 
 from __future__ import annotations
 
-from .core import (
-    contains_arabic_digits,
-    contains_persian_digits,
-    convert_ar_characters,
-    convert_ar_numbers,
-    convert_en_characters,
-    convert_en_numbers,
-    convert_fa_numbers,
-    convert_fa_spaces,
-    decode_url,
-    is_persian_text,
-    normalize_persian,
-    remove_arabic_diacritics,
-)
-
-# Deprecated helpers are still importable for backward compatibility
-from .deprecation import *
+from importlib import import_module
+
+# Spelled out instead of imported so that ``import persian`` does not load ``typing``.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .alignment import Alignment
+    from .batch import (
+        convert_ar_characters_many,
+        convert_ar_numbers_many,
+        convert_en_characters_many,
+        convert_en_numbers_many,
+        convert_fa_numbers_many,
+        convert_fa_spaces_many,
+        fold_for_search_many,
+        format_number_many,
+        normalize_many,
+        number_to_words_many,
+        parse_number_many,
+        words_to_number_many,
+    )
+    from .binary import ByteTranslator, normalize_bytes, normalize_file
+    from .cache import cached
+    from .core import (
+        contains_arabic_digits,
+        contains_persian_digits,
+        convert_ar_characters,
+        convert_ar_numbers,
+        convert_en_characters,
+        convert_en_numbers,
+        convert_fa_numbers,
+        convert_fa_spaces,
+        count_persian_chars,
+        decode_url,
+        format_number,
+        is_persian_text,
+        normalize_persian,
+        parse_number,
+        persian_ratio,
+        remove_arabic_diacritics,
+        script_profile,
+    )
+    from .deprecation import arToPersianChar, arToPersianNumb, enToPersianChar, enToPersianNumb
+    from .incremental import IncrementalNormalizer
+    from .instrumentation import Instrumentation
+    from .keyboard import fix_keyboard_layout
+    from .normalizer import Normalizer
+    from .number_words import number_to_words, words_to_number
+    from .parallel import normalize_parallel, normalize_threaded
+    from .registry import compile_mappings, register_mapping, unregister_mapping
+    from .search import fold_for_search
+    from .stream import normalize_stream
+    from .tokenizer import tokenize, tokenize_array, tokenize_normalized
 
 # Version info
 try:
@@ -26,18 +68,131 @@ try:
 except ImportError:
     __version__ = "dev"
 
+# Public name -> submodule defining it
+_LAZY_EXPORTS: dict[str, str] = {
+    "Alignment": "alignment",
+    "convert_ar_characters_many": "batch",
+    "convert_ar_numbers_many": "batch",
+    "convert_en_characters_many": "batch",
+    "convert_en_numbers_many": "batch",
+    "convert_fa_numbers_many": "batch",
+    "convert_fa_spaces_many": "batch",
+    "fold_for_search_many": "batch",
+    "format_number_many": "batch",
+    "normalize_many": "batch",
+    "number_to_words_many": "batch",
+    "parse_number_many": "batch",
+    "words_to_number_many": "batch",
+    "ByteTranslator": "binary",
+    "normalize_bytes": "binary",
+    "normalize_file": "binary",
+    "cached": "cache",
+    "contains_arabic_digits": "core",
+    "contains_persian_digits": "core",
+    "convert_ar_characters": "core",
+    "convert_ar_numbers": "core",
+    "convert_en_characters": "core",
+    "convert_en_numbers": "core",
+    "convert_fa_numbers": "core",
+    "convert_fa_spaces": "core",
+    "count_persian_chars": "core",
+    "decode_url": "core",
+    "format_number": "core",
+    "is_persian_text": "core",
+    "normalize_persian": "core",
+    "parse_number": "core",
+    "persian_ratio": "core",
+    "remove_arabic_diacritics": "core",
+    "script_profile": "core",
+    # Deprecated helpers are still importable for backward compatibility
+    "arToPersianChar": "deprecation",
+    "arToPersianNumb": "deprecation",
+    "enToPersianChar": "deprecation",
+    "enToPersianNumb": "deprecation",
+    "IncrementalNormalizer": "incremental",
+    "Instrumentation": "instrumentation",
+    "fix_keyboard_layout": "keyboard",
+    "Normalizer": "normalizer",
+    "number_to_words": "number_words",
+    "words_to_number": "number_words",
+    "normalize_parallel": "parallel",
+    "normalize_threaded": "parallel",
+    "compile_mappings": "registry",
+    "register_mapping": "registry",
+    "unregister_mapping": "registry",
+    "fold_for_search": "search",
+    "normalize_stream": "stream",
+    "tokenize": "tokenizer",
+    "tokenize_array": "tokenizer",
+    "tokenize_normalized": "tokenizer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` and cache the attribute."""
+    try:
+        module = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
+
+
 __all__ = [
+    "Alignment",
+    "ByteTranslator",
+    "IncrementalNormalizer",
+    "Instrumentation",
+    "Normalizer",
     "__version__",
+    "cached",
+    "compile_mappings",
     "contains_arabic_digits",
     "contains_persian_digits",
     "convert_ar_characters",
+    "convert_ar_characters_many",
     "convert_ar_numbers",
+    "convert_ar_numbers_many",
     "convert_en_characters",
+    "convert_en_characters_many",
     "convert_en_numbers",
+    "convert_en_numbers_many",
     "convert_fa_numbers",
+    "convert_fa_numbers_many",
     "convert_fa_spaces",
+    "convert_fa_spaces_many",
+    "count_persian_chars",
     "decode_url",
+    "fix_keyboard_layout",
+    "fold_for_search",
+    "fold_for_search_many",
+    "format_number",
+    "format_number_many",
     "is_persian_text",
+    "normalize_bytes",
+    "normalize_file",
+    "normalize_many",
+    "normalize_parallel",
     "normalize_persian",
+    "normalize_stream",
+    "normalize_threaded",
+    "number_to_words",
+    "number_to_words_many",
+    "parse_number",
+    "parse_number_many",
+    "persian_ratio",
+    "register_mapping",
     "remove_arabic_diacritics",
+    "script_profile",
+    "tokenize",
+    "tokenize_array",
+    "tokenize_normalized",
+    "unregister_mapping",
+    "words_to_number",
+    "words_to_number_many",
 ]
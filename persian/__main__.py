@@ -0,0 +1,10 @@
+"""Allow ``python -m persian`` to run the normalization CLI."""
+
+from __future__ import annotations
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""Pure-Python conversion kernels.
+
+``persian._speedups`` implements the same functions in C; ``persian.core``
+imports that extension when it was built and falls back to this module
+otherwise. Both must return equal results for every input.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Mapping, Sequence
+from functools import cache, partial
+from operator import methodcaller
+
+
+def translator(table: Mapping[int, str | int | None]) -> Callable[[str], str]:
+    """Return a function applying ``str.translate`` with ``table``."""
+    return methodcaller("translate", table)
+
+
+def replacer(pairs: Sequence[tuple[str, str]]) -> Callable[[str], str]:
+    """Return a function replacing every key of ``pairs`` in a single scan.
+
+    At each position the first key in ``pairs`` that matches wins, so keys
+    must be given longest first for leftmost-longest replacement.
+    """
+    lookup = dict(pairs)
+    pattern = re.compile("|".join(re.escape(old) for old, _ in pairs))
+
+    def substitute(match: re.Match[str]) -> str:
+        return lookup[match.group()]
+
+    return partial(pattern.sub, substitute)
+
+
+@cache
+def _range_pattern(first: int, last: int, run: bool) -> re.Pattern[str]:
+    return re.compile(f"[{re.escape(chr(first))}-{re.escape(chr(last))}]{'+' if run else ''}")
+
+
+def has_range(text: str, first: int, last: int) -> bool:
+    """Whether ``text`` contains a character from ``first`` to ``last``."""
+    if first > 0x7F and text.isascii():
+        return False
+    return _range_pattern(first, last, False).search(text) is not None
+
+
+def count_range(text: str, first: int, last: int) -> int:
+    """Number of characters of ``text`` from ``first`` to ``last``."""
+    if first > 0x7F and text.isascii():
+        return 0
+    return sum(map(len, _range_pattern(first, last, True).findall(text)))
+
+
+__all__ = ["count_range", "has_range", "replacer", "translator"]
@@ -0,0 +1,795 @@
+"""Frozen translation table of search fold version 1.
+
+The table was generated once from what ``persian.search`` composed for the
+first fold: presentation forms, Arabic letters, letter variants, diacritics,
+digits and invisible characters. It is never regenerated, because the keys in
+existing indexes depend on every entry, whatever later constants or a newer
+``unicodedata`` would give. A different fold is a new version in its own module.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+FOLD_TABLE: Final[dict[int, str]] = {
+    0x00AD: "",
+    0x0622: "\u0627",
+    0x0623: "\u0627",
+    0x0625: "\u0627",
+    0x0629: "\u0647",
+    0x0640: "",
+    0x0643: "\u06a9",
+    0x0649: "\u06cc",
+    0x064A: "\u06cc",
+    0x064B: "",
+    0x064C: "",
+    0x064D: "",
+    0x064E: "",
+    0x064F: "",
+    0x0650: "",
+    0x0651: "",
+    0x0652: "",
+    0x0660: "0",
+    0x0661: "1",
+    0x0662: "2",
+    0x0663: "3",
+    0x0664: "4",
+    0x0665: "5",
+    0x0666: "6",
+    0x0667: "7",
+    0x0668: "8",
+    0x0669: "9",
+    0x0670: "",
+    0x0671: "\u0627",
+    0x06C0: "\u0647",
+    0x06F0: "0",
+    0x06F1: "1",
+    0x06F2: "2",
+    0x06F3: "3",
+    0x06F4: "4",
+    0x06F5: "5",
+    0x06F6: "6",
+    0x06F7: "7",
+    0x06F8: "8",
+    0x06F9: "9",
+    0x200B: " ",
+    0x200C: " ",
+    0x200D: "",
+    0x200E: "",
+    0x200F: "",
+    0xFB50: "\u0627",
+    0xFB51: "\u0627",
+    0xFB52: "\u067b",
+    0xFB53: "\u067b",
+    0xFB54: "\u067b",
+    0xFB55: "\u067b",
+    0xFB56: "\u067e",
+    0xFB57: "\u067e",
+    0xFB58: "\u067e",
+    0xFB59: "\u067e",
+    0xFB5A: "\u0680",
+    0xFB5B: "\u0680",
+    0xFB5C: "\u0680",
+    0xFB5D: "\u0680",
+    0xFB5E: "\u067a",
+    0xFB5F: "\u067a",
+    0xFB60: "\u067a",
+    0xFB61: "\u067a",
+    0xFB62: "\u067f",
+    0xFB63: "\u067f",
+    0xFB64: "\u067f",
+    0xFB65: "\u067f",
+    0xFB66: "\u0679",
+    0xFB67: "\u0679",
+    0xFB68: "\u0679",
+    0xFB69: "\u0679",
+    0xFB6A: "\u06a4",
+    0xFB6B: "\u06a4",
+    0xFB6C: "\u06a4",
+    0xFB6D: "\u06a4",
+    0xFB6E: "\u06a6",
+    0xFB6F: "\u06a6",
+    0xFB70: "\u06a6",
+    0xFB71: "\u06a6",
+    0xFB72: "\u0684",
+    0xFB73: "\u0684",
+    0xFB74: "\u0684",
+    0xFB75: "\u0684",
+    0xFB76: "\u0683",
+    0xFB77: "\u0683",
+    0xFB78: "\u0683",
+    0xFB79: "\u0683",
+    0xFB7A: "\u0686",
+    0xFB7B: "\u0686",
+    0xFB7C: "\u0686",
+    0xFB7D: "\u0686",
+    0xFB7E: "\u0687",
+    0xFB7F: "\u0687",
+    0xFB80: "\u0687",
+    0xFB81: "\u0687",
+    0xFB82: "\u068d",
+    0xFB83: "\u068d",
+    0xFB84: "\u068c",
+    0xFB85: "\u068c",
+    0xFB86: "\u068e",
+    0xFB87: "\u068e",
+    0xFB88: "\u0688",
+    0xFB89: "\u0688",
+    0xFB8A: "\u0698",
+    0xFB8B: "\u0698",
+    0xFB8C: "\u0691",
+    0xFB8D: "\u0691",
+    0xFB8E: "\u06a9",
+    0xFB8F: "\u06a9",
+    0xFB90: "\u06a9",
+    0xFB91: "\u06a9",
+    0xFB92: "\u06af",
+    0xFB93: "\u06af",
+    0xFB94: "\u06af",
+    0xFB95: "\u06af",
+    0xFB96: "\u06b3",
+    0xFB97: "\u06b3",
+    0xFB98: "\u06b3",
+    0xFB99: "\u06b3",
+    0xFB9A: "\u06b1",
+    0xFB9B: "\u06b1",
+    0xFB9C: "\u06b1",
+    0xFB9D: "\u06b1",
+    0xFB9E: "\u06ba",
+    0xFB9F: "\u06ba",
+    0xFBA0: "\u06bb",
+    0xFBA1: "\u06bb",
+    0xFBA2: "\u06bb",
+    0xFBA3: "\u06bb",
+    0xFBA4: "\u0647",
+    0xFBA5: "\u0647",
+    0xFBA6: "\u06c1",
+    0xFBA7: "\u06c1",
+    0xFBA8: "\u06c1",
+    0xFBA9: "\u06c1",
+    0xFBAA: "\u06be",
+    0xFBAB: "\u06be",
+    0xFBAC: "\u06be",
+    0xFBAD: "\u06be",
+    0xFBAE: "\u06d2",
+    0xFBAF: "\u06d2",
+    0xFBB0: "\u06d3",
+    0xFBB1: "\u06d3",
+    0xFBD3: "\u06ad",
+    0xFBD4: "\u06ad",
+    0xFBD5: "\u06ad",
+    0xFBD6: "\u06ad",
+    0xFBD7: "\u06c7",
+    0xFBD8: "\u06c7",
+    0xFBD9: "\u06c6",
+    0xFBDA: "\u06c6",
+    0xFBDB: "\u06c8",
+    0xFBDC: "\u06c8",
+    0xFBDD: "\u06c7\u0674",
+    0xFBDE: "\u06cb",
+    0xFBDF: "\u06cb",
+    0xFBE0: "\u06c5",
+    0xFBE1: "\u06c5",
+    0xFBE2: "\u06c9",
+    0xFBE3: "\u06c9",
+    0xFBE4: "\u06d0",
+    0xFBE5: "\u06d0",
+    0xFBE6: "\u06d0",
+    0xFBE7: "\u06d0",
+    0xFBE8: "\u06cc",
+    0xFBE9: "\u06cc",
+    0xFBEA: "\u0626\u0627",
+    0xFBEB: "\u0626\u0627",
+    0xFBEC: "\u0626\u06d5",
+    0xFBED: "\u0626\u06d5",
+    0xFBEE: "\u0626\u0648",
+    0xFBEF: "\u0626\u0648",
+    0xFBF0: "\u0626\u06c7",
+    0xFBF1: "\u0626\u06c7",
+    0xFBF2: "\u0626\u06c6",
+    0xFBF3: "\u0626\u06c6",
+    0xFBF4: "\u0626\u06c8",
+    0xFBF5: "\u0626\u06c8",
+    0xFBF6: "\u0626\u06d0",
+    0xFBF7: "\u0626\u06d0",
+    0xFBF8: "\u0626\u06d0",
+    0xFBF9: "\u0626\u06cc",
+    0xFBFA: "\u0626\u06cc",
+    0xFBFB: "\u0626\u06cc",
+    0xFBFC: "\u06cc",
+    0xFBFD: "\u06cc",
+    0xFBFE: "\u06cc",
+    0xFBFF: "\u06cc",
+    0xFC00: "\u0626\u062c",
+    0xFC01: "\u0626\u062d",
+    0xFC02: "\u0626\u0645",
+    0xFC03: "\u0626\u06cc",
+    0xFC04: "\u0626\u06cc",
+    0xFC05: "\u0628\u062c",
+    0xFC06: "\u0628\u062d",
+    0xFC07: "\u0628\u062e",
+    0xFC08: "\u0628\u0645",
+    0xFC09: "\u0628\u06cc",
+    0xFC0A: "\u0628\u06cc",
+    0xFC0B: "\u062a\u062c",
+    0xFC0C: "\u062a\u062d",
+    0xFC0D: "\u062a\u062e",
+    0xFC0E: "\u062a\u0645",
+    0xFC0F: "\u062a\u06cc",
+    0xFC10: "\u062a\u06cc",
+    0xFC11: "\u062b\u062c",
+    0xFC12: "\u062b\u0645",
+    0xFC13: "\u062b\u06cc",
+    0xFC14: "\u062b\u06cc",
+    0xFC15: "\u062c\u062d",
+    0xFC16: "\u062c\u0645",
+    0xFC17: "\u062d\u062c",
+    0xFC18: "\u062d\u0645",
+    0xFC19: "\u062e\u062c",
+    0xFC1A: "\u062e\u062d",
+    0xFC1B: "\u062e\u0645",
+    0xFC1C: "\u0633\u062c",
+    0xFC1D: "\u0633\u062d",
+    0xFC1E: "\u0633\u062e",
+    0xFC1F: "\u0633\u0645",
+    0xFC20: "\u0635\u062d",
+    0xFC21: "\u0635\u0645",
+    0xFC22: "\u0636\u062c",
+    0xFC23: "\u0636\u062d",
+    0xFC24: "\u0636\u062e",
+    0xFC25: "\u0636\u0645",
+    0xFC26: "\u0637\u062d",
+    0xFC27: "\u0637\u0645",
+    0xFC28: "\u0638\u0645",
+    0xFC29: "\u0639\u062c",
+    0xFC2A: "\u0639\u0645",
+    0xFC2B: "\u063a\u062c",
+    0xFC2C: "\u063a\u0645",
+    0xFC2D: "\u0641\u062c",
+    0xFC2E: "\u0641\u062d",
+    0xFC2F: "\u0641\u062e",
+    0xFC30: "\u0641\u0645",
+    0xFC31: "\u0641\u06cc",
+    0xFC32: "\u0641\u06cc",
+    0xFC33: "\u0642\u062d",
+    0xFC34: "\u0642\u0645",
+    0xFC35: "\u0642\u06cc",
+    0xFC36: "\u0642\u06cc",
+    0xFC37: "\u06a9\u0627",
+    0xFC38: "\u06a9\u062c",
+    0xFC39: "\u06a9\u062d",
+    0xFC3A: "\u06a9\u062e",
+    0xFC3B: "\u06a9\u0644",
+    0xFC3C: "\u06a9\u0645",
+    0xFC3D: "\u06a9\u06cc",
+    0xFC3E: "\u06a9\u06cc",
+    0xFC3F: "\u0644\u062c",
+    0xFC40: "\u0644\u062d",
+    0xFC41: "\u0644\u062e",
+    0xFC42: "\u0644\u0645",
+    0xFC43: "\u0644\u06cc",
+    0xFC44: "\u0644\u06cc",
+    0xFC45: "\u0645\u062c",
+    0xFC46: "\u0645\u062d",
+    0xFC47: "\u0645\u062e",
+    0xFC48: "\u0645\u0645",
+    0xFC49: "\u0645\u06cc",
+    0xFC4A: "\u0645\u06cc",
+    0xFC4B: "\u0646\u062c",
+    0xFC4C: "\u0646\u062d",
+    0xFC4D: "\u0646\u062e",
+    0xFC4E: "\u0646\u0645",
+    0xFC4F: "\u0646\u06cc",
+    0xFC50: "\u0646\u06cc",
+    0xFC51: "\u0647\u062c",
+    0xFC52: "\u0647\u0645",
+    0xFC53: "\u0647\u06cc",
+    0xFC54: "\u0647\u06cc",
+    0xFC55: "\u06cc\u062c",
+    0xFC56: "\u06cc\u062d",
+    0xFC57: "\u06cc\u062e",
+    0xFC58: "\u06cc\u0645",
+    0xFC59: "\u06cc\u06cc",
+    0xFC5A: "\u06cc\u06cc",
+    0xFC5B: "\u0630",
+    0xFC5C: "\u0631",
+    0xFC5D: "\u06cc",
+    0xFC5E: "",
+    0xFC5F: "",
+    0xFC60: "",
+    0xFC61: "",
+    0xFC62: "",
+    0xFC63: "",
+    0xFC64: "\u0626\u0631",
+    0xFC65: "\u0626\u0632",
+    0xFC66: "\u0626\u0645",
+    0xFC67: "\u0626\u0646",
+    0xFC68: "\u0626\u06cc",
+    0xFC69: "\u0626\u06cc",
+    0xFC6A: "\u0628\u0631",
+    0xFC6B: "\u0628\u0632",
+    0xFC6C: "\u0628\u0645",
+    0xFC6D: "\u0628\u0646",
+    0xFC6E: "\u0628\u06cc",
+    0xFC6F: "\u0628\u06cc",
+    0xFC70: "\u062a\u0631",
+    0xFC71: "\u062a\u0632",
+    0xFC72: "\u062a\u0645",
+    0xFC73: "\u062a\u0646",
+    0xFC74: "\u062a\u06cc",
+    0xFC75: "\u062a\u06cc",
+    0xFC76: "\u062b\u0631",
+    0xFC77: "\u062b\u0632",
+    0xFC78: "\u062b\u0645",
+    0xFC79: "\u062b\u0646",
+    0xFC7A: "\u062b\u06cc",
+    0xFC7B: "\u062b\u06cc",
+    0xFC7C: "\u0641\u06cc",
+    0xFC7D: "\u0641\u06cc",
+    0xFC7E: "\u0642\u06cc",
+    0xFC7F: "\u0642\u06cc",
+    0xFC80: "\u06a9\u0627",
+    0xFC81: "\u06a9\u0644",
+    0xFC82: "\u06a9\u0645",
+    0xFC83: "\u06a9\u06cc",
+    0xFC84: "\u06a9\u06cc",
+    0xFC85: "\u0644\u0645",
+    0xFC86: "\u0644\u06cc",
+    0xFC87: "\u0644\u06cc",
+    0xFC88: "\u0645\u0627",
+    0xFC89: "\u0645\u0645",
+    0xFC8A: "\u0646\u0631",
+    0xFC8B: "\u0646\u0632",
+    0xFC8C: "\u0646\u0645",
+    0xFC8D: "\u0646\u0646",
+    0xFC8E: "\u0646\u06cc",
+    0xFC8F: "\u0646\u06cc",
+    0xFC90: "\u06cc",
+    0xFC91: "\u06cc\u0631",
+    0xFC92: "\u06cc\u0632",
+    0xFC93: "\u06cc\u0645",
+    0xFC94: "\u06cc\u0646",
+    0xFC95: "\u06cc\u06cc",
+    0xFC96: "\u06cc\u06cc",
+    0xFC97: "\u0626\u062c",
+    0xFC98: "\u0626\u062d",
+    0xFC99: "\u0626\u062e",
+    0xFC9A: "\u0626\u0645",
+    0xFC9B: "\u0626\u0647",
+    0xFC9C: "\u0628\u062c",
+    0xFC9D: "\u0628\u062d",
+    0xFC9E: "\u0628\u062e",
+    0xFC9F: "\u0628\u0645",
+    0xFCA0: "\u0628\u0647",
+    0xFCA1: "\u062a\u062c",
+    0xFCA2: "\u062a\u062d",
+    0xFCA3: "\u062a\u062e",
+    0xFCA4: "\u062a\u0645",
+    0xFCA5: "\u062a\u0647",
+    0xFCA6: "\u062b\u0645",
+    0xFCA7: "\u062c\u062d",
+    0xFCA8: "\u062c\u0645",
+    0xFCA9: "\u062d\u062c",
+    0xFCAA: "\u062d\u0645",
+    0xFCAB: "\u062e\u062c",
+    0xFCAC: "\u062e\u0645",
+    0xFCAD: "\u0633\u062c",
+    0xFCAE: "\u0633\u062d",
+    0xFCAF: "\u0633\u062e",
+    0xFCB0: "\u0633\u0645",
+    0xFCB1: "\u0635\u062d",
+    0xFCB2: "\u0635\u062e",
+    0xFCB3: "\u0635\u0645",
+    0xFCB4: "\u0636\u062c",
+    0xFCB5: "\u0636\u062d",
+    0xFCB6: "\u0636\u062e",
+    0xFCB7: "\u0636\u0645",
+    0xFCB8: "\u0637\u062d",
+    0xFCB9: "\u0638\u0645",
+    0xFCBA: "\u0639\u062c",
+    0xFCBB: "\u0639\u0645",
+    0xFCBC: "\u063a\u062c",
+    0xFCBD: "\u063a\u0645",
+    0xFCBE: "\u0641\u062c",
+    0xFCBF: "\u0641\u062d",
+    0xFCC0: "\u0641\u062e",
+    0xFCC1: "\u0641\u0645",
+    0xFCC2: "\u0642\u062d",
+    0xFCC3: "\u0642\u0645",
+    0xFCC4: "\u06a9\u062c",
+    0xFCC5: "\u06a9\u062d",
+    0xFCC6: "\u06a9\u062e",
+    0xFCC7: "\u06a9\u0644",
+    0xFCC8: "\u06a9\u0645",
+    0xFCC9: "\u0644\u062c",
+    0xFCCA: "\u0644\u062d",
+    0xFCCB: "\u0644\u062e",
+    0xFCCC: "\u0644\u0645",
+    0xFCCD: "\u0644\u0647",
+    0xFCCE: "\u0645\u062c",
+    0xFCCF: "\u0645\u062d",
+    0xFCD0: "\u0645\u062e",
+    0xFCD1: "\u0645\u0645",
+    0xFCD2: "\u0646\u062c",
+    0xFCD3: "\u0646\u062d",
+    0xFCD4: "\u0646\u062e",
+    0xFCD5: "\u0646\u0645",
+    0xFCD6: "\u0646\u0647",
+    0xFCD7: "\u0647\u062c",
+    0xFCD8: "\u0647\u0645",
+    0xFCD9: "\u0647",
+    0xFCDA: "\u06cc\u062c",
+    0xFCDB: "\u06cc\u062d",
+    0xFCDC: "\u06cc\u062e",
+    0xFCDD: "\u06cc\u0645",
+    0xFCDE: "\u06cc\u0647",
+    0xFCDF: "\u0626\u0645",
+    0xFCE0: "\u0626\u0647",
+    0xFCE1: "\u0628\u0645",
+    0xFCE2: "\u0628\u0647",
+    0xFCE3: "\u062a\u0645",
+    0xFCE4: "\u062a\u0647",
+    0xFCE5: "\u062b\u0645",
+    0xFCE6: "\u062b\u0647",
+    0xFCE7: "\u0633\u0645",
+    0xFCE8: "\u0633\u0647",
+    0xFCE9: "\u0634\u0645",
+    0xFCEA: "\u0634\u0647",
+    0xFCEB: "\u06a9\u0644",
+    0xFCEC: "\u06a9\u0645",
+    0xFCED: "\u0644\u0645",
+    0xFCEE: "\u0646\u0645",
+    0xFCEF: "\u0646\u0647",
+    0xFCF0: "\u06cc\u0645",
+    0xFCF1: "\u06cc\u0647",
+    0xFCF2: "",
+    0xFCF3: "",
+    0xFCF4: "",
+    0xFCF5: "\u0637\u06cc",
+    0xFCF6: "\u0637\u06cc",
+    0xFCF7: "\u0639\u06cc",
+    0xFCF8: "\u0639\u06cc",
+    0xFCF9: "\u063a\u06cc",
+    0xFCFA: "\u063a\u06cc",
+    0xFCFB: "\u0633\u06cc",
+    0xFCFC: "\u0633\u06cc",
+    0xFCFD: "\u0634\u06cc",
+    0xFCFE: "\u0634\u06cc",
+    0xFCFF: "\u062d\u06cc",
+    0xFD00: "\u062d\u06cc",
+    0xFD01: "\u062c\u06cc",
+    0xFD02: "\u062c\u06cc",
+    0xFD03: "\u062e\u06cc",
+    0xFD04: "\u062e\u06cc",
+    0xFD05: "\u0635\u06cc",
+    0xFD06: "\u0635\u06cc",
+    0xFD07: "\u0636\u06cc",
+    0xFD08: "\u0636\u06cc",
+    0xFD09: "\u0634\u062c",
+    0xFD0A: "\u0634\u062d",
+    0xFD0B: "\u0634\u062e",
+    0xFD0C: "\u0634\u0645",
+    0xFD0D: "\u0634\u0631",
+    0xFD0E: "\u0633\u0631",
+    0xFD0F: "\u0635\u0631",
+    0xFD10: "\u0636\u0631",
+    0xFD11: "\u0637\u06cc",
+    0xFD12: "\u0637\u06cc",
+    0xFD13: "\u0639\u06cc",
+    0xFD14: "\u0639\u06cc",
+    0xFD15: "\u063a\u06cc",
+    0xFD16: "\u063a\u06cc",
+    0xFD17: "\u0633\u06cc",
+    0xFD18: "\u0633\u06cc",
+    0xFD19: "\u0634\u06cc",
+    0xFD1A: "\u0634\u06cc",
+    0xFD1B: "\u062d\u06cc",
+    0xFD1C: "\u062d\u06cc",
+    0xFD1D: "\u062c\u06cc",
+    0xFD1E: "\u062c\u06cc",
+    0xFD1F: "\u062e\u06cc",
+    0xFD20: "\u062e\u06cc",
+    0xFD21: "\u0635\u06cc",
+    0xFD22: "\u0635\u06cc",
+    0xFD23: "\u0636\u06cc",
+    0xFD24: "\u0636\u06cc",
+    0xFD25: "\u0634\u062c",
+    0xFD26: "\u0634\u062d",
+    0xFD27: "\u0634\u062e",
+    0xFD28: "\u0634\u0645",
+    0xFD29: "\u0634\u0631",
+    0xFD2A: "\u0633\u0631",
+    0xFD2B: "\u0635\u0631",
+    0xFD2C: "\u0636\u0631",
+    0xFD2D: "\u0634\u062c",
+    0xFD2E: "\u0634\u062d",
+    0xFD2F: "\u0634\u062e",
+    0xFD30: "\u0634\u0645",
+    0xFD31: "\u0633\u0647",
+    0xFD32: "\u0634\u0647",
+    0xFD33: "\u0637\u0645",
+    0xFD34: "\u0633\u062c",
+    0xFD35: "\u0633\u062d",
+    0xFD36: "\u0633\u062e",
+    0xFD37: "\u0634\u062c",
+    0xFD38: "\u0634\u062d",
+    0xFD39: "\u0634\u062e",
+    0xFD3A: "\u0637\u0645",
+    0xFD3B: "\u0638\u0645",
+    0xFD3C: "\u0627",
+    0xFD3D: "\u0627",
+    0xFD50: "\u062a\u062c\u0645",
+    0xFD51: "\u062a\u062d\u062c",
+    0xFD52: "\u062a\u062d\u062c",
+    0xFD53: "\u062a\u062d\u0645",
+    0xFD54: "\u062a\u062e\u0645",
+    0xFD55: "\u062a\u0645\u062c",
+    0xFD56: "\u062a\u0645\u062d",
+    0xFD57: "\u062a\u0645\u062e",
+    0xFD58: "\u062c\u0645\u062d",
+    0xFD59: "\u062c\u0645\u062d",
+    0xFD5A: "\u062d\u0645\u06cc",
+    0xFD5B: "\u062d\u0645\u06cc",
+    0xFD5C: "\u0633\u062d\u062c",
+    0xFD5D: "\u0633\u062c\u062d",
+    0xFD5E: "\u0633\u062c\u06cc",
+    0xFD5F: "\u0633\u0645\u062d",
+    0xFD60: "\u0633\u0645\u062d",
+    0xFD61: "\u0633\u0645\u062c",
+    0xFD62: "\u0633\u0645\u0645",
+    0xFD63: "\u0633\u0645\u0645",
+    0xFD64: "\u0635\u062d\u062d",
+    0xFD65: "\u0635\u062d\u062d",
+    0xFD66: "\u0635\u0645\u0645",
+    0xFD67: "\u0634\u062d\u0645",
+    0xFD68: "\u0634\u062d\u0645",
+    0xFD69: "\u0634\u062c\u06cc",
+    0xFD6A: "\u0634\u0645\u062e",
+    0xFD6B: "\u0634\u0645\u062e",
+    0xFD6C: "\u0634\u0645\u0645",
+    0xFD6D: "\u0634\u0645\u0645",
+    0xFD6E: "\u0636\u062d\u06cc",
+    0xFD6F: "\u0636\u062e\u0645",
+    0xFD70: "\u0636\u062e\u0645",
+    0xFD71: "\u0637\u0645\u062d",
+    0xFD72: "\u0637\u0645\u062d",
+    0xFD73: "\u0637\u0645\u0645",
+    0xFD74: "\u0637\u0645\u06cc",
+    0xFD75: "\u0639\u062c\u0645",
+    0xFD76: "\u0639\u0645\u0645",
+    0xFD77: "\u0639\u0645\u0645",
+    0xFD78: "\u0639\u0645\u06cc",
+    0xFD79: "\u063a\u0645\u0645",
+    0xFD7A: "\u063a\u0645\u06cc",
+    0xFD7B: "\u063a\u0645\u06cc",
+    0xFD7C: "\u0641\u062e\u0645",
+    0xFD7D: "\u0641\u062e\u0645",
+    0xFD7E: "\u0642\u0645\u062d",
+    0xFD7F: "\u0642\u0645\u0645",
+    0xFD80: "\u0644\u062d\u0645",
+    0xFD81: "\u0644\u062d\u06cc",
+    0xFD82: "\u0644\u062d\u06cc",
+    0xFD83: "\u0644\u062c\u062c",
+    0xFD84: "\u0644\u062c\u062c",
+    0xFD85: "\u0644\u062e\u0645",
+    0xFD86: "\u0644\u062e\u0645",
+    0xFD87: "\u0644\u0645\u062d",
+    0xFD88: "\u0644\u0645\u062d",
+    0xFD89: "\u0645\u062d\u062c",
+    0xFD8A: "\u0645\u062d\u0645",
+    0xFD8B: "\u0645\u062d\u06cc",
+    0xFD8C: "\u0645\u062c\u062d",
+    0xFD8D: "\u0645\u062c\u0645",
+    0xFD8E: "\u0645\u062e\u062c",
+    0xFD8F: "\u0645\u062e\u0645",
+    0xFD92: "\u0645\u062c\u062e",
+    0xFD93: "\u0647\u0645\u062c",
+    0xFD94: "\u0647\u0645\u0645",
+    0xFD95: "\u0646\u062d\u0645",
+    0xFD96: "\u0646\u062d\u06cc",
+    0xFD97: "\u0646\u062c\u0645",
+    0xFD98: "\u0646\u062c\u0645",
+    0xFD99: "\u0646\u062c\u06cc",
+    0xFD9A: "\u0646\u0645\u06cc",
+    0xFD9B: "\u0646\u0645\u06cc",
+    0xFD9C: "\u06cc\u0645\u0645",
+    0xFD9D: "\u06cc\u0645\u0645",
+    0xFD9E: "\u0628\u062e\u06cc",
+    0xFD9F: "\u062a\u062c\u06cc",
+    0xFDA0: "\u062a\u062c\u06cc",
+    0xFDA1: "\u062a\u062e\u06cc",
+    0xFDA2: "\u062a\u062e\u06cc",
+    0xFDA3: "\u062a\u0645\u06cc",
+    0xFDA4: "\u062a\u0645\u06cc",
+    0xFDA5: "\u062c\u0645\u06cc",
+    0xFDA6: "\u062c\u062d\u06cc",
+    0xFDA7: "\u062c\u0645\u06cc",
+    0xFDA8: "\u0633\u062e\u06cc",
+    0xFDA9: "\u0635\u062d\u06cc",
+    0xFDAA: "\u0634\u062d\u06cc",
+    0xFDAB: "\u0636\u062d\u06cc",
+    0xFDAC: "\u0644\u062c\u06cc",
+    0xFDAD: "\u0644\u0645\u06cc",
+    0xFDAE: "\u06cc\u062d\u06cc",
+    0xFDAF: "\u06cc\u062c\u06cc",
+    0xFDB0: "\u06cc\u0645\u06cc",
+    0xFDB1: "\u0645\u0645\u06cc",
+    0xFDB2: "\u0642\u0645\u06cc",
+    0xFDB3: "\u0646\u062d\u06cc",
+    0xFDB4: "\u0642\u0645\u062d",
+    0xFDB5: "\u0644\u062d\u0645",
+    0xFDB6: "\u0639\u0645\u06cc",
+    0xFDB7: "\u06a9\u0645\u06cc",
+    0xFDB8: "\u0646\u062c\u062d",
+    0xFDB9: "\u0645\u062e\u06cc",
+    0xFDBA: "\u0644\u062c\u0645",
+    0xFDBB: "\u06a9\u0645\u0645",
+    0xFDBC: "\u0644\u062c\u0645",
+    0xFDBD: "\u0646\u062c\u062d",
+    0xFDBE: "\u062c\u062d\u06cc",
+    0xFDBF: "\u062d\u062c\u06cc",
+    0xFDC0: "\u0645\u062c\u06cc",
+    0xFDC1: "\u0641\u0645\u06cc",
+    0xFDC2: "\u0628\u062d\u06cc",
+    0xFDC3: "\u06a9\u0645\u0645",
+    0xFDC4: "\u0639\u062c\u0645",
+    0xFDC5: "\u0635\u0645\u0645",
+    0xFDC6: "\u0633\u062e\u06cc",
+    0xFDC7: "\u0646\u062c\u06cc",
+    0xFDF0: "\u0635\u0644\u06d2",
+    0xFDF1: "\u0642\u0644\u06d2",
+    0xFDF2: "\u0627\u0644\u0644\u0647",
+    0xFDF3: "\u0627\u06a9\u0628\u0631",
+    0xFDF4: "\u0645\u062d\u0645\u062f",
+    0xFDF5: "\u0635\u0644\u0639\u0645",
+    0xFDF6: "\u0631\u0633\u0648\u0644",
+    0xFDF7: "\u0639\u0644\u06cc\u0647",
+    0xFDF8: "\u0648\u0633\u0644\u0645",
+    0xFDF9: "\u0635\u0644\u06cc",
+    0xFDFA: (
+        "\u0635\u0644\u06cc \u0627\u0644\u0644\u0647 "
+        "\u0639\u0644\u06cc\u0647 \u0648\u0633\u0644\u0645"
+    ),
+    0xFDFB: "\u062c\u0644 \u062c\u0644\u0627\u0644\u0647",
+    0xFDFC: "\u0631\u06cc\u0627\u0644",
+    0xFE70: "",
+    0xFE71: "",
+    0xFE72: "",
+    0xFE74: "",
+    0xFE76: "",
+    0xFE77: "",
+    0xFE78: "",
+    0xFE79: "",
+    0xFE7A: "",
+    0xFE7B: "",
+    0xFE7C: "",
+    0xFE7D: "",
+    0xFE7E: "",
+    0xFE7F: "",
+    0xFE80: "\u0621",
+    0xFE81: "\u0627",
+    0xFE82: "\u0627",
+    0xFE83: "\u0627",
+    0xFE84: "\u0627",
+    0xFE85: "\u0624",
+    0xFE86: "\u0624",
+    0xFE87: "\u0627",
+    0xFE88: "\u0627",
+    0xFE89: "\u0626",
+    0xFE8A: "\u0626",
+    0xFE8B: "\u0626",
+    0xFE8C: "\u0626",
+    0xFE8D: "\u0627",
+    0xFE8E: "\u0627",
+    0xFE8F: "\u0628",
+    0xFE90: "\u0628",
+    0xFE91: "\u0628",
+    0xFE92: "\u0628",
+    0xFE93: "\u0647",
+    0xFE94: "\u0647",
+    0xFE95: "\u062a",
+    0xFE96: "\u062a",
+    0xFE97: "\u062a",
+    0xFE98: "\u062a",
+    0xFE99: "\u062b",
+    0xFE9A: "\u062b",
+    0xFE9B: "\u062b",
+    0xFE9C: "\u062b",
+    0xFE9D: "\u062c",
+    0xFE9E: "\u062c",
+    0xFE9F: "\u062c",
+    0xFEA0: "\u062c",
+    0xFEA1: "\u062d",
+    0xFEA2: "\u062d",
+    0xFEA3: "\u062d",
+    0xFEA4: "\u062d",
+    0xFEA5: "\u062e",
+    0xFEA6: "\u062e",
+    0xFEA7: "\u062e",
+    0xFEA8: "\u062e",
+    0xFEA9: "\u062f",
+    0xFEAA: "\u062f",
+    0xFEAB: "\u0630",
+    0xFEAC: "\u0630",
+    0xFEAD: "\u0631",
+    0xFEAE: "\u0631",
+    0xFEAF: "\u0632",
+    0xFEB0: "\u0632",
+    0xFEB1: "\u0633",
+    0xFEB2: "\u0633",
+    0xFEB3: "\u0633",
+    0xFEB4: "\u0633",
+    0xFEB5: "\u0634",
+    0xFEB6: "\u0634",
+    0xFEB7: "\u0634",
+    0xFEB8: "\u0634",
+    0xFEB9: "\u0635",
+    0xFEBA: "\u0635",
+    0xFEBB: "\u0635",
+    0xFEBC: "\u0635",
+    0xFEBD: "\u0636",
+    0xFEBE: "\u0636",
+    0xFEBF: "\u0636",
+    0xFEC0: "\u0636",
+    0xFEC1: "\u0637",
+    0xFEC2: "\u0637",
+    0xFEC3: "\u0637",
+    0xFEC4: "\u0637",
+    0xFEC5: "\u0638",
+    0xFEC6: "\u0638",
+    0xFEC7: "\u0638",
+    0xFEC8: "\u0638",
+    0xFEC9: "\u0639",
+    0xFECA: "\u0639",
+    0xFECB: "\u0639",
+    0xFECC: "\u0639",
+    0xFECD: "\u063a",
+    0xFECE: "\u063a",
+    0xFECF: "\u063a",
+    0xFED0: "\u063a",
+    0xFED1: "\u0641",
+    0xFED2: "\u0641",
+    0xFED3: "\u0641",
+    0xFED4: "\u0641",
+    0xFED5: "\u0642",
+    0xFED6: "\u0642",
+    0xFED7: "\u0642",
+    0xFED8: "\u0642",
+    0xFED9: "\u06a9",
+    0xFEDA: "\u06a9",
+    0xFEDB: "\u06a9",
+    0xFEDC: "\u06a9",
+    0xFEDD: "\u0644",
+    0xFEDE: "\u0644",
+    0xFEDF: "\u0644",
+    0xFEE0: "\u0644",
+    0xFEE1: "\u0645",
+    0xFEE2: "\u0645",
+    0xFEE3: "\u0645",
+    0xFEE4: "\u0645",
+    0xFEE5: "\u0646",
+    0xFEE6: "\u0646",
+    0xFEE7: "\u0646",
+    0xFEE8: "\u0646",
+    0xFEE9: "\u0647",
+    0xFEEA: "\u0647",
+    0xFEEB: "\u0647",
+    0xFEEC: "\u0647",
+    0xFEED: "\u0648",
+    0xFEEE: "\u0648",
+    0xFEEF: "\u06cc",
+    0xFEF0: "\u06cc",
+    0xFEF1: "\u06cc",
+    0xFEF2: "\u06cc",
+    0xFEF3: "\u06cc",
+    0xFEF4: "\u06cc",
+    0xFEF5: "\u0644\u0627",
+    0xFEF6: "\u0644\u0627",
+    0xFEF7: "\u0644\u0627",
+    0xFEF8: "\u0644\u0627",
+    0xFEF9: "\u0644\u0627",
+    0xFEFA: "\u0644\u0627",
+    0xFEFB: "\u0644\u0627",
+    0xFEFC: "\u0644\u0627",
+    0xFEFF: "",
+}
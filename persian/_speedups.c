@@ -0,0 +1,686 @@
+/*
+ * C implementations of the conversion kernels in persian/_native.py.
+ *
+ * Each kernel makes one native loop over the string's internal buffer. The
+ * results must equal those of the pure-Python kernels for every input; the
+ * differential tests in tests/test_speedups.py check that. Objects built
+ * here are immutable after construction, so they may be shared by threads
+ * and the module does not need the GIL.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+/* Translation entries: a code point below 0x110000 is a one-character
+   replacement; the values below mark the other cases. */
+#define ENTRY_UNMAPPED 0xFFFFFFFFu
+#define ENTRY_DELETE 0xFFFFFFFEu
+/* The low bits index the strings of other lengths. */
+#define ENTRY_STRING 0x80000000u
+
+#define PAGE_BITS 8
+#define PAGE_SIZE (1 << PAGE_BITS)
+#define PAGE_COUNT (0x10000 >> PAGE_BITS)
+
+/* Translator ---------------------------------------------------------- */
+
+typedef struct {
+    PyObject_HEAD
+    vectorcallfunc vectorcall;
+    /* Entries of the BMP, in pages of 256 code points allocated on demand. */
+    uint32_t *pages[PAGE_COUNT];
+    /* Replacements that are not exactly one character long. */
+    PyObject *strings;
+    /* Replacements of code points outside the BMP, keyed by int, or NULL. */
+    PyObject *astral;
+} TranslatorObject;
+
+static PyTypeObject TranslatorType;
+static PyObject *translator_call(TranslatorObject *self, PyObject *const *args, size_t nargsf,
+                                 PyObject *kwnames);
+
+static void
+translator_dealloc(TranslatorObject *self)
+{
+    for (int page = 0; page < PAGE_COUNT; page++) {
+        PyMem_Free(self->pages[page]);
+    }
+    Py_XDECREF(self->strings);
+    Py_XDECREF(self->astral);
+    PyObject_Free(self);
+}
+
+/* Normalize a translation table value the way str.translate reads it. */
+static PyObject *
+translation_value(PyObject *value)
+{
+    if (value == Py_None) {
+        return PyUnicode_New(0, 0);
+    }
+    if (PyLong_Check(value)) {
+        long code = PyLong_AsLong(value);
+        if (code == -1 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (code < 0 || code > 0x10FFFF) {
+            PyErr_SetString(PyExc_ValueError, "character mapping must be in range(0x110000)");
+            return NULL;
+        }
+        return PyUnicode_FromOrdinal((int)code);
+    }
+    if (PyUnicode_Check(value)) {
+        return Py_NewRef(value);
+    }
+    PyErr_SetString(PyExc_TypeError, "character mapping must return integer, None or str");
+    return NULL;
+}
+
+static int
+translator_set(TranslatorObject *self, long code, PyObject *key, PyObject *replacement)
+{
+    if (code >= 0x10000) {
+        if (self->astral == NULL && (self->astral = PyDict_New()) == NULL) {
+            return -1;
+        }
+        return PyDict_SetItem(self->astral, key, replacement);
+    }
+    uint32_t **page = &self->pages[code >> PAGE_BITS];
+    if (*page == NULL) {
+        *page = PyMem_Malloc(PAGE_SIZE * sizeof(uint32_t));
+        if (*page == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        memset(*page, 0xFF, PAGE_SIZE * sizeof(uint32_t));
+    }
+    uint32_t entry;
+    Py_ssize_t length = PyUnicode_GET_LENGTH(replacement);
+    if (length == 1) {
+        entry = PyUnicode_READ_CHAR(replacement, 0);
+    }
+    else if (length == 0) {
+        entry = ENTRY_DELETE;
+    }
+    else {
+        entry = ENTRY_STRING | (uint32_t)PyList_GET_SIZE(self->strings);
+        if (PyList_Append(self->strings, replacement) < 0) {
+            return -1;
+        }
+    }
+    (*page)[code & (PAGE_SIZE - 1)] = entry;
+    return 0;
+}
+
+static PyObject *
+translator(PyObject *module, PyObject *table)
+{
+    if (!PyDict_Check(table)) {
+        PyErr_Format(PyExc_TypeError, "table must be a dict, got %.100s", Py_TYPE(table)->tp_name);
+        return NULL;
+    }
+    TranslatorObject *self = PyObject_New(TranslatorObject, &TranslatorType);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->vectorcall = (vectorcallfunc)translator_call;
+    memset(self->pages, 0, sizeof(self->pages));
+    self->astral = NULL;
+    self->strings = PyList_New(0);
+    if (self->strings == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    Py_ssize_t position = 0;
+    PyObject *key, *value;
+    while (PyDict_Next(table, &position, &key, &value)) {
+        if (!PyLong_Check(key)) {
+            PyErr_SetString(PyExc_TypeError, "table keys must be integers");
+            goto error;
+        }
+        long code = PyLong_AsLong(key);
+        if (code == -1 && PyErr_Occurred()) {
+            if (!PyErr_ExceptionMatches(PyExc_OverflowError)) {
+                goto error;
+            }
+            PyErr_Clear();
+            continue;
+        }
+        if (code < 0 || code > 0x10FFFF) {
+            /* str.translate never looks such keys up. */
+            continue;
+        }
+        PyObject *replacement = translation_value(value);
+        if (replacement == NULL) {
+            goto error;
+        }
+        int status = translator_set(self, code, key, replacement);
+        Py_DECREF(replacement);
+        if (status < 0) {
+            goto error;
+        }
+    }
+    return (PyObject *)self;
+
+error:
+    Py_DECREF(self);
+    return NULL;
+}
+
+static inline uint32_t
+translator_entry(const TranslatorObject *self, Py_UCS4 ch)
+{
+    const uint32_t *page = self->pages[ch >> PAGE_BITS];
+    return page == NULL ? ENTRY_UNMAPPED : page[ch & (PAGE_SIZE - 1)];
+}
+
+/* Borrowed replacement of an astral code point, NULL if it is unmapped or on error. */
+static PyObject *
+translator_astral(const TranslatorObject *self, Py_UCS4 ch)
+{
+    PyObject *key = PyLong_FromUnsignedLong(ch);
+    if (key == NULL) {
+        return NULL;
+    }
+    PyObject *replacement = PyDict_GetItemWithError(self->astral, key);
+    Py_DECREF(key);
+    return replacement;
+}
+
+/* Replacement string of ``ch`` if it has one of another length than one, else NULL
+   with ``*entry`` set to the single character, ENTRY_DELETE or ENTRY_UNMAPPED. */
+static inline PyObject *
+translator_lookup(const TranslatorObject *self, Py_UCS4 ch, uint32_t *entry)
+{
+    if (ch < 0x10000) {
+        *entry = translator_entry(self, ch);
+        if (*entry != ENTRY_UNMAPPED && *entry != ENTRY_DELETE && (*entry & ENTRY_STRING)) {
+            return PyList_GET_ITEM(self->strings, *entry & ~ENTRY_STRING);
+        }
+        return NULL;
+    }
+    *entry = ENTRY_UNMAPPED;
+    if (self->astral == NULL) {
+        return NULL;
+    }
+    PyObject *replacement = translator_astral(self, ch);
+    if (replacement != NULL && PyUnicode_GET_LENGTH(replacement) == 1) {
+        *entry = PyUnicode_READ_CHAR(replacement, 0);
+        return NULL;
+    }
+    if (replacement != NULL && PyUnicode_GET_LENGTH(replacement) == 0) {
+        *entry = ENTRY_DELETE;
+        return NULL;
+    }
+    return replacement;
+}
+
+/* The single str argument of a kernel call, or NULL with an exception set. */
+static PyObject *
+text_argument(PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    if (nargs != 1 || (kwnames != NULL && PyTuple_GET_SIZE(kwnames) != 0)) {
+        PyErr_Format(PyExc_TypeError, "expected one positional argument, got %zd", nargs);
+        return NULL;
+    }
+    if (!PyUnicode_Check(args[0])) {
+        PyErr_Format(PyExc_TypeError, "expected str, got %.100s", Py_TYPE(args[0])->tp_name);
+        return NULL;
+    }
+    return args[0];
+}
+
+/* The result of a kernel that changed nothing: ``text`` itself, or a plain str copy
+   of a str subclass, as str.translate and re.sub return. */
+static PyObject *
+unchanged_text(PyObject *text)
+{
+    if (PyUnicode_CheckExact(text)) {
+        return Py_NewRef(text);
+    }
+    return PyUnicode_FromObject(text);
+}
+
+static PyObject *
+translator_call(TranslatorObject *self, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    PyObject *text = text_argument(args, nargsf, kwnames);
+    if (text == NULL) {
+        return NULL;
+    }
+    int kind = PyUnicode_KIND(text);
+    const void *data = PyUnicode_DATA(text);
+    Py_ssize_t length = PyUnicode_GET_LENGTH(text);
+
+    /* First pass: the exact length and widest character of the result. */
+    Py_ssize_t size = 0;
+    Py_UCS4 maxchar = 0;
+    int changed = 0;
+    for (Py_ssize_t index = 0; index < length; index++) {
+        Py_UCS4 ch = PyUnicode_READ(kind, data, index);
+        uint32_t entry;
+        PyObject *replacement = translator_lookup(self, ch, &entry);
+        if (replacement != NULL) {
+            Py_ssize_t extra = PyUnicode_GET_LENGTH(replacement);
+            if (size > PY_SSIZE_T_MAX - extra) {
+                return PyErr_NoMemory();
+            }
+            size += extra;
+            Py_UCS4 widest = PyUnicode_MAX_CHAR_VALUE(replacement);
+            if (extra && widest > maxchar) {
+                /* The widest character the kind allows may not occur; find the real one. */
+                for (Py_ssize_t offset = 0; offset < extra; offset++) {
+                    Py_UCS4 replaced = PyUnicode_READ_CHAR(replacement, offset);
+                    maxchar = replaced > maxchar ? replaced : maxchar;
+                }
+            }
+            changed = 1;
+            continue;
+        }
+        if (ch >= 0x10000 && PyErr_Occurred()) {
+            return NULL;
+        }
+        if (entry == ENTRY_DELETE) {
+            changed = 1;
+            continue;
+        }
+        if (entry != ENTRY_UNMAPPED) {
+            ch = entry;
+            changed = 1;
+        }
+        maxchar = ch > maxchar ? ch : maxchar;
+        size++;
+    }
+    if (!changed) {
+        return unchanged_text(text);
+    }
+
+    /* Second pass: write the result. */
+    PyObject *result = PyUnicode_New(size, maxchar);
+    if (result == NULL) {
+        return NULL;
+    }
+    int result_kind = PyUnicode_KIND(result);
+    void *result_data = PyUnicode_DATA(result);
+    Py_ssize_t written = 0;
+    for (Py_ssize_t index = 0; index < length; index++) {
+        Py_UCS4 ch = PyUnicode_READ(kind, data, index);
+        uint32_t entry;
+        PyObject *replacement = translator_lookup(self, ch, &entry);
+        if (replacement != NULL) {
+            Py_ssize_t extra = PyUnicode_GET_LENGTH(replacement);
+            for (Py_ssize_t offset = 0; offset < extra; offset++) {
+                PyUnicode_WRITE(result_kind, result_data, written++,
+                                PyUnicode_READ_CHAR(replacement, offset));
+            }
+            continue;
+        }
+        if (ch >= 0x10000 && PyErr_Occurred()) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        if (entry == ENTRY_DELETE) {
+            continue;
+        }
+        PyUnicode_WRITE(result_kind, result_data, written++, entry == ENTRY_UNMAPPED ? ch : entry);
+    }
+    return result;
+}
+
+static PyTypeObject TranslatorType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "persian._speedups.Translator",
+    .tp_basicsize = sizeof(TranslatorObject),
+    .tp_dealloc = (destructor)translator_dealloc,
+    .tp_vectorcall_offset = offsetof(TranslatorObject, vectorcall),
+    .tp_call = PyVectorcall_Call,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_VECTORCALL,
+    .tp_doc = "Apply a str.translate table; built by translator().",
+};
+
+/* Replacer ------------------------------------------------------------ */
+
+typedef struct {
+    PyObject_HEAD
+    vectorcallfunc vectorcall;
+    /* Keys in priority order and their replacements. */
+    PyObject *keys;
+    PyObject *values;
+    /* Bit per BMP code point that starts a key; astral first characters set
+       ``astral_first``. */
+    uint8_t first[0x10000 / 8];
+    int astral_first;
+} ReplacerObject;
+
+static PyTypeObject ReplacerType;
+static PyObject *replacer_call(ReplacerObject *self, PyObject *const *args, size_t nargsf,
+                               PyObject *kwnames);
+
+static void
+replacer_dealloc(ReplacerObject *self)
+{
+    Py_XDECREF(self->keys);
+    Py_XDECREF(self->values);
+    PyObject_Free(self);
+}
+
+static PyObject *
+replacer(PyObject *module, PyObject *pairs)
+{
+    PyObject *sequence = PySequence_Fast(pairs, "pairs must be a sequence");
+    if (sequence == NULL) {
+        return NULL;
+    }
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(sequence);
+    ReplacerObject *self = PyObject_New(ReplacerObject, &ReplacerType);
+    if (self == NULL) {
+        Py_DECREF(sequence);
+        return NULL;
+    }
+    self->vectorcall = (vectorcallfunc)replacer_call;
+    memset(self->first, 0, sizeof(self->first));
+    self->astral_first = 0;
+    self->keys = PyTuple_New(count);
+    self->values = PyTuple_New(count);
+    /* dict(pairs) semantics: the last value given for a key wins. */
+    PyObject *lookup = PyDict_New();
+    if (self->keys == NULL || self->values == NULL || lookup == NULL) {
+        goto error;
+    }
+    for (Py_ssize_t index = 0; index < count; index++) {
+        /* Any sequence of two items is a pair, as for dict(pairs). */
+        PyObject *pair = PySequence_Fast(PySequence_Fast_GET_ITEM(sequence, index),
+                                         "pairs must hold (key, value) pairs");
+        if (pair == NULL) {
+            goto error;
+        }
+        if (PySequence_Fast_GET_SIZE(pair) != 2) {
+            PyErr_SetString(PyExc_TypeError, "pairs must hold (key, value) pairs");
+            Py_DECREF(pair);
+            goto error;
+        }
+        PyObject *key = PySequence_Fast_GET_ITEM(pair, 0);
+        PyObject *value = PySequence_Fast_GET_ITEM(pair, 1);
+        if (!PyUnicode_Check(key) || !PyUnicode_Check(value) || PyUnicode_GET_LENGTH(key) == 0) {
+            PyErr_SetString(PyExc_TypeError, "keys must be non-empty strings and values strings");
+            Py_DECREF(pair);
+            goto error;
+        }
+        /* The keys tuple keeps ``key`` alive once ``pair`` is released. */
+        PyTuple_SET_ITEM(self->keys, index, Py_NewRef(key));
+        int stored = PyDict_SetItem(lookup, key, value);
+        Py_DECREF(pair);
+        if (stored < 0) {
+            goto error;
+        }
+        Py_UCS4 first = PyUnicode_READ_CHAR(key, 0);
+        if (first < 0x10000) {
+            self->first[first >> 3] |= (uint8_t)(1 << (first & 7));
+        }
+        else {
+            self->astral_first = 1;
+        }
+    }
+    for (Py_ssize_t index = 0; index < count; index++) {
+        PyObject *value = PyDict_GetItemWithError(lookup, PyTuple_GET_ITEM(self->keys, index));
+        if (value == NULL) {
+            goto error;
+        }
+        PyTuple_SET_ITEM(self->values, index, Py_NewRef(value));
+    }
+    Py_DECREF(lookup);
+    Py_DECREF(sequence);
+    return (PyObject *)self;
+
+error:
+    Py_XDECREF(lookup);
+    Py_DECREF(sequence);
+    Py_DECREF(self);
+    return NULL;
+}
+
+static inline int
+replacer_may_start(const ReplacerObject *self, Py_UCS4 ch)
+{
+    if (ch < 0x10000) {
+        return self->first[ch >> 3] & (1 << (ch & 7));
+    }
+    return self->astral_first;
+}
+
+/* Index of the first key matching ``text`` at ``index``, or -1. */
+static Py_ssize_t
+replacer_match(const ReplacerObject *self, int kind, const void *data, Py_ssize_t length,
+               Py_ssize_t index)
+{
+    Py_ssize_t count = PyTuple_GET_SIZE(self->keys);
+    for (Py_ssize_t position = 0; position < count; position++) {
+        PyObject *key = PyTuple_GET_ITEM(self->keys, position);
+        Py_ssize_t size = PyUnicode_GET_LENGTH(key);
+        if (size > length - index) {
+            continue;
+        }
+        int key_kind = PyUnicode_KIND(key);
+        const void *key_data = PyUnicode_DATA(key);
+        Py_ssize_t offset = 0;
+        while (offset < size && PyUnicode_READ(key_kind, key_data, offset) ==
+                                    PyUnicode_READ(kind, data, index + offset)) {
+            offset++;
+        }
+        if (offset == size) {
+            return position;
+        }
+    }
+    return -1;
+}
+
+static PyObject *
+replacer_call(ReplacerObject *self, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    PyObject *text = text_argument(args, nargsf, kwnames);
+    if (text == NULL) {
+        return NULL;
+    }
+    int kind = PyUnicode_KIND(text);
+    const void *data = PyUnicode_DATA(text);
+    Py_ssize_t length = PyUnicode_GET_LENGTH(text);
+    Py_UCS4 *buffer = NULL;
+    Py_ssize_t capacity = 0, size = 0, copied = 0;
+    Py_ssize_t index = 0;
+    int matched = 0;
+    while (index < length) {
+        Py_ssize_t position = -1;
+        if (replacer_may_start(self, PyUnicode_READ(kind, data, index))) {
+            position = replacer_match(self, kind, data, length, index);
+        }
+        if (position < 0) {
+            index++;
+            continue;
+        }
+        matched = 1;
+        PyObject *value = PyTuple_GET_ITEM(self->values, position);
+        Py_ssize_t value_size = PyUnicode_GET_LENGTH(value);
+        Py_ssize_t needed = size + (index - copied) + value_size;
+        if (needed > capacity) {
+            Py_ssize_t grown = capacity + capacity / 2 > needed ? capacity + capacity / 2 : needed;
+            grown = grown < length ? length : grown;
+            Py_UCS4 *resized = PyMem_Realloc(buffer, (size_t)grown * sizeof(Py_UCS4));
+            if (resized == NULL) {
+                PyMem_Free(buffer);
+                return PyErr_NoMemory();
+            }
+            buffer = resized;
+            capacity = grown;
+        }
+        for (; copied < index; copied++) {
+            buffer[size++] = PyUnicode_READ(kind, data, copied);
+        }
+        for (Py_ssize_t offset = 0; offset < value_size; offset++) {
+            buffer[size++] = PyUnicode_READ_CHAR(value, offset);
+        }
+        index += PyUnicode_GET_LENGTH(PyTuple_GET_ITEM(self->keys, position));
+        copied = index;
+    }
+    if (!matched) {
+        return unchanged_text(text);
+    }
+    Py_ssize_t tail = length - copied;
+    if (size + tail > capacity || buffer == NULL) {
+        Py_UCS4 *resized = PyMem_Realloc(buffer, (size_t)(size + tail) * sizeof(Py_UCS4));
+        if (resized == NULL) {
+            PyMem_Free(buffer);
+            return PyErr_NoMemory();
+        }
+        buffer = resized;
+    }
+    for (; copied < length; copied++) {
+        buffer[size++] = PyUnicode_READ(kind, data, copied);
+    }
+    PyObject *result = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, buffer, size);
+    PyMem_Free(buffer);
+    return result;
+}
+
+static PyTypeObject ReplacerType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "persian._speedups.Replacer",
+    .tp_basicsize = sizeof(ReplacerObject),
+    .tp_dealloc = (destructor)replacer_dealloc,
+    .tp_vectorcall_offset = offsetof(ReplacerObject, vectorcall),
+    .tp_call = PyVectorcall_Call,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_VECTORCALL,
+    .tp_doc = "Replace keys in a single scan; built by replacer().",
+};
+
+/* Range predicates ---------------------------------------------------- */
+
+static int
+range_arguments(PyObject *const *args, Py_ssize_t nargs, const char *name, PyObject **text,
+                Py_UCS4 *first, Py_UCS4 *last)
+{
+    if (nargs != 3) {
+        PyErr_Format(PyExc_TypeError, "%s expected 3 arguments, got %zd", name, nargs);
+        return -1;
+    }
+    if (!PyUnicode_Check(args[0])) {
+        PyErr_Format(PyExc_TypeError, "expected str, got %.100s", Py_TYPE(args[0])->tp_name);
+        return -1;
+    }
+    unsigned long bounds[2];
+    for (int index = 0; index < 2; index++) {
+        bounds[index] = PyLong_AsUnsignedLong(args[index + 1]);
+        if (bounds[index] == (unsigned long)-1 && PyErr_Occurred()) {
+            return -1;
+        }
+        if (bounds[index] > 0x10FFFF) {
+            PyErr_SetString(PyExc_ValueError, "bounds must be in range(0x110000)");
+            return -1;
+        }
+    }
+    *text = args[0];
+    *first = (Py_UCS4)bounds[0];
+    *last = (Py_UCS4)bounds[1];
+    return 0;
+}
+
+/* Count characters of ``text`` in [first, last], stopping at the first if ``any``. */
+#define COUNT_RANGE(TYPE)                                                                      \
+    do {                                                                                       \
+        const TYPE *chars = (const TYPE *)data;                                                \
+        for (Py_ssize_t index = 0; index < length; index++) {                                  \
+            if ((Py_UCS4)(chars[index] - first) <= span) {                                     \
+                count++;                                                                       \
+                if (any) {                                                                     \
+                    break;                                                                     \
+                }                                                                              \
+            }                                                                                  \
+        }                                                                                      \
+    } while (0)
+
+static Py_ssize_t
+count_in_range(PyObject *text, Py_UCS4 first, Py_UCS4 last, int any)
+{
+    if (first > last || first > PyUnicode_MAX_CHAR_VALUE(text)) {
+        return 0;
+    }
+    const void *data = PyUnicode_DATA(text);
+    Py_ssize_t length = PyUnicode_GET_LENGTH(text);
+    Py_UCS4 span = last - first;
+    Py_ssize_t count = 0;
+    switch (PyUnicode_KIND(text)) {
+    case PyUnicode_1BYTE_KIND:
+        COUNT_RANGE(Py_UCS1);
+        break;
+    case PyUnicode_2BYTE_KIND:
+        COUNT_RANGE(Py_UCS2);
+        break;
+    default:
+        COUNT_RANGE(Py_UCS4);
+        break;
+    }
+    return count;
+}
+
+static PyObject *
+has_range(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *text;
+    Py_UCS4 first, last;
+    if (range_arguments(args, nargs, "has_range", &text, &first, &last) < 0) {
+        return NULL;
+    }
+    return PyBool_FromLong(count_in_range(text, first, last, 1) != 0);
+}
+
+static PyObject *
+count_range(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *text;
+    Py_UCS4 first, last;
+    if (range_arguments(args, nargs, "count_range", &text, &first, &last) < 0) {
+        return NULL;
+    }
+    return PyLong_FromSsize_t(count_in_range(text, first, last, 0));
+}
+
+/* Module -------------------------------------------------------------- */
+
+static PyMethodDef speedups_methods[] = {
+    {"translator", (PyCFunction)translator, METH_O,
+     "Return a function applying str.translate with a table."},
+    {"replacer", (PyCFunction)replacer, METH_O,
+     "Return a function replacing (key, value) pairs, first key first, in a single scan."},
+    {"has_range", (PyCFunction)(void (*)(void))has_range, METH_FASTCALL,
+     "Whether text contains a character from first to last."},
+    {"count_range", (PyCFunction)(void (*)(void))count_range, METH_FASTCALL,
+     "Number of characters of text from first to last."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "persian._speedups",
+    .m_doc = "C implementations of the kernels in persian._native.",
+    .m_size = -1,
+    .m_methods = speedups_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    if (PyType_Ready(&TranslatorType) < 0 || PyType_Ready(&ReplacerType) < 0) {
+        return NULL;
+    }
+    PyObject *module = PyModule_Create(&speedups_module);
+    if (module == NULL) {
+        return NULL;
+    }
+#ifdef Py_GIL_DISABLED
+    PyUnstable_Module_SetGIL(module, Py_MOD_GIL_NOT_USED);
+#endif
+    return module;
+}
@@ -0,0 +1,6 @@
+from collections.abc import Callable, Mapping, Sequence
+
+def translator(table: Mapping[int, str | int | None]) -> Callable[[str], str]: ...
+def replacer(pairs: Sequence[tuple[str, str]]) -> Callable[[str], str]: ...
+def has_range(text: str, first: int, last: int) -> bool: ...
+def count_range(text: str, first: int, last: int) -> int: ...
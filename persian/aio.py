@@ -0,0 +1,169 @@
+"""Asyncio-friendly normalization that keeps large inputs off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Final
+
+from .core import _validate_string_input
+from .normalizer import Normalizer
+from .stream import DEFAULT_BUFFER_SIZE, _segments
+
+DEFAULT_INLINE_LIMIT: Final = 16_384
+DEFAULT_MAX_WORKERS: Final = min(4, os.cpu_count() or 1)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="persian-aio"
+            )
+        return _executor
+
+
+def _validate_inline_limit(inline_limit: int) -> None:
+    if inline_limit < 0:
+        raise ValueError(f"inline_limit must not be negative, got {inline_limit}")
+
+
+async def _normalize_offloaded(text: str, normalizer: Normalizer, executor: Executor | None) -> str:
+    """Normalize ``text`` segment by segment in ``executor``.
+
+    Segments split only where no spacing rule can match across, so the joined
+    result equals normalizing the whole text. Awaiting between segments lets a
+    cancelled task stop after the segment in progress.
+    """
+    loop = asyncio.get_running_loop()
+    pool = executor if executor is not None else _shared_executor()
+    pieces = [
+        await loop.run_in_executor(pool, normalizer._apply, segment)
+        for segment in _segments(io.StringIO(text), DEFAULT_BUFFER_SIZE)
+    ]
+    return "".join(pieces)
+
+
+async def anormalize(
+    input_str: str,
+    *,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    fix_spacing: bool = True,
+    normalize_presentation_forms: bool = False,
+    inline_limit: int = DEFAULT_INLINE_LIMIT,
+    executor: Executor | None = None,
+) -> str:
+    """Normalize text like ``normalize_persian`` without blocking the event loop.
+
+    Inputs of at most ``inline_limit`` characters are normalized inline, since
+    handing them to a thread would cost more than the work itself. Larger
+    inputs run in ``executor``, one bounded segment at a time, so cancelling the
+    awaiting task stops the work after the segment in progress.
+
+    Args:
+        input_str: Text to normalize.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+        inline_limit: Largest input, in characters, normalized on the event loop.
+        executor: Executor for large inputs. Defaults to a shared thread pool of
+            ``DEFAULT_MAX_WORKERS`` threads.
+
+    Returns:
+        Normalized Persian text.
+
+    Raises:
+        TypeError: If `input_str` is not a string.
+        ValueError: If `input_str` is None or `inline_limit` is negative.
+
+    Examples:
+        >>> asyncio.run(anormalize("سلام ٣٤٥ می آیم"))
+        'سلام ۳۴۵ می‌آیم'
+    """
+    _validate_string_input(input_str)
+    _validate_inline_limit(inline_limit)
+    normalizer = Normalizer(
+        convert_numbers=convert_numbers,
+        convert_characters=convert_characters,
+        fix_spacing=fix_spacing,
+        normalize_presentation_forms=normalize_presentation_forms,
+    )
+    if len(input_str) <= inline_limit:
+        return normalizer._apply(input_str)
+    return await _normalize_offloaded(input_str, normalizer, executor)
+
+
+async def anormalize_many(
+    items: Iterable[str],
+    *,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    fix_spacing: bool = True,
+    normalize_presentation_forms: bool = False,
+    inline_limit: int = DEFAULT_INLINE_LIMIT,
+    executor: Executor | None = None,
+) -> list[str]:
+    """Normalize many strings without blocking the event loop.
+
+    Small strings are normalized inline, and control returns to the event loop
+    whenever about ``inline_limit`` characters have been processed that way.
+    Strings longer than ``inline_limit`` are offloaded as in ``anormalize``.
+
+    Args:
+        items: Strings to normalize.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+        inline_limit: Largest string, and the largest run of consecutive work,
+            in characters, handled on the event loop.
+        executor: Executor for large strings; see ``anormalize``.
+
+    Returns:
+        The normalized strings, in input order.
+
+    Raises:
+        TypeError: If an item is not a string.
+        ValueError: If an item is None or `inline_limit` is negative.
+
+    Examples:
+        >>> asyncio.run(anormalize_many(["سلام ٣٤٥", "من می روم"]))
+        ['سلام ۳۴۵', 'من می‌روم']
+    """
+    _validate_inline_limit(inline_limit)
+    normalizer = Normalizer(
+        convert_numbers=convert_numbers,
+        convert_characters=convert_characters,
+        fix_spacing=fix_spacing,
+        normalize_presentation_forms=normalize_presentation_forms,
+    )
+    results = []
+    budget = inline_limit
+    for item in items:
+        if type(item) is not str:
+            _validate_string_input(item, "items")
+        if len(item) > inline_limit:
+            results.append(await _normalize_offloaded(item, normalizer, executor))
+            continue
+        results.append(normalizer._apply(item))
+        budget -= len(item)
+        if budget < 0:
+            budget = inline_limit
+            await asyncio.sleep(0)
+    return results
+
+
+__all__ = ["DEFAULT_INLINE_LIMIT", "DEFAULT_MAX_WORKERS", "anormalize", "anormalize_many"]
@@ -0,0 +1,220 @@
+"""Offset alignment between normalized text and the original input."""
+
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
+
+# An edit replaces original[original_start:original_end] with
+# normalized[normalized_start:normalized_end]; text between edits is copied 1:1.
+Edit = tuple[int, int, int, int]
+
+
+class Alignment:
+    """Compact map from offsets in normalized text back to the original text.
+
+    Only the regions a normalization rewrote are stored, as four
+    ``array('Q')`` columns, so the footprint grows with the number of edits
+    rather than with the text length. Lookups are binary searches.
+
+    Examples:
+        >>> text, alignment = normalize_persian("من می  روم", return_alignment=True)
+        >>> alignment.original_span(3, 9)
+        (3, 10)
+    """
+
+    __slots__ = ("_normalized_ends", "_normalized_starts", "_original_ends", "_original_starts")
+
+    def __init__(self, edits: Iterable[Edit] = ()) -> None:
+        self._normalized_starts = array("Q")
+        self._normalized_ends = array("Q")
+        self._original_starts = array("Q")
+        self._original_ends = array("Q")
+        for normalized_start, normalized_end, original_start, original_end in edits:
+            self._normalized_starts.append(normalized_start)
+            self._normalized_ends.append(normalized_end)
+            self._original_starts.append(original_start)
+            self._original_ends.append(original_end)
+
+    def __len__(self) -> int:
+        """Return the number of stored edits."""
+        return len(self._normalized_starts)
+
+    def __iter__(self) -> Iterator[Edit]:
+        """Iterate over the stored edits as ``(start, end, original_start, original_end)``."""
+        return zip(
+            self._normalized_starts,
+            self._normalized_ends,
+            self._original_starts,
+            self._original_ends,
+            strict=True,
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def original_offset(self, offset: int, *, end: bool = False) -> int:
+        """Map a normalized offset to the original text.
+
+        Characters deleted by normalization belong to the text before them, so
+        a closing offset at a deletion maps past the deleted characters.
+
+        Args:
+            offset: Offset in the normalized text.
+            end: Whether ``offset`` closes a span; offsets inside an edited
+                region then map to the end of the original region instead of
+                its start.
+
+        Returns:
+            The corresponding offset in the original text.
+        """
+        if offset < 0:
+            raise ValueError(f"offset must not be negative, got {offset}")
+        if end:
+            index = bisect_left(self._normalized_starts, offset) - 1
+            following = index + 1
+            if (
+                following < len(self._normalized_starts)
+                and self._normalized_starts[following] == offset
+                and self._normalized_ends[following] == offset
+            ):
+                return self._original_ends[following]
+            if index >= 0 and offset <= self._normalized_ends[index]:
+                return self._original_ends[index]
+        elif offset == 0:
+            return 0
+        else:
+            index = bisect_right(self._normalized_starts, offset) - 1
+            if index >= 0 and offset < self._normalized_ends[index]:
+                return self._original_starts[index]
+        if index < 0:
+            return offset
+        return self._original_ends[index] + offset - self._normalized_ends[index]
+
+    def original_span(self, start: int, end: int) -> tuple[int, int]:
+        """Map a ``[start, end)`` span of normalized text to the original text.
+
+        Args:
+            start: Start offset in the normalized text.
+            end: End offset in the normalized text.
+
+        Returns:
+            The smallest original span that produced the normalized span.
+
+        Raises:
+            ValueError: If the span is negative or reversed.
+        """
+        if end < start:
+            raise ValueError(f"end must not precede start, got ({start}, {end})")
+        original_start = self.original_offset(start)
+        if start == end:
+            return original_start, original_start
+        return original_start, max(original_start, self.original_offset(end, end=True))
+
+
+def _sub_edits(
+    pattern: re.Pattern[str], replace: Callable[[re.Match[str]], str], text: str
+) -> tuple[str, list[Edit]]:
+    """Substitute like ``pattern.sub`` while recording the edits it makes."""
+    pieces: list[str] = []
+    edits: list[Edit] = []
+    position = 0
+    shift = 0
+    for match in pattern.finditer(text):
+        start, stop = match.span()
+        old = match.group()
+        new = replace(match)
+        pieces.append(text[position:start])
+        pieces.append(new)
+        position = stop
+        # Trim the unchanged head and tail so edits cover only what really changed.
+        head = 0
+        limit = min(len(old), len(new))
+        while head < limit and old[head] == new[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old[-1 - tail] == new[-1 - tail]:
+            tail += 1
+        if len(old) != len(new) or head + tail < len(old):
+            edits.append(
+                (
+                    start + shift + head,
+                    start + shift + len(new) - tail,
+                    start + head,
+                    stop - tail,
+                )
+            )
+        shift += len(new) - len(old)
+    if not pieces:
+        return text, edits
+    pieces.append(text[position:])
+    return "".join(pieces), edits
+
+
+def _translate_edits(
+    text: str, table: dict[int, str], resizing: re.Pattern[str] | None
+) -> tuple[str, list[Edit]]:
+    """Translate ``text`` and record the characters that changed length."""
+    edits: list[Edit] = []
+    if resizing is not None:
+        shift = 0
+        for match in resizing.finditer(text):
+            start = match.start()
+            size = len(table[ord(match.group())])
+            edits.append((start + shift, start + shift + size, start, start + 1))
+            shift += size - 1
+    return text.translate(table), edits
+
+
+def _compose(outer: Sequence[Edit], inner: Sequence[Edit]) -> list[Edit]:
+    """Chain two edit lists: ``inner`` maps stage two to stage one, ``outer`` stage one to source.
+
+    Regions of stage one touched by either list are merged, so an edit that
+    overlaps another collapses into one coarser edit with a correct span.
+    """
+    if not outer:
+        return list(inner)
+    if not inner:
+        return list(outer)
+    outer_ends = [edit[1] for edit in outer]
+    inner_ends = [edit[3] for edit in inner]
+
+    def region(start: int, end: int) -> Edit:
+        # Region bounds never fall strictly inside an edit, so each maps by the
+        # shift of the nearest preceding edit; zero-length edits sit inside.
+        before_outer = bisect_left(outer_ends, start) - 1
+        through_outer = bisect_right(outer_ends, end) - 1
+        before_inner = bisect_left(inner_ends, start) - 1
+        through_inner = bisect_right(inner_ends, end) - 1
+        return (
+            _shift(inner, before_inner, start, 3, 1),
+            _shift(inner, through_inner, end, 3, 1),
+            _shift(outer, before_outer, start, 1, 3),
+            _shift(outer, through_outer, end, 1, 3),
+        )
+
+    regions = sorted(
+        [(edit[0], edit[1]) for edit in outer] + [(edit[2], edit[3]) for edit in inner]
+    )
+    composed: list[Edit] = []
+    region_start, region_end = regions[0]
+    for start, end in regions[1:]:
+        if start <= region_end:
+            region_end = max(region_end, end)
+            continue
+        composed.append(region(region_start, region_end))
+        region_start, region_end = start, end
+    composed.append(region(region_start, region_end))
+    return composed
+
+
+def _shift(edits: Sequence[Edit], index: int, position: int, source: int, target: int) -> int:
+    """Map ``position`` past ``edits[index]`` from the ``source`` to the ``target`` column."""
+    if index < 0:
+        return position
+    return edits[index][target] + position - edits[index][source]
+
+
+__all__ = ["Alignment"]
@@ -0,0 +1,350 @@
+"""Batch variants of the core conversions for large collections of short strings."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Final, Literal, TypeVar
+
+from . import core
+from .constants import (
+    AR_DIGITS_PATTERN,
+    AR_TO_FA_DIGITS_TABLE,
+    EN_DIGITS_PATTERN,
+    EN_KEYBOARD_PATTERN,
+    EN_TO_FA_DIGITS_TABLE,
+    EN_TO_FA_KEYBOARD_TABLE,
+    FA_DIGITS_PATTERN,
+    FA_TO_EN_DIGITS_TABLE,
+)
+from .core import (
+    _format_number,
+    _number_format_spec,
+    _number_format_table,
+    _parse_number,
+    _validate_string_input,
+)
+from .normalizer import Normalizer
+from .search import SEARCH_FOLD_VERSION, _fold, _fold_table
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+DEFAULT_CHUNK_SIZE: Final = 4096
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+
+def _chunks(items: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    """Split ``items`` into validated lists of at most ``chunk_size`` strings."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        for item in chunk:
+            if type(item) is not str:
+                _validate_string_input(item, "items")
+        yield chunk
+
+
+def _map_chunks(
+    function: Callable[[Item], Result], items: Iterable[Item], chunk_size: int
+) -> Iterator[Result]:
+    """Apply ``function`` to ``items`` a list of ``chunk_size`` at a time."""
+    iterator = iter(items)
+
+    def chunks() -> Iterator[list[Result]]:
+        while chunk := list(islice(iterator, chunk_size)):
+            yield list(map(function, chunk))
+
+    return chain.from_iterable(chunks())
+
+
+def _validate_chunk_size(chunk_size: int) -> None:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+
+
+def _translate_many(
+    items: Iterable[str],
+    table: dict[int, str],
+    scan: re.Pattern[str],
+    chunk_size: int,
+    *,
+    ascii_unchanged: bool,
+    function: Callable[[str], str],
+) -> Iterator[str]:
+    _validate_chunk_size(chunk_size)
+    search = scan.search
+
+    def convert(chunk: list[str]) -> list[str]:
+        if core._collector is not None:
+            # The core function records each call and returns the same strings.
+            return list(map(function, chunk))
+        return [
+            item
+            if (ascii_unchanged and item.isascii()) or search(item) is None
+            else item.translate(table)
+            for item in chunk
+        ]
+
+    return chain.from_iterable(map(convert, _chunks(items, chunk_size)))
+
+
+def _normalize_many(items: Iterable[str], normalizer: Normalizer, chunk_size: int) -> Iterator[str]:
+    _validate_chunk_size(chunk_size)
+    apply = normalizer._apply
+
+    def convert(chunk: list[str]) -> list[str]:
+        return list(map(apply, chunk))
+
+    return chain.from_iterable(map(convert, _chunks(items, chunk_size)))
+
+
+def normalize_many(
+    items: Iterable[str],
+    *,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    fix_spacing: bool = True,
+    normalize_presentation_forms: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Normalize many strings with the options of ``normalize_persian``.
+
+    Strings that need no change are yielded as the very same object, without
+    copying. Input is consumed lazily, ``chunk_size`` strings at a time.
+
+    Args:
+        items: Strings to normalize.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+        chunk_size: Number of strings processed per slice.
+
+    Returns:
+        An iterator over the normalized strings, in input order.
+
+    Raises:
+        TypeError: If an item is not a string.
+        ValueError: If an item is None or `chunk_size` is not positive.
+
+    Examples:
+        >>> list(normalize_many(["سلام ٣٤٥", "Hello"]))
+        ['سلام ۳۴۵', 'Hello']
+    """
+    normalizer = Normalizer(
+        convert_numbers=convert_numbers,
+        convert_characters=convert_characters,
+        fix_spacing=fix_spacing,
+        normalize_presentation_forms=normalize_presentation_forms,
+    )
+    return _normalize_many(items, normalizer, chunk_size)
+
+
+def convert_en_numbers_many(
+    items: Iterable[str], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Batch version of ``convert_en_numbers``; see ``normalize_many`` for semantics."""
+    return _translate_many(
+        items,
+        EN_TO_FA_DIGITS_TABLE,
+        EN_DIGITS_PATTERN,
+        chunk_size,
+        ascii_unchanged=False,
+        function=core.convert_en_numbers,
+    )
+
+
+def convert_en_characters_many(
+    items: Iterable[str], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Batch version of ``convert_en_characters``; see ``normalize_many`` for semantics."""
+    return _translate_many(
+        items,
+        EN_TO_FA_KEYBOARD_TABLE,
+        EN_KEYBOARD_PATTERN,
+        chunk_size,
+        ascii_unchanged=False,
+        function=core.convert_en_characters,
+    )
+
+
+def convert_ar_numbers_many(
+    items: Iterable[str], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Batch version of ``convert_ar_numbers``; see ``normalize_many`` for semantics."""
+    return _translate_many(
+        items,
+        AR_TO_FA_DIGITS_TABLE,
+        AR_DIGITS_PATTERN,
+        chunk_size,
+        ascii_unchanged=True,
+        function=core.convert_ar_numbers,
+    )
+
+
+def convert_fa_numbers_many(
+    items: Iterable[str], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Batch version of ``convert_fa_numbers``; see ``normalize_many`` for semantics."""
+    return _translate_many(
+        items,
+        FA_TO_EN_DIGITS_TABLE,
+        FA_DIGITS_PATTERN,
+        chunk_size,
+        ascii_unchanged=True,
+        function=core.convert_fa_numbers,
+    )
+
+
+def convert_ar_characters_many(
+    items: Iterable[str], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Batch version of ``convert_ar_characters``; see ``normalize_many`` for semantics."""
+    normalizer = Normalizer(convert_numbers=False, fix_spacing=False)
+    return _normalize_many(items, normalizer, chunk_size)
+
+
+def convert_fa_spaces_many(
+    items: Iterable[str], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Batch version of ``convert_fa_spaces``; see ``normalize_many`` for semantics."""
+    normalizer = Normalizer(convert_numbers=False, convert_characters=False)
+    return _normalize_many(items, normalizer, chunk_size)
+
+
+def parse_number_many(
+    items: Iterable[str], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[int | float]:
+    """Batch version of ``parse_number``, consuming ``items`` ``chunk_size`` at a time.
+
+    Raises:
+        TypeError: If an item is not a string.
+        ValueError: If an item is None or not a number, or `chunk_size` is not
+            positive.
+
+    Examples:
+        >>> list(parse_number_many(["۲٬۳۴۴", "٣٤.٢", "42"]))
+        [2344, 34.2, 42]
+    """
+    _validate_chunk_size(chunk_size)
+
+    def convert(chunk: list[str]) -> list[int | float]:
+        if core._collector is not None:
+            return list(map(core.parse_number, chunk))
+        return [int(item) if item.isdecimal() else _parse_number(item) for item in chunk]
+
+    return chain.from_iterable(map(convert, _chunks(items, chunk_size)))
+
+
+def format_number_many(
+    numbers: Iterable[int | float | Decimal],
+    *,
+    digits: Literal["fa", "ar", "en"] = "fa",
+    grouping: bool = True,
+    decimals: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Batch version of ``format_number``, consuming ``numbers`` ``chunk_size`` at a time.
+
+    Raises:
+        TypeError: If an item is not a number.
+        ValueError: If `digits` is unknown, or `decimals` or `chunk_size` is
+            out of range.
+
+    Examples:
+        >>> list(format_number_many([2344, 342], digits="ar"))
+        ['٢٬٣٤٤', '٣٤٢']
+    """
+    _validate_chunk_size(chunk_size)
+    table = _number_format_table(digits)
+    if decimals is not None and decimals < 0:
+        raise ValueError(f"decimals must not be negative, got {decimals}")
+    spec = _number_format_spec(grouping, decimals)
+
+    def convert(number: int | float | Decimal) -> str:
+        if core._collector is not None:
+            return core.format_number(number, digits=digits, grouping=grouping, decimals=decimals)
+        return _format_number(number, spec).translate(table)
+
+    return _map_chunks(convert, numbers, chunk_size)
+
+
+def fold_for_search_many(
+    items: Iterable[str],
+    *,
+    version: int = SEARCH_FOLD_VERSION,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Batch version of ``fold_for_search``, consuming ``items`` ``chunk_size`` at a time.
+
+    Raises:
+        TypeError: If an item is not a string.
+        ValueError: If an item is None, or `version` or `chunk_size` is invalid.
+
+    Examples:
+        >>> list(fold_for_search_many(["كتاب ٣", "Hello  World"]))
+        ['کتاب 3', 'Hello World']
+    """
+    _validate_chunk_size(chunk_size)
+    table = _fold_table(version)
+
+    def convert(chunk: list[str]) -> list[str]:
+        return [_fold(item, table) for item in chunk]
+
+    return chain.from_iterable(map(convert, _chunks(items, chunk_size)))
+
+
+def number_to_words_many(
+    numbers: Iterable[int | float | Decimal], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Batch version of ``number_to_words``, consuming ``numbers`` ``chunk_size`` at a time.
+
+    Raises:
+        TypeError: If an item is not a number.
+        ValueError: If an item is infinite or NaN, or `chunk_size` is not positive.
+    """
+    from .number_words import number_to_words
+
+    _validate_chunk_size(chunk_size)
+    return _map_chunks(number_to_words, numbers, chunk_size)
+
+
+def words_to_number_many(
+    items: Iterable[str], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[int | Decimal]:
+    """Batch version of ``words_to_number``, consuming ``items`` ``chunk_size`` at a time.
+
+    Raises:
+        TypeError: If an item is not a string.
+        ValueError: If an item is None or not a number in words, or `chunk_size`
+            is not positive.
+    """
+    from .number_words import _words_to_number
+
+    _validate_chunk_size(chunk_size)
+
+    def convert(chunk: list[str]) -> list[int | Decimal]:
+        return list(map(_words_to_number, chunk))
+
+    return chain.from_iterable(map(convert, _chunks(items, chunk_size)))
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "convert_ar_characters_many",
+    "convert_ar_numbers_many",
+    "convert_en_characters_many",
+    "convert_en_numbers_many",
+    "convert_fa_numbers_many",
+    "convert_fa_spaces_many",
+    "fold_for_search_many",
+    "format_number_many",
+    "normalize_many",
+    "number_to_words_many",
+    "parse_number_many",
+    "words_to_number_many",
+]
@@ -0,0 +1,268 @@
+"""Byte-level conversions for UTF-8 buffers, memory maps and files.
+
+Every character these tables touch is a whole UTF-8 sequence, and UTF-8 is
+self-synchronizing: an encoded key can only ever match at a character
+boundary. So the conversions run as byte-sequence replacements without
+decoding. Tables that never lengthen the text can rewrite a buffer in place,
+including an ``mmap`` of a file.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Generator, Mapping
+from contextlib import ExitStack, contextmanager
+from functools import cache
+from pathlib import Path
+from typing import Final
+
+from .constants import (
+    AR_DIACRITICS_MAPPING,
+    AR_TO_FA_CHARS_TABLE,
+    AR_TO_FA_DIGITS_TABLE,
+    EN_TO_FA_DIGITS_TABLE,
+    FA_TO_EN_DIGITS_TABLE,
+    _compose_tables,
+)
+from .core import MappingType
+
+DEFAULT_BYTE_CHUNK_SIZE: Final = 1 << 20
+
+ReadableBuffer = bytes | bytearray | memoryview | mmap.mmap
+WritableBuffer = bytearray | memoryview | mmap.mmap
+
+
+@contextmanager
+def _byte_view(buffer: ReadableBuffer) -> Generator[memoryview]:
+    """Yield a flat byte view of ``buffer``, releasing it so an ``mmap`` can close."""
+    with memoryview(buffer) as raw, raw.cast("B") as view:
+        yield view
+
+
+class ByteTranslator:
+    """UTF-8 byte-level equivalent of ``str.translate`` followed by ordered replacements.
+
+    The input is processed in chunks of roughly ``chunk_size`` bytes, each cut
+    at a character boundary that cannot split a rule, so memory use stays
+    bounded whatever the input size.
+
+    Args:
+        table: Translation table mapping code points to replacement strings.
+        rules: Ordered ``(old, new)`` replacements applied after the table.
+
+    Examples:
+        >>> ByteTranslator(AR_TO_FA_DIGITS_TABLE)("٣٤٥".encode())
+        b'\\xdb\\xb3\\xdb\\xb4\\xdb\\xb5'
+    """
+
+    __slots__ = ("_longest", "_prefixes", "_rules", "_table", "grows")
+
+    def __init__(self, table: Mapping[int, str] | None = None, rules: MappingType = ()) -> None:
+        table = dict(table or {})
+        if any(chr(key) in value for value in table.values() for key in table):
+            raise ValueError("table values must not contain characters the table translates")
+        if any(not old for old, _ in rules):
+            raise ValueError("rule patterns must be non-empty strings")
+        self._table = tuple((chr(key).encode(), value.encode()) for key, value in table.items())
+        self._rules = tuple((old.encode(), new.encode()) for old, new in rules)
+        pairs = self._table + self._rules
+        self.grows = any(len(new) > len(old) for old, new in pairs)
+        self._prefixes = frozenset(
+            old[:size] for old, _ in self._rules for size in range(1, len(old))
+        )
+        self._longest = max((len(old) for old, _ in pairs), default=1)
+
+    def _apply_table(self, chunk: bytes) -> bytes:
+        # A table value never contains a key, so its pairs can run one after another.
+        for old, new in self._table:
+            chunk = chunk.replace(old, new)
+        return chunk
+
+    def _apply(self, chunk: bytes) -> bytes:
+        chunk = self._apply_table(chunk)
+        for old, new in self._rules:
+            chunk = chunk.replace(old, new)
+        return chunk
+
+    def _cut(self, view: memoryview, start: int, stop: int) -> int:
+        """Move ``stop`` back to a character boundary that splits no rule."""
+        if stop >= len(view):
+            return len(view)
+        while stop > start and 0x80 <= view[stop] < 0xC0:
+            stop -= 1
+        if self._prefixes:
+            # Rules see the table's output, so translate the tail before matching.
+            for position in range(max(start, stop - self._longest + 1), stop):
+                if self._apply_table(view[position:stop].tobytes()) in self._prefixes:
+                    return position
+        return stop
+
+    def _translate(
+        self, source: ReadableBuffer, target: WritableBuffer | None, chunk_size: int
+    ) -> tuple[int, list[bytes]]:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+        # Leave room for the character-boundary and rule backoff in every chunk.
+        chunk_size = max(chunk_size, 2 * self._longest + 4)
+        pieces: list[bytes] = []
+        position = written = 0
+        with ExitStack() as stack:
+            view = stack.enter_context(_byte_view(source))
+            output = None if target is None else stack.enter_context(_byte_view(target))
+            in_place = output is not None and view.obj is output.obj
+            while position < len(view):
+                cut = self._cut(view, position, position + chunk_size)
+                chunk = view[position:cut].tobytes()
+                piece = self._apply(chunk)
+                if output is None:
+                    pieces.append(piece)
+                elif not (in_place and piece is chunk and written == position):
+                    if written + len(piece) > len(output):
+                        raise ValueError("target buffer is too small for the translated output")
+                    output[written : written + len(piece)] = piece
+                written += len(piece)
+                position = cut
+        return written, pieces
+
+    def __call__(self, data: ReadableBuffer, *, chunk_size: int = DEFAULT_BYTE_CHUNK_SIZE) -> bytes:
+        """Return a translated copy of ``data``.
+
+        Args:
+            data: UTF-8 encoded bytes-like object.
+            chunk_size: Approximate number of bytes processed per step.
+
+        Returns:
+            The translated bytes.
+        """
+        _, pieces = self._translate(data, None, chunk_size)
+        return b"".join(pieces)
+
+    def translate_into(
+        self,
+        source: ReadableBuffer,
+        target: WritableBuffer,
+        *,
+        chunk_size: int = DEFAULT_BYTE_CHUNK_SIZE,
+    ) -> int:
+        """Write the translation of ``source`` into a preallocated ``target``.
+
+        ``target`` may be ``source`` itself when the translator does not grow
+        the text, which rewrites the buffer in place and leaves unchanged
+        chunks untouched.
+
+        Args:
+            source: UTF-8 encoded bytes-like object.
+            target: Writable buffer receiving the output from offset 0.
+            chunk_size: Approximate number of bytes processed per step.
+
+        Returns:
+            The number of bytes written to ``target``.
+
+        Raises:
+            ValueError: If ``target`` is too small, or is ``source`` while the
+                translator grows the text.
+        """
+        if self.grows:
+            with _byte_view(source) as view, _byte_view(target) as output:
+                if view.obj is output.obj:
+                    raise ValueError("a translator that grows the text cannot work in place")
+        written, _ = self._translate(source, target, chunk_size)
+        return written
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(table={len(self._table)}, rules={len(self._rules)}, "
+            f"grows={self.grows})"
+        )
+
+
+AR_TO_FA_DIGITS_BYTES: Final = ByteTranslator(AR_TO_FA_DIGITS_TABLE)
+AR_TO_FA_CHARS_BYTES: Final = ByteTranslator(AR_TO_FA_CHARS_TABLE, AR_DIACRITICS_MAPPING)
+FA_TO_EN_DIGITS_BYTES: Final = ByteTranslator(FA_TO_EN_DIGITS_TABLE)
+EN_TO_FA_DIGITS_BYTES: Final = ByteTranslator(EN_TO_FA_DIGITS_TABLE)
+
+
+@cache
+def _normalizing_translator(convert_numbers: bool, convert_characters: bool) -> ByteTranslator:
+    tables = []
+    if convert_numbers:
+        tables.append(AR_TO_FA_DIGITS_TABLE)
+    if convert_characters:
+        tables.append(AR_TO_FA_CHARS_TABLE)
+    rules = AR_DIACRITICS_MAPPING if convert_characters else ()
+    return ByteTranslator(_compose_tables(*tables), rules)
+
+
+def normalize_bytes(
+    data: ReadableBuffer,
+    *,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    chunk_size: int = DEFAULT_BYTE_CHUNK_SIZE,
+) -> bytes:
+    """Apply the character-level steps of ``normalize_persian`` to UTF-8 bytes.
+
+    Spacing fixes need to classify letters around whitespace and are not
+    applied; decode and use ``normalize_persian`` when they are required.
+
+    Args:
+        data: UTF-8 encoded bytes-like object, such as ``bytes`` or an ``mmap``.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        chunk_size: Approximate number of bytes processed per step.
+
+    Returns:
+        The normalized UTF-8 bytes.
+
+    Examples:
+        >>> normalize_bytes("علي ٣".encode()).decode()
+        'علی ۳'
+    """
+    return _normalizing_translator(convert_numbers, convert_characters)(data, chunk_size=chunk_size)
+
+
+def normalize_file(
+    path: str | os.PathLike[str],
+    *,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    chunk_size: int = DEFAULT_BYTE_CHUNK_SIZE,
+) -> int:
+    """Normalize a UTF-8 file in place through a memory map, without decoding it.
+
+    Only chunks that change are written back. The file shrinks when
+    diacritic forms collapse, and is truncated to the new length.
+
+    Args:
+        path: Path of the UTF-8 file to rewrite.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        chunk_size: Approximate number of bytes processed per step.
+
+    Returns:
+        The new size of the file in bytes.
+    """
+    translator = _normalizing_translator(convert_numbers, convert_characters)
+    with Path(path).open("r+b") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return 0
+        with mmap.mmap(file.fileno(), size) as mapped:
+            written = translator.translate_into(mapped, mapped, chunk_size=chunk_size)
+            mapped.flush()
+        if written != size:
+            file.truncate(written)
+    return written
+
+
+__all__ = [
+    "AR_TO_FA_CHARS_BYTES",
+    "AR_TO_FA_DIGITS_BYTES",
+    "DEFAULT_BYTE_CHUNK_SIZE",
+    "EN_TO_FA_DIGITS_BYTES",
+    "FA_TO_EN_DIGITS_BYTES",
+    "ByteTranslator",
+    "normalize_bytes",
+    "normalize_file",
+]
@@ -0,0 +1,157 @@
+"""Opt-in LRU memoization for conversions applied to repeated short strings."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import update_wrapper
+from typing import Any, Final, Generic, NamedTuple, TypeVar, overload
+
+T = TypeVar("T")
+
+DEFAULT_CACHE_SIZE: Final = 4096
+DEFAULT_MAX_LEN: Final = 256
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a ``CachedFunction``, in the spirit of ``functools`` cache info."""
+
+    hits: int
+    misses: int
+    evictions: int
+    skipped: int
+    currsize: int
+    maxsize: int
+
+
+def _validate_limits(maxsize: int, max_len: int) -> None:
+    if maxsize < 1:
+        raise ValueError(f"maxsize must be a positive integer, got {maxsize}")
+    if max_len < 0:
+        raise ValueError(f"max_len must not be negative, got {max_len}")
+
+
+class CachedFunction(Generic[T]):
+    """Thread-safe LRU cache around a function whose first argument is a string.
+
+    Entries are keyed on the input string and the keyword options, so one
+    wrapper can serve calls with different flags. Strings longer than
+    ``max_len`` bypass the cache and are counted as skipped. At most ``maxsize``
+    entries are kept, each for an input of at most ``max_len`` characters, so
+    memory use is bounded.
+
+    Produced by ``cached``.
+    """
+
+    def __init__(self, function: Callable[..., T], maxsize: int, max_len: int) -> None:
+        _validate_limits(maxsize, max_len)
+        self.__wrapped__ = function
+        self.maxsize = maxsize
+        self.max_len = max_len
+        self._entries: OrderedDict[Hashable, T] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._skipped = 0
+        update_wrapper(self, function)
+
+    def __call__(self, input_str: str, /, **options: Any) -> T:
+        """Return ``function(input_str, **options)``, from the cache when possible."""
+        if type(input_str) is not str:
+            return self.__wrapped__(input_str, **options)
+        if len(input_str) > self.max_len:
+            with self._lock:
+                self._skipped += 1
+            return self.__wrapped__(input_str, **options)
+        key: Hashable = (input_str, *sorted(options.items())) if options else input_str
+        with self._lock:
+            try:
+                result = self._entries[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return result
+        # Compute outside the lock; concurrent misses on one key may both compute.
+        result = self.__wrapped__(input_str, **options)
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit, miss, eviction and skip counts with the current size."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._skipped,
+                len(self._entries),
+                self.maxsize,
+            )
+
+    def cache_clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._skipped = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.__wrapped__!r}, maxsize={self.maxsize}, "
+            f"max_len={self.max_len})"
+        )
+
+
+@overload
+def cached(
+    function: Callable[..., T], *, maxsize: int = ..., max_len: int = ...
+) -> CachedFunction[T]: ...
+
+
+@overload
+def cached(
+    function: None = None, *, maxsize: int = ..., max_len: int = ...
+) -> Callable[[Callable[..., T]], CachedFunction[T]]: ...
+
+
+def cached(
+    function: Callable[..., T] | None = None,
+    *,
+    maxsize: int = DEFAULT_CACHE_SIZE,
+    max_len: int = DEFAULT_MAX_LEN,
+) -> CachedFunction[T] | Callable[[Callable[..., T]], CachedFunction[T]]:
+    """Wrap a string conversion in a bounded, thread-safe LRU cache.
+
+    Works on any function taking the text as its first argument, including
+    ``normalize_persian``, the ``convert_*`` helpers and ``Normalizer``
+    instances. It can also be used as a decorator, with or without arguments.
+
+    Args:
+        function: Conversion to wrap; omit it to get a decorator.
+        maxsize: Maximum number of cached results.
+        max_len: Longest input, in characters, that is cached.
+
+    Returns:
+        A ``CachedFunction``, or a decorator producing one.
+
+    Raises:
+        ValueError: If `maxsize` is not positive or `max_len` is negative.
+
+    Examples:
+        >>> normalize = cached(normalize_persian, maxsize=1024, max_len=64)
+        >>> normalize("من می روم")
+        'من می‌روم'
+        >>> normalize.cache_info().misses
+        1
+    """
+    if function is None:
+        _validate_limits(maxsize, max_len)
+        return lambda wrapped: CachedFunction(wrapped, maxsize, max_len)
+    return CachedFunction(function, maxsize, max_len)
+
+
+__all__ = ["DEFAULT_CACHE_SIZE", "DEFAULT_MAX_LEN", "CacheInfo", "CachedFunction", "cached"]
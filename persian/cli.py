@@ -0,0 +1,161 @@
+"""Command-line interface for streaming Persian normalization."""
+
+from __future__ import annotations
+
+import argparse
+import codecs
+import io
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from .stream import DEFAULT_BUFFER_SIZE, normalize_stream
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="persian-normalize",
+        description="Normalize Persian text from files or standard input.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        metavar="FILE",
+        help="input files; '-' or no argument reads standard input",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file; '-' writes standard output"
+    )
+    parser.add_argument(
+        "--no-convert-numbers",
+        dest="convert_numbers",
+        action="store_false",
+        help="keep Arabic digits unchanged",
+    )
+    parser.add_argument(
+        "--no-convert-characters",
+        dest="convert_characters",
+        action="store_false",
+        help="keep Arabic characters unchanged",
+    )
+    parser.add_argument(
+        "--no-fix-spacing",
+        dest="fix_spacing",
+        action="store_false",
+        help="do not replace spaces around affixes with ZWNJ",
+    )
+    parser.add_argument(
+        "--presentation-forms",
+        dest="normalize_presentation_forms",
+        action="store_true",
+        help="fold Arabic Presentation Forms to standard letters",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="number of worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        default=DEFAULT_BUFFER_SIZE,
+        help=f"characters read per block (default: {DEFAULT_BUFFER_SIZE})",
+    )
+    parser.add_argument("--encoding", default="utf-8", help="text encoding (default: utf-8)")
+    return parser
+
+
+def _open_input(name: str, encoding: str) -> io.TextIOWrapper:
+    if name == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding=encoding, newline="")
+    return Path(name).open(encoding=encoding, newline="")
+
+
+def _open_output(name: str, encoding: str) -> io.TextIOWrapper:
+    if name == "-":
+        return io.TextIOWrapper(sys.stdout.buffer, encoding=encoding, newline="")
+    return Path(name).open("w", encoding=encoding, newline="")
+
+
+def _is_same_file(output: str, name: str) -> bool:
+    """Whether ``output`` already exists and is the same file as the input ``name``."""
+    if "-" in (output, name):
+        return False
+    try:
+        return Path(output).samefile(name)
+    except OSError:
+        return False
+
+
+def _close(name: str, stream: io.TextIOWrapper) -> None:
+    # Detach the standard streams so that closing the wrapper leaves them open.
+    if name == "-":
+        stream.detach()
+    else:
+        stream.close()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the ``persian-normalize`` command.
+
+    Every input is opened before the output, so a missing input fails before
+    the output is created or truncated, and an output that is also an input is
+    refused. Input that cannot be read or decoded midway is reported with exit
+    status 1.
+
+    Args:
+        argv: Command-line arguments, defaulting to ``sys.argv[1:]``.
+
+    Returns:
+        Process exit status.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be a positive integer")
+    if args.buffer_size < 1:
+        parser.error("--buffer-size must be a positive integer")
+    try:
+        codecs.lookup(args.encoding)
+    except LookupError:
+        parser.error(f"unknown encoding {args.encoding!r}")
+    for name in args.inputs:
+        if _is_same_file(args.output, name):
+            parser.error(f"output {args.output!r} is also an input")
+
+    streams: list[tuple[str, io.TextIOWrapper]] = []
+    try:
+        for name in args.inputs:
+            try:
+                streams.append((name, _open_input(name, args.encoding)))
+            except OSError as error:
+                parser.error(f"cannot read {name!r}: {error.strerror or error}")
+        try:
+            output = _open_output(args.output, args.encoding)
+        except OSError as error:
+            parser.error(f"cannot write {args.output!r}: {error.strerror or error}")
+        try:
+            for name, stream in streams:
+                try:
+                    for piece in normalize_stream(
+                        stream,
+                        convert_numbers=args.convert_numbers,
+                        convert_characters=args.convert_characters,
+                        fix_spacing=args.fix_spacing,
+                        normalize_presentation_forms=args.normalize_presentation_forms,
+                        buffer_size=args.buffer_size,
+                        workers=args.workers,
+                    ):
+                        output.write(piece)
+                except (OSError, UnicodeDecodeError) as error:
+                    print(f"{parser.prog}: error: {name}: {error}", file=sys.stderr)
+                    return 1
+        finally:
+            output.flush()
+            _close(args.output, output)
+    finally:
+        for name, stream in streams:
+            _close(name, stream)
+    return 0
+
+
+__all__ = ["main"]
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+import unicodedata
+from collections.abc import Callable, Mapping
 from typing import Final
 
 # Character sets
@@ -56,6 +58,53 @@ AR_TO_FA_DIGITS_TABLE: Final = str.maketrans(
     }
 )
 
+# Number separators of Arabic-script locales, Persian included
+AR_THOUSANDS_SEPARATOR: Final[str] = "\u066c"
+AR_DECIMAL_SEPARATOR: Final[str] = "\u066b"
+
+# Number words. Tens and hundreds are indexed by their digit, and scales by the power
+# of 1000 they name (short scale, as used in Iran).
+FA_ONES_WORDS: Final = ("صفر", "یک", "دو", "سه", "چهار", "پنج", "شش", "هفت", "هشت", "نه")
+FA_TEENS_WORDS: Final = (
+    "ده",
+    "یازده",
+    "دوازده",
+    "سیزده",
+    "چهارده",
+    "پانزده",
+    "شانزده",
+    "هفده",
+    "هجده",
+    "نوزده",
+)
+FA_TENS_WORDS: Final = ("", "", "بیست", "سی", "چهل", "پنجاه", "شصت", "هفتاد", "هشتاد", "نود")
+FA_HUNDREDS_WORDS: Final = (
+    "",
+    "صد",
+    "دویست",
+    "سیصد",
+    "چهارصد",
+    "پانصد",
+    "ششصد",
+    "هفتصد",
+    "هشتصد",
+    "نهصد",
+)
+FA_SCALE_WORDS: Final = (
+    "",
+    "هزار",
+    "میلیون",
+    "میلیارد",
+    "تریلیون",
+    "کوادریلیون",
+    "کوینتیلیون",
+    "سکستیلیون",
+    "سپتیلیون",
+    "اکتیلیون",
+    "نونیلیون",
+    "دسیلیون",
+)
+
 EN_TO_FA_KEYBOARD_TABLE: Final = str.maketrans(
     {
         "q": "ض",
@@ -92,6 +141,10 @@ EN_TO_FA_KEYBOARD_TABLE: Final = str.maketrans(
         "?": "؟",
     }
 )
+# The same keys read the other way: Persian letters typed on the English layout
+FA_TO_EN_KEYBOARD_TABLE: Final = {
+    ord(value): chr(key) for key, value in EN_TO_FA_KEYBOARD_TABLE.items()
+}
 
 AR_TO_FA_CHARS_TABLE: Final = str.maketrans(
     {
@@ -101,7 +154,7 @@ AR_TO_FA_CHARS_TABLE: Final = str.maketrans(
     }
 )
 
-# Arabic diacritic mappings still require sequential replacements because of composed forms.
+# Composed Arabic diacritic forms, applied in order (compiled into one scan by persian.core).
 AR_DIACRITICS_MAPPING: Final[tuple[tuple[str, str], ...]] = (
     ("دِ", "د"),
     ("بِ", "ب"),
@@ -115,10 +168,100 @@ AR_DIACRITICS_MAPPING: Final[tuple[tuple[str, str], ...]] = (
 _AR_DIACRITICS = "\u064b\u064c\u064d\u064e\u064f\u0650\u0651\u0652"
 AR_DIACRITIC_REMOVAL_TABLE: Final = str.maketrans("", "", _AR_DIACRITICS)
 
-# Pre-compiled regex patterns for spacing fixes
-MI_PATTERN: Final[re.Pattern[str]] = re.compile(
-    r"((\s\u0645\u06CC)+([\s])+([\u0600-\u06EF]{1,}){1,})"
+
+def _compose_tables(*tables: Mapping[int, str]) -> dict[int, str]:
+    """Compose translation tables so one ``translate`` equals applying them in order."""
+    composed: dict[int, str] = {}
+    for table in tables:
+        composed = {key: value.translate(table) for key, value in composed.items()}
+        for key, value in table.items():
+            composed.setdefault(key, value)
+    return composed
+
+
+def _key_class(*tables: Mapping[int, object]) -> re.Pattern[str]:
+    """Compile a character class matching every key of the given translation tables."""
+    keys = sorted({chr(key) for table in tables for key in table})
+    return re.compile(f"[{re.escape(''.join(keys))}]")
+
+
+def _fold_presentation_forms() -> dict[int, str]:
+    """NFKC-fold Arabic Presentation Forms-A/B one character at a time."""
+    table: dict[int, str] = {}
+    for first, last in ((0xFB50, 0xFDFF), (0xFE70, 0xFEFF)):
+        for code in range(first, last + 1):
+            char = chr(code)
+            folded = unicodedata.normalize("NFKC", char)
+            if folded != char:
+                # Isolated harakat forms fold to a space plus the mark; keep only the mark
+                # so that a lone mark does not become a word break. The phrase ligatures
+                # U+FDFA and U+FDFB still fold to several words separated by spaces.
+                table[code] = folded.lstrip(" ")
+    return table
+
+
+# Tables and patterns below are built on first access (PEP 562), so importing this
+# module never pays for regex compilation or the presentation-form fold. The
+# annotations declare them for type checkers; ``__getattr__`` supplies the values.
+
+# Presentation forms (U+FB50..U+FDFF, U+FE70..U+FEFF) folded to their standard letters
+PRESENTATION_FORMS_TABLE: dict[int, str]
+
+# Pre-scan patterns detecting whether a translation would change anything
+EN_DIGITS_PATTERN: re.Pattern[str]
+FA_DIGITS_PATTERN: re.Pattern[str]
+AR_DIGITS_PATTERN: re.Pattern[str]
+EN_KEYBOARD_PATTERN: re.Pattern[str]
+
+# Script detection (Arabic block U+0600..U+06FF, which hosts Persian)
+SCRIPT_RUN_PATTERN: re.Pattern[str]
+_SCRIPT_RUN_REGEX: Final = (
+    r"(?P<persian>[\u0600-\u065F\u066A-\u06EF\u06FA-\u06FF\u200C]+)"
+    r"|(?P<persian_digits>[\u06F0-\u06F9]+)"
+    r"|(?P<arabic_digits>[\u0660-\u0669]+)"
+    r"|(?P<latin>[A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u024F]+)"
+    r"|(?P<digits>[0-9]+)"
+    r"|(?P<whitespace>\s+)"
 )
-DE_YII_PATTERN: Final[re.Pattern[str]] = re.compile(
-    r"(([\u0600-\u06EF]{1,})+([\s])+(ای|ایی|اند|ایم|اید|ام){1})"
+
+# Regex patterns for spacing fixes. Both run in linear time: no quantified group nests
+# another quantifier, and whitespace runs are possessive since a letter or a suffix can
+# never start with whitespace. The groups match the original definitions, so
+# "\\2\u200c\\4" still yields the same replacements. A DE_YII match consumes only the
+# letter before the space, which gives the same replacements and the same resume point
+# for the next match, but never tries every split of a long letter run.
+MI_PATTERN: re.Pattern[str]
+DE_YII_PATTERN: re.Pattern[str]
+_MI_REGEX: Final = r"((\s\u0645\u06CC)+(\s)++([\u0600-\u06EF]+))"
+_DE_YII_REGEX: Final = r"(([\u0600-\u06EF])(\s)++(ای|ایی|اند|ایم|اید|ام))"
+
+# MI_PATTERN and DE_YII_PATTERN fused into a single scan. A suffix that directly follows
+# a "می" verb stem is captured by the first branch so both fixes land in one match.
+FA_SPACING_PATTERN: re.Pattern[str]
+_FA_SPACING_REGEX: Final = (
+    r"(\s\u0645\u06CC)+\s++([\u0600-\u06EF]+)(?:\s++(ای|ایی|اند|ایم|اید|ام))?"
+    r"|([\u0600-\u06EF])\s++(ای|ایی|اند|ایم|اید|ام)"
 )
+
+_LAZY_CONSTANTS: Final[dict[str, Callable[[], object]]] = {
+    "PRESENTATION_FORMS_TABLE": _fold_presentation_forms,
+    "EN_DIGITS_PATTERN": lambda: _key_class(EN_TO_FA_DIGITS_TABLE),
+    "FA_DIGITS_PATTERN": lambda: _key_class(FA_TO_EN_DIGITS_TABLE),
+    "AR_DIGITS_PATTERN": lambda: _key_class(AR_TO_FA_DIGITS_TABLE),
+    "EN_KEYBOARD_PATTERN": lambda: _key_class(EN_TO_FA_KEYBOARD_TABLE),
+    "SCRIPT_RUN_PATTERN": lambda: re.compile(_SCRIPT_RUN_REGEX),
+    "MI_PATTERN": lambda: re.compile(_MI_REGEX),
+    "DE_YII_PATTERN": lambda: re.compile(_DE_YII_REGEX),
+    "FA_SPACING_PATTERN": lambda: re.compile(_FA_SPACING_REGEX),
+}
+
+
+def __getattr__(name: str) -> object:
+    """Build a lazy table or pattern on first access and keep it as a module global."""
+    try:
+        factory = _LAZY_CONSTANTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Concurrent first accesses may both build the value; either result is equivalent.
+    value = globals()[name] = factory()
+    return value
@@ -2,24 +2,92 @@
 
 from __future__ import annotations
 
-import urllib.parse
+import math
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Literal, overload
 
+from . import constants
 from .constants import (
+    AR_DECIMAL_SEPARATOR,
     AR_DIACRITIC_REMOVAL_TABLE,
     AR_DIACRITICS_MAPPING,
     AR_DIGITS,
+    AR_THOUSANDS_SEPARATOR,
     AR_TO_FA_CHARS_TABLE,
     AR_TO_FA_DIGITS_TABLE,
-    DE_YII_PATTERN,
+    EN_DIGITS,
     EN_TO_FA_DIGITS_TABLE,
     EN_TO_FA_KEYBOARD_TABLE,
     FA_DIGITS,
     FA_TO_EN_DIGITS_TABLE,
-    MI_PATTERN,
+    _compose_tables,
 )
 
+# The inner loops come from the C extension when it was built (see setup.py).
+try:
+    from ._speedups import count_range, has_range, replacer, translator
+except ImportError:  # pragma: no cover - depends on the build
+    from ._native import count_range, has_range, replacer, translator
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+    from .alignment import Alignment
+    from .instrumentation import Instrumentation
+
 MappingType = tuple[tuple[str, str], ...]
 
+# The enabled ``Instrumentation``, if any; see ``persian.instrumentation``. Each public
+# function checks it first, so while none is enabled a call pays one load and a branch.
+_collector: Instrumentation | None = None
+
+# Below this many rules, chained str.replace calls beat a single regex scan.
+_SINGLE_PASS_MIN_RULES = 8
+
+# ``int`` and ``float`` read the decimal digits of every script, so parsing only has
+# to rewrite the separators and the minus sign. ``str.replace`` returns the string
+# itself when there is nothing to replace, so a number without them is not copied.
+_NUMBER_PARSE_REPLACEMENTS = (
+    (AR_THOUSANDS_SEPARATOR, ""),
+    (",", ""),
+    (AR_DECIMAL_SEPARATOR, "."),
+    ("\u2212", "-"),
+)
+# What ``parse_number`` accepts beyond a plain digit run: thousands separators only
+# between groups of three digits, one kind per number, and no ``nan``, ``inf`` or
+# underscores, all of which ``int`` and ``float`` would otherwise let through.
+_NUMBER_PATTERN = re.compile(
+    r"\s*[-+\u2212]?"
+    r"(?:(?:\d{1,3}(?:,\d{3})+|\d{1,3}(?:\u066c\d{3})+|\d+)(?:[.\u066b]\d*)?|[.\u066b]\d+)"
+    r"(?:[eE][-+\u2212]?\d+)?\s*"
+)
+
+_en_to_fa_digits = translator(EN_TO_FA_DIGITS_TABLE)
+_en_to_fa_keyboard = translator(EN_TO_FA_KEYBOARD_TABLE)
+_ar_to_fa_digits = translator(AR_TO_FA_DIGITS_TABLE)
+_fa_to_en_digits = translator(FA_TO_EN_DIGITS_TABLE)
+_ar_to_fa_chars = translator(AR_TO_FA_CHARS_TABLE)
+_remove_ar_diacritics = translator(AR_DIACRITIC_REMOVAL_TABLE)
+
+# Code point ranges of the script predicates
+_FA_DIGITS_RANGE = (ord(FA_DIGITS[0]), ord(FA_DIGITS[-1]))
+_AR_DIGITS_RANGE = (ord(AR_DIGITS[0]), ord(AR_DIGITS[-1]))
+_PERSIAN_BLOCK_RANGE = (0x0600, 0x06FF)
+
+# Formatted ASCII numbers to each digit set. Persian and Arabic digits take the Arabic
+# separators; "en" keeps the ASCII ones.
+_AR_SEPARATORS_TABLE = {ord(","): AR_THOUSANDS_SEPARATOR, ord("."): AR_DECIMAL_SEPARATOR}
+_NUMBER_FORMAT_TABLES: dict[str, dict[int, str]] = {
+    "fa": _compose_tables(EN_TO_FA_DIGITS_TABLE, _AR_SEPARATORS_TABLE),
+    "ar": {
+        **_AR_SEPARATORS_TABLE,
+        **{ord(en): ar for en, ar in zip(EN_DIGITS, AR_DIGITS, strict=True)},
+    },
+    "en": {},
+}
+
 
 def _validate_string_input(input_str: str, param_name: str = "input_str") -> None:
     """Validate that the provided input is a non-None string."""
@@ -29,14 +97,89 @@ def _validate_string_input(input_str: str, param_name: str = "input_str") -> Non
         raise TypeError(f"{param_name} must be str, got {type(input_str).__name__}")
 
 
-def _multiple_replace(mapping: MappingType, text: str) -> str:
-    """Replace all mapping keys within a text sequentially (legacy helper)."""
+def _replace_sequentially(mapping: MappingType, text: str) -> str:
+    """Replace all mapping keys within a text one rule after another."""
     result = text
     for old, new in mapping:
         result = result.replace(old, new)
     return result
 
 
+def _is_single_pass_safe(mapping: MappingType) -> bool:
+    """Check that one simultaneous scan gives the same result as ordered replacement.
+
+    This holds when no two keys overlap or nest (so matches never compete) and
+    no replacement can contribute characters to a key of a later rule (so no
+    rule would have matched text produced by an earlier one).
+    """
+    keys = [old for old, _ in mapping]
+    if any(not old or not new for old, new in mapping) or len(set(keys)) != len(keys):
+        return False
+    for first in keys:
+        for second in keys:
+            if first == second:
+                continue
+            if first in second:
+                return False
+            if any(first.endswith(second[:size]) for size in range(1, len(second))):
+                return False
+    return all(
+        not set(new) & set(later)
+        for index, (_, new) in enumerate(mapping)
+        for later in keys[index + 1 :]
+    )
+
+
+@lru_cache(maxsize=32)
+def _alternation(mapping: MappingType) -> re.Pattern[str]:
+    """Compile the keys of ``mapping`` into one longest-first alternation."""
+    keys = sorted({old for old, _ in mapping}, key=len, reverse=True)
+    return re.compile("|".join(re.escape(old) for old in keys))
+
+
+@lru_cache(maxsize=32)
+def _compile_replacer(mapping: MappingType) -> Callable[[str], str]:
+    """Compile ``mapping`` into a function equivalent to ordered ``str.replace`` calls.
+
+    Texts lacking a character shared by every key are returned untouched after
+    one ``in`` check. Larger mappings that pass ``_is_single_pass_safe`` are
+    applied in a single scan by ``replacer``; small ones keep the sequential
+    loop, whose C-level ``str.replace`` calls are faster there.
+    """
+    if not mapping:
+        return lambda text: text
+    shared = set.intersection(*(set(old) for old, _ in mapping))
+    marker = min(shared) if shared else ""
+
+    if len(mapping) < _SINGLE_PASS_MIN_RULES or not _is_single_pass_safe(mapping):
+
+        def replace(text: str) -> str:
+            if marker not in text:
+                return text
+            return _replace_sequentially(mapping, text)
+
+        return replace
+
+    # Longest keys first, so that the first key matching at a position is the longest.
+    pairs = sorted(dict(mapping).items(), key=lambda pair: len(pair[0]), reverse=True)
+    replace_all = replacer(pairs)
+
+    def replace(text: str) -> str:
+        if marker not in text:
+            return text
+        return replace_all(text)
+
+    return replace
+
+
+def _multiple_replace(mapping: MappingType, text: str) -> str:
+    """Replace all mapping keys within a text, as if applied sequentially in order."""
+    return _compile_replacer(mapping)(text)
+
+
+_replace_ar_diacritics = _compile_replacer(AR_DIACRITICS_MAPPING)
+
+
 def convert_en_numbers(input_str: str) -> str:
     """Convert English digits to Persian digits.
 
@@ -54,8 +197,10 @@ def convert_en_numbers(input_str: str) -> str:
         >>> convert_en_numbers("Phone 123")
         'Phone ۱۲۳'
     """
+    if (collector := _collector) is not None and collector._enters(convert_en_numbers):
+        return collector._measure(convert_en_numbers, input_str)
     _validate_string_input(input_str)
-    return input_str.translate(EN_TO_FA_DIGITS_TABLE)
+    return _en_to_fa_digits(input_str)
 
 
 def convert_en_characters(input_str: str) -> str:
@@ -75,8 +220,10 @@ def convert_en_characters(input_str: str) -> str:
         >>> convert_en_characters("sghl")
         'سلام'
     """
+    if (collector := _collector) is not None and collector._enters(convert_en_characters):
+        return collector._measure(convert_en_characters, input_str)
     _validate_string_input(input_str)
-    return input_str.translate(EN_TO_FA_KEYBOARD_TABLE)
+    return _en_to_fa_keyboard(input_str)
 
 
 def convert_ar_numbers(input_str: str) -> str:
@@ -96,8 +243,10 @@ def convert_ar_numbers(input_str: str) -> str:
         >>> convert_ar_numbers("٣٤٥")
         '۳۴۵'
     """
+    if (collector := _collector) is not None and collector._enters(convert_ar_numbers):
+        return collector._measure(convert_ar_numbers, input_str)
     _validate_string_input(input_str)
-    return input_str.translate(AR_TO_FA_DIGITS_TABLE)
+    return _ar_to_fa_digits(input_str)
 
 
 def convert_fa_numbers(input_str: str) -> str:
@@ -117,8 +266,137 @@ def convert_fa_numbers(input_str: str) -> str:
         >>> convert_fa_numbers("۱۲۳")
         '123'
     """
+    if (collector := _collector) is not None and collector._enters(convert_fa_numbers):
+        return collector._measure(convert_fa_numbers, input_str)
     _validate_string_input(input_str)
-    return input_str.translate(FA_TO_EN_DIGITS_TABLE)
+    return _fa_to_en_digits(input_str)
+
+
+def parse_number(input_str: str) -> int | float:
+    """Parse a number written with Persian, Arabic or English digits.
+
+    Thousands separators (Arabic U+066C or ",") are dropped, and the Arabic
+    decimal separator U+066B or "." starts the fraction. Separators must split
+    the integer part into groups of three digits, and ``nan``, ``inf`` and
+    underscores are rejected. A number without a
+    fraction or exponent parses to ``int``, any other to ``float``. Surrounding
+    whitespace is ignored, as by ``int`` and ``float``.
+
+    Args:
+        input_str: Text holding a single number.
+
+    Returns:
+        The parsed number.
+
+    Raises:
+        TypeError: If `input_str` is not a string.
+        ValueError: If `input_str` is None or is not a number.
+
+    Examples:
+        >>> parse_number("۲٬۳۴۴")
+        2344
+        >>> parse_number("٣٤.٢")
+        34.2
+    """
+    if (collector := _collector) is not None and collector._enters(parse_number):
+        return collector._measure(parse_number, input_str)
+    _validate_string_input(input_str)
+    if input_str.isdecimal():
+        return int(input_str)
+    return _parse_number(input_str)
+
+
+def _parse_number(text: str) -> int | float:
+    """Parse a number that is not a plain digit run; see ``parse_number``."""
+    if _NUMBER_PATTERN.fullmatch(text) is None:
+        raise ValueError(f"could not parse a number from {text!r}")
+    cleaned = text
+    for old, new in _NUMBER_PARSE_REPLACEMENTS:
+        cleaned = cleaned.replace(old, new)
+    if "." not in cleaned:
+        try:
+            return int(cleaned)
+        except ValueError:
+            pass
+    number = float(cleaned)
+    if not math.isfinite(number):
+        raise ValueError(f"{text!r} is out of the range of a float")
+    return number
+
+
+def format_number(
+    number: int | float | Decimal,
+    *,
+    digits: Literal["fa", "ar", "en"] = "fa",
+    grouping: bool = True,
+    decimals: int | None = None,
+) -> str:
+    """Write a number with Persian or Arabic digits and separators.
+
+    Args:
+        number: Number to format.
+        digits: ``"fa"`` for Persian digits, ``"ar"`` for Arabic digits, both
+            with the Arabic separators U+066C and U+066B, or ``"en"`` for ASCII.
+        grouping: Whether to separate thousands.
+        decimals: Number of digits after the decimal separator. By default
+            ``number`` is written with the digits ``str`` would show, but
+            always in fixed notation, never with an exponent.
+
+    Returns:
+        The formatted number.
+
+    Raises:
+        TypeError: If `number` is not a number.
+        ValueError: If `digits` is unknown or `decimals` is negative.
+
+    Examples:
+        >>> format_number(2344)
+        '۲٬۳۴۴'
+        >>> format_number(2344, digits="ar", grouping=False)
+        '٢٣٤٤'
+    """
+    if (collector := _collector) is not None and collector._enters(format_number):
+        return collector._measure(
+            format_number, number, digits=digits, grouping=grouping, decimals=decimals
+        )
+    table = _number_format_table(digits)
+    if decimals is not None and decimals < 0:
+        raise ValueError(f"decimals must not be negative, got {decimals}")
+    return _format_number(number, _number_format_spec(grouping, decimals)).translate(table)
+
+
+def _number_format_table(digits: str) -> dict[int, str]:
+    try:
+        return _NUMBER_FORMAT_TABLES[digits]
+    except KeyError:
+        raise ValueError(f"digits must be 'fa', 'ar' or 'en', got {digits!r}") from None
+
+
+def _number_format_spec(grouping: bool, decimals: int | None) -> str:
+    spec = "," if grouping else ""
+    return spec if decimals is None else f"{spec}.{decimals}f"
+
+
+def _format_number(number: int | float | Decimal, spec: str) -> str:
+    """Format ``number`` in ASCII; strings and other objects raise ``TypeError``."""
+    if isinstance(number, (str, bool)):
+        raise TypeError(f"number must be int, float or Decimal, got {type(number).__name__}")
+    try:
+        text = format(number, spec)
+    except (TypeError, ValueError) as error:
+        raise TypeError(
+            f"number must be int, float or Decimal, got {type(number).__name__}"
+        ) from error
+    if "e" in text or "E" in text:
+        # Without a precision, floats and Decimals of large or small magnitude switch to
+        # exponent notation. Write them in full instead, with the digits of the shortest
+        # repr of a float, which has no trailing zeros.
+        from decimal import Decimal
+
+        if isinstance(number, float):
+            number = Decimal(float.__repr__(number))
+        text = format(number, f"{spec}f")
+    return text
 
 
 def convert_ar_characters(input_str: str) -> str:
@@ -138,9 +416,11 @@ def convert_ar_characters(input_str: str) -> str:
         >>> convert_ar_characters("علي")
         'علی'
     """
+    if (collector := _collector) is not None and collector._enters(convert_ar_characters):
+        return collector._measure(convert_ar_characters, input_str)
     _validate_string_input(input_str)
-    result = _multiple_replace(AR_DIACRITICS_MAPPING, input_str)
-    return result.translate(AR_TO_FA_CHARS_TABLE)
+    result = _replace_ar_diacritics(input_str)
+    return _ar_to_fa_chars(result)
 
 
 def convert_fa_spaces(input_value: str) -> str:
@@ -160,10 +440,12 @@ def convert_fa_spaces(input_value: str) -> str:
         >>> convert_fa_spaces("می روم به خانه")
         'می‌روم به خانه'
     """
+    if (collector := _collector) is not None and collector._enters(convert_fa_spaces):
+        return collector._measure(convert_fa_spaces, input_value)
     _validate_string_input(input_value, "input_value")
     repl = "\\2\u200c\\4"
-    result = MI_PATTERN.sub(repl, input_value)
-    return DE_YII_PATTERN.sub(repl, result)
+    result = constants.MI_PATTERN.sub(repl, input_value)
+    return constants.DE_YII_PATTERN.sub(repl, result)
 
 
 def decode_url(input_str: str) -> str:
@@ -183,17 +465,47 @@ def decode_url(input_str: str) -> str:
         >>> decode_url("https://example/%D8%B5%D9%81%D8%AD%D9%87")
         'https://example/صفحه'
     """
+    if (collector := _collector) is not None and collector._enters(decode_url):
+        return collector._measure(decode_url, input_str)
     _validate_string_input(input_str)
+    import urllib.parse
+
     return urllib.parse.unquote(input_str)
 
 
+@overload
+def normalize_persian(
+    input_str: str,
+    *,
+    convert_numbers: bool = ...,
+    convert_characters: bool = ...,
+    fix_spacing: bool = ...,
+    normalize_presentation_forms: bool = ...,
+    return_alignment: Literal[False] = ...,
+) -> str: ...
+
+
+@overload
+def normalize_persian(
+    input_str: str,
+    *,
+    convert_numbers: bool = ...,
+    convert_characters: bool = ...,
+    fix_spacing: bool = ...,
+    normalize_presentation_forms: bool = ...,
+    return_alignment: Literal[True],
+) -> tuple[str, Alignment]: ...
+
+
 def normalize_persian(
     input_str: str,
     *,
     convert_numbers: bool = True,
     convert_characters: bool = True,
     fix_spacing: bool = True,
-) -> str:
+    normalize_presentation_forms: bool = False,
+    return_alignment: bool = False,
+) -> str | tuple[str, Alignment]:
     """Normalize Persian text by applying optional conversions.
 
     Args:
@@ -201,9 +513,16 @@ def normalize_persian(
         convert_numbers: Whether to convert Arabic digits to Persian.
         convert_characters: Whether to convert Arabic characters to Persian.
         fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            (U+FB50..U+FDFF, U+FE70..U+FEFF) to standard letters, in the same
+            translation as the Arabic letters and without applying NFKC to the
+            rest of the text.
+        return_alignment: Whether to also return an ``Alignment`` mapping
+            offsets in the normalized text back to ``input_str``.
 
     Returns:
-        Normalized Persian text.
+        Normalized Persian text, or a ``(text, alignment)`` pair when
+        `return_alignment` is true.
 
     Raises:
         TypeError: If `input_str` is not a string.
@@ -213,17 +532,52 @@ def normalize_persian(
         >>> normalize_persian("سلام ٣٤٥ می آیم")
         'سلام ۳۴۵ می‌آیم'
     """
+    if (collector := _collector) is not None and collector._enters(normalize_persian):
+        return collector._measure(
+            normalize_persian,
+            input_str,
+            convert_numbers=convert_numbers,
+            convert_characters=convert_characters,
+            fix_spacing=fix_spacing,
+            normalize_presentation_forms=normalize_presentation_forms,
+            return_alignment=return_alignment,
+        )
     _validate_string_input(input_str)
+    if return_alignment:
+        from .normalizer import Normalizer
+
+        normalizer = Normalizer(
+            convert_numbers=convert_numbers,
+            convert_characters=convert_characters,
+            fix_spacing=fix_spacing,
+            normalize_presentation_forms=normalize_presentation_forms,
+        )
+        return normalizer.normalize_with_alignment(input_str)
     result = input_str
     if convert_numbers:
         result = convert_ar_numbers(result)
-    if convert_characters:
+    if normalize_presentation_forms:
+        # The forms fold in the same translate pass as the Arabic letters. Neither table
+        # touches the digits or the composed diacritic forms, so those can run around it.
+        result = _presentation_forms_translator(convert_characters)(result)
+        if convert_characters:
+            result = _replace_ar_diacritics(result)
+    elif convert_characters:
         result = convert_ar_characters(result)
     if fix_spacing:
         result = convert_fa_spaces(result)
     return result
 
 
+@lru_cache(maxsize=2)
+def _presentation_forms_translator(convert_characters: bool) -> Callable[[str], str]:
+    """Translator folding presentation forms, and Arabic letters when converting them."""
+    tables = [constants.PRESENTATION_FORMS_TABLE]
+    if convert_characters:
+        tables.append(AR_TO_FA_CHARS_TABLE)
+    return translator(_compose_tables(*tables))
+
+
 def contains_persian_digits(input_str: str) -> bool:
     """Check whether the text contains Persian digits.
 
@@ -237,8 +591,10 @@ def contains_persian_digits(input_str: str) -> bool:
         TypeError: If `input_str` is not a string.
         ValueError: If `input_str` is None.
     """
+    if (collector := _collector) is not None and collector._enters(contains_persian_digits):
+        return collector._measure(contains_persian_digits, input_str)
     _validate_string_input(input_str)
-    return any(char in FA_DIGITS for char in input_str)
+    return has_range(input_str, *_FA_DIGITS_RANGE)
 
 
 def contains_arabic_digits(input_str: str) -> bool:
@@ -254,8 +610,10 @@ def contains_arabic_digits(input_str: str) -> bool:
         TypeError: If `input_str` is not a string.
         ValueError: If `input_str` is None.
     """
+    if (collector := _collector) is not None and collector._enters(contains_arabic_digits):
+        return collector._measure(contains_arabic_digits, input_str)
     _validate_string_input(input_str)
-    return any(char in AR_DIGITS for char in input_str)
+    return has_range(input_str, *_AR_DIGITS_RANGE)
 
 
 def is_persian_text(input_str: str) -> bool:
@@ -271,8 +629,93 @@ def is_persian_text(input_str: str) -> bool:
         TypeError: If `input_str` is not a string.
         ValueError: If `input_str` is None.
     """
+    if (collector := _collector) is not None and collector._enters(is_persian_text):
+        return collector._measure(is_persian_text, input_str)
+    _validate_string_input(input_str)
+    return has_range(input_str, *_PERSIAN_BLOCK_RANGE)
+
+
+def count_persian_chars(input_str: str) -> int:
+    """Count the characters that fall inside the Persian Unicode block.
+
+    Args:
+        input_str: Text to inspect.
+
+    Returns:
+        Number of characters in the range U+0600..U+06FF.
+
+    Raises:
+        TypeError: If `input_str` is not a string.
+        ValueError: If `input_str` is None.
+
+    Examples:
+        >>> count_persian_chars("Hello سلام ۱۲")
+        6
+    """
+    if (collector := _collector) is not None and collector._enters(count_persian_chars):
+        return collector._measure(count_persian_chars, input_str)
+    _validate_string_input(input_str)
+    return count_range(input_str, *_PERSIAN_BLOCK_RANGE)
+
+
+def persian_ratio(input_str: str) -> float:
+    """Return the share of non-whitespace characters that are Persian.
+
+    Args:
+        input_str: Text to inspect.
+
+    Returns:
+        A value between 0.0 and 1.0; 0.0 for empty or whitespace-only text.
+
+    Raises:
+        TypeError: If `input_str` is not a string.
+        ValueError: If `input_str` is None.
+
+    Examples:
+        >>> persian_ratio("سلام ab")
+        0.6666666666666666
+    """
+    if (collector := _collector) is not None and collector._enters(persian_ratio):
+        return collector._measure(persian_ratio, input_str)
+    profile = script_profile(input_str)
+    visible = len(input_str) - profile["whitespace"]
+    if not visible:
+        return 0.0
+    persian = profile["persian"] + profile["persian_digits"] + profile["arabic_digits"]
+    return persian / visible
+
+
+def script_profile(input_str: str) -> dict[str, int]:
+    """Count characters per script class in a single pass.
+
+    The keys are ``persian`` (Persian block letters, marks, punctuation and ZWNJ),
+    ``persian_digits``, ``arabic_digits``, ``latin``, ``digits`` (ASCII),
+    ``whitespace`` and ``other``; all of them are always present.
+
+    Args:
+        input_str: Text to inspect.
+
+    Returns:
+        A mapping from script class to character count.
+
+    Raises:
+        TypeError: If `input_str` is not a string.
+        ValueError: If `input_str` is None.
+
+    Examples:
+        >>> script_profile("سال ۱۴۰۲ is 2023")["persian_digits"]
+        4
+    """
+    if (collector := _collector) is not None and collector._enters(script_profile):
+        return collector._measure(script_profile, input_str)
     _validate_string_input(input_str)
-    return any("\u0600" <= char <= "\u06ff" for char in input_str)
+    profile = dict.fromkeys(constants.SCRIPT_RUN_PATTERN.groupindex, 0)
+    for match in constants.SCRIPT_RUN_PATTERN.finditer(input_str):
+        kind = match.lastgroup
+        if kind is not None:
+            profile[kind] += match.end() - match.start()
+    profile["other"] = len(input_str) - sum(profile.values())
+    return profile
 
 
 def remove_arabic_diacritics(input_str: str) -> str:
@@ -288,8 +731,10 @@ def remove_arabic_diacritics(input_str: str) -> str:
         TypeError: If `input_str` is not a string.
         ValueError: If `input_str` is None.
     """
+    if (collector := _collector) is not None and collector._enters(remove_arabic_diacritics):
+        return collector._measure(remove_arabic_diacritics, input_str)
     _validate_string_input(input_str)
-    return input_str.translate(AR_DIACRITIC_REMOVAL_TABLE)
+    return _remove_ar_diacritics(input_str)
 
 
 __all__ = [
@@ -301,8 +746,13 @@ __all__ = [
     "convert_en_numbers",
     "convert_fa_numbers",
     "convert_fa_spaces",
+    "count_persian_chars",
     "decode_url",
+    "format_number",
     "is_persian_text",
     "normalize_persian",
+    "parse_number",
+    "persian_ratio",
     "remove_arabic_diacritics",
+    "script_profile",
 ]
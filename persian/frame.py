@@ -0,0 +1,264 @@
+"""Bulk normalization of pandas and Arrow string columns.
+
+Importing this module registers a ``persian`` accessor on ``pandas.Series``,
+so a column normalizes with ``df[column].persian.normalize()``. Arrow-backed
+columns are processed by whole-array kernels; other columns fall back to
+chunked batching. Missing values are preserved either way.
+
+Requires the ``frame`` extra (pandas and pyarrow).
+"""
+
+from __future__ import annotations
+
+import re
+from functools import cache
+from typing import TYPE_CHECKING, TypeVar
+
+try:
+    import pandas as pd
+except ImportError as error:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "persian.frame requires pandas; install it with: pip install 'persian[frame]'"
+    ) from error
+
+from .batch import DEFAULT_CHUNK_SIZE, _normalize_many, _validate_chunk_size
+from .binary import ByteTranslator
+from .constants import (
+    _DE_YII_REGEX,
+    _MI_REGEX,
+    AR_DIACRITICS_MAPPING,
+    AR_TO_FA_CHARS_TABLE,
+    AR_TO_FA_DIGITS_TABLE,
+    _compose_tables,
+)
+from .normalizer import Normalizer
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+ArrowStrings = TypeVar("ArrowStrings", "pa.Array", "pa.ChunkedArray")
+
+# Every composed diacritic form carries a kasra.
+_KASRA = "\u0650"
+
+
+@cache
+def _table_translator(convert_numbers: bool, convert_characters: bool) -> ByteTranslator | None:
+    """Byte translator for the enabled digit and letter tables, if any.
+
+    Every key and value of these tables is two bytes long in UTF-8, so the
+    translation can rewrite an Arrow data buffer without touching its offsets.
+    """
+    tables = []
+    if convert_numbers:
+        tables.append(AR_TO_FA_DIGITS_TABLE)
+    if convert_characters:
+        tables.append(AR_TO_FA_CHARS_TABLE)
+    return ByteTranslator(_compose_tables(*tables)) if tables else None
+
+
+@cache
+def _re2_spacing_patterns() -> tuple[str, str]:
+    """Spell ``MI_PATTERN`` and ``DE_YII_PATTERN`` in the RE2 syntax of Arrow's kernels.
+
+    RE2's ``\\s`` only covers ASCII whitespace, so it becomes an explicit class
+    of every character Python's ``\\s`` matches (all of them lie in the BMP).
+    RE2 never backtracks, so possessive quantifiers become greedy ones.
+    """
+    spaces = "".join(f"\\x{{{code:04X}}}" for code in range(0x10000) if chr(code).isspace())
+
+    def convert(pattern: str) -> str:
+        pattern = re.sub(r"\\u([0-9A-Fa-f]{4})", r"\\x{\1}", pattern)
+        return pattern.replace("++", "+").replace(r"\s", f"[{spaces}]")
+
+    return convert(_MI_REGEX), convert(_DE_YII_REGEX)
+
+
+def _translate_data(array: pa.Array, translator: ByteTranslator) -> pa.Array:
+    """Apply a length-preserving byte translator to the data buffer of a string array."""
+    import pyarrow as pa
+
+    validity, offsets, data = array.buffers()
+    if data is None or data.size == 0:
+        return array
+    translated = pa.py_buffer(translator(memoryview(data)))
+    return pa.Array.from_buffers(
+        array.type, len(array), [validity, offsets, translated], array.null_count, array.offset
+    )
+
+
+def _normalize_array(array: pa.Array, normalizer: Normalizer, chunk_size: int) -> pa.Array:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if pa.types.is_null(array.type):
+        return array
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        raise TypeError(f"array must hold strings, got {array.type}")
+    # The kernel wrappers of pyarrow.compute are generated at import time, so the
+    # kernels are called by name.
+    call = pc.call_function
+    if normalizer.normalize_presentation_forms:
+        # Hundreds of folds of varying lengths: normalize the present values in batches.
+        values = list(_normalize_many(array.drop_null().to_pylist(), normalizer, chunk_size))
+        return call("replace_with_mask", [array, array.is_valid(), pa.array(values, array.type)])
+    translator = _table_translator(normalizer.convert_numbers, normalizer.convert_characters)
+    if translator is not None:
+        array = _translate_data(array, translator)
+    if normalizer.convert_characters:
+        marked = call("match_substring", [array], pc.MatchSubstringOptions(_KASRA))
+        if call("any", [marked]).as_py():
+            for old, new in AR_DIACRITICS_MAPPING:
+                options = pc.ReplaceSubstringOptions(old, new)
+                array = call("replace_substring", [array], options)
+    if normalizer.fix_spacing:
+        for pattern in _re2_spacing_patterns():
+            options = pc.ReplaceSubstringOptions(pattern, "\\2\u200c\\4")
+            array = call("replace_substring_regex", [array], options)
+    return array
+
+
+def normalize_arrow(
+    array: ArrowStrings,
+    *,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    fix_spacing: bool = True,
+    normalize_presentation_forms: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ArrowStrings:
+    """Normalize every string of an Arrow array like ``normalize_persian``.
+
+    Digit and letter tables are applied to the whole data buffer at once,
+    composed diacritic forms and spacing rules by Arrow's string kernels.
+    Presentation forms are folded by ``normalize_many`` on the present values.
+    Nulls stay null.
+
+    Args:
+        array: ``string`` or ``large_string`` array, possibly chunked.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+        chunk_size: Number of strings per batch when falling back to
+            ``normalize_many``.
+
+    Returns:
+        An array of the same type and length.
+
+    Raises:
+        TypeError: If the array does not hold strings.
+        ValueError: If `chunk_size` is not positive.
+
+    Examples:
+        >>> normalize_arrow(pa.array(["من می روم", None])).to_pylist()
+        ['من می\\u200cروم', None]
+    """
+    import pyarrow as pa
+
+    _validate_chunk_size(chunk_size)
+    normalizer = Normalizer(
+        convert_numbers=convert_numbers,
+        convert_characters=convert_characters,
+        fix_spacing=fix_spacing,
+        normalize_presentation_forms=normalize_presentation_forms,
+    )
+    if isinstance(array, pa.ChunkedArray):
+        chunks = [_normalize_array(chunk, normalizer, chunk_size) for chunk in array.chunks]
+        return pa.chunked_array(chunks, type=array.type)
+    return _normalize_array(array, normalizer, chunk_size)
+
+
+def _is_arrow_backed(dtype: object) -> bool:
+    return isinstance(dtype, pd.ArrowDtype) or (
+        isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+    )
+
+
+def normalize_series(
+    series: pd.Series,
+    *,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    fix_spacing: bool = True,
+    normalize_presentation_forms: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> pd.Series:
+    """Normalize a pandas string column like ``normalize_persian``, keeping missing values.
+
+    Arrow-backed columns (``str`` in pandas 3, ``string[pyarrow]`` and
+    ``ArrowDtype`` strings) go through ``normalize_arrow`` without copying to
+    Python objects. Other columns are normalized with ``normalize_many``,
+    ``chunk_size`` values at a time. The result keeps the dtype, index and
+    name of ``series``.
+
+    Args:
+        series: Column of strings and missing values.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+        chunk_size: Number of strings processed per batch.
+
+    Returns:
+        The normalized column.
+
+    Raises:
+        TypeError: If a present value is not a string.
+        ValueError: If `chunk_size` is not positive.
+    """
+    options = {
+        "convert_numbers": convert_numbers,
+        "convert_characters": convert_characters,
+        "fix_spacing": fix_spacing,
+        "normalize_presentation_forms": normalize_presentation_forms,
+    }
+    if _is_arrow_backed(series.dtype):
+        import pyarrow as pa
+
+        values = normalize_arrow(pa.array(series.array), chunk_size=chunk_size, **options)
+        return pd.Series(
+            pd.array(values, dtype=series.dtype), index=series.index, name=series.name, copy=False
+        )
+    _validate_chunk_size(chunk_size)
+    present = series.notna()
+    result = series.copy()
+    result[present] = list(_normalize_many(series[present], Normalizer(**options), chunk_size))
+    return result
+
+
+@pd.api.extensions.register_series_accessor("persian")
+class PersianSeriesAccessor:
+    """The ``Series.persian`` namespace.
+
+    Examples:
+        >>> pd.Series(["سلام ٣٤٥", None]).persian.normalize().tolist()
+        ['سلام ۳۴۵', nan]
+    """
+
+    def __init__(self, series: pd.Series) -> None:
+        self._series = series
+
+    def normalize(
+        self,
+        *,
+        convert_numbers: bool = True,
+        convert_characters: bool = True,
+        fix_spacing: bool = True,
+        normalize_presentation_forms: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> pd.Series:
+        """Normalize the column; see ``normalize_series``."""
+        return normalize_series(
+            self._series,
+            convert_numbers=convert_numbers,
+            convert_characters=convert_characters,
+            fix_spacing=fix_spacing,
+            normalize_presentation_forms=normalize_presentation_forms,
+            chunk_size=chunk_size,
+        )
+
+
+__all__ = ["PersianSeriesAccessor", "normalize_arrow", "normalize_series"]
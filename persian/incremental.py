@@ -0,0 +1,227 @@
+"""Incremental normalization of editor buffers under small edits."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import Final, NamedTuple
+
+from .alignment import Alignment, Edit
+from .core import _validate_string_input
+from .normalizer import Normalizer
+from .stream import _SAFE_CUT_PATTERN
+
+# Blocks are at least this long, which keeps the per-edit bookkeeping proportional
+# to the number of blocks rather than the number of safe cuts.
+_MIN_BLOCK_SIZE: Final = 128
+
+_NON_SPACE_PATTERN: Final[re.Pattern[str]] = re.compile(r"\S")
+
+
+class NormalizedChange(NamedTuple):
+    """Replacement of ``normalized[start:end]`` (before the edit) by ``text``."""
+
+    start: int
+    end: int
+    text: str
+
+
+class IncrementalNormalizer:
+    """Keep the normalization of an editable buffer up to date edit by edit.
+
+    The buffer is divided into blocks at positions where no normalization rule
+    can match across (the cut points of ``normalize_stream``). An edit
+    re-normalizes only the blocks it touches, widened to the nearest
+    boundaries whose context (the character before the cut and the whitespace
+    run after it) the edit leaves intact. That context is exactly what the
+    "می" prefix and the suffix rules of ``convert_fa_spaces`` inspect. The
+    result always equals ``normalize_persian`` of the whole buffer.
+
+    Args:
+        text: Initial buffer content.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+
+    Examples:
+        >>> buffer = IncrementalNormalizer("من می")
+        >>> buffer.insert(5, " روم")
+        NormalizedChange(start=0, end=5, text='من می\\u200cروم')
+        >>> buffer.normalized
+        'من می\\u200cروم'
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        *,
+        convert_numbers: bool = True,
+        convert_characters: bool = True,
+        fix_spacing: bool = True,
+        normalize_presentation_forms: bool = False,
+    ) -> None:
+        _validate_string_input(text, "text")
+        self._normalizer = Normalizer(
+            convert_numbers=convert_numbers,
+            convert_characters=convert_characters,
+            fix_spacing=fix_spacing,
+            normalize_presentation_forms=normalize_presentation_forms,
+        )
+        self._text = ""
+        self._normalized = ""
+        self._raw_starts: list[int] = []
+        self._normalized_starts: list[int] = []
+        self._alignments: list[Alignment] = []
+        self.replace(0, 0, text)
+
+    @property
+    def text(self) -> str:
+        """The current buffer content."""
+        return self._text
+
+    @property
+    def normalized(self) -> str:
+        """The normalized form of the current buffer."""
+        return self._normalized
+
+    def insert(self, offset: int, text: str) -> NormalizedChange:
+        """Insert ``text`` at ``offset`` of the buffer; see ``replace``."""
+        return self.replace(offset, offset, text)
+
+    def delete(self, start: int, end: int) -> NormalizedChange:
+        """Delete ``buffer[start:end]``; see ``replace``."""
+        return self.replace(start, end, "")
+
+    def replace(self, start: int, end: int, text: str) -> NormalizedChange:
+        """Replace ``buffer[start:end]`` with ``text`` and re-normalize around it.
+
+        Args:
+            start: Start offset of the edit in the buffer.
+            end: End offset of the edit in the buffer.
+            text: Replacement text.
+
+        Returns:
+            The span of the previous normalized text that was rewritten, and its
+            new content, so a view of the normalized text can be patched.
+
+        Raises:
+            TypeError: If `text` is not a string.
+            ValueError: If `text` is None or the span is outside the buffer.
+        """
+        _validate_string_input(text, "text")
+        if not 0 <= start <= end <= len(self._text):
+            raise ValueError(f"edit span ({start}, {end}) is outside the buffer")
+        first = self._first_reusable_block(start)
+        last = bisect_right(self._raw_starts, end)
+        window_start, normalized_start = self._boundary(first)
+        window_end, normalized_end = self._boundary(last)
+        delta = len(text) - (end - start)
+
+        self._text = f"{self._text[:start]}{text}{self._text[end:]}"
+        raw_starts = _block_starts(self._text, window_start, window_end + delta)
+        raw_ends = [*raw_starts[1:], window_end + delta] if raw_starts else []
+        normalized_starts = []
+        alignments = []
+        pieces = []
+        position = normalized_start
+        for block_start, block_end in zip(raw_starts, raw_ends, strict=True):
+            piece, alignment = self._normalizer.normalize_with_alignment(
+                self._text[block_start:block_end]
+            )
+            normalized_starts.append(position)
+            alignments.append(alignment)
+            pieces.append(piece)
+            position += len(piece)
+        window = "".join(pieces)
+        shift = len(window) - (normalized_end - normalized_start)
+
+        following = slice(last, None)
+        self._raw_starts[first:] = raw_starts + [
+            offset + delta for offset in self._raw_starts[following]
+        ]
+        self._normalized_starts[first:] = normalized_starts + [
+            offset + shift for offset in self._normalized_starts[following]
+        ]
+        self._alignments[first:last] = alignments
+        self._normalized = (
+            f"{self._normalized[:normalized_start]}{window}{self._normalized[normalized_end:]}"
+        )
+        return NormalizedChange(normalized_start, normalized_end, window)
+
+    def original_span(self, start: int, end: int) -> tuple[int, int]:
+        """Map a span of the normalized text to the span of the buffer it came from.
+
+        Raises:
+            ValueError: If the span is reversed or outside the normalized text.
+        """
+        if not 0 <= start <= end <= len(self._normalized):
+            raise ValueError(f"span ({start}, {end}) is outside the normalized text")
+        if not self._raw_starts:
+            return 0, 0
+        block = max(bisect_right(self._normalized_starts, start) - 1, 0)
+        local = start - self._normalized_starts[block]
+        original_start = self._raw_starts[block] + self._alignments[block].original_offset(local)
+        if start == end:
+            return original_start, original_start
+        block = max(bisect_left(self._normalized_starts, end) - 1, 0)
+        local = end - self._normalized_starts[block]
+        original_end = self._raw_starts[block] + self._alignments[block].original_offset(
+            local, end=True
+        )
+        return original_start, max(original_start, original_end)
+
+    def alignment(self) -> Alignment:
+        """Return an ``Alignment`` of the whole normalized text against the buffer."""
+        edits: list[Edit] = [
+            (
+                normalized_start + edit_start,
+                normalized_start + edit_end,
+                raw_start + original_start,
+                raw_start + original_end,
+            )
+            for raw_start, normalized_start, alignment in zip(
+                self._raw_starts, self._normalized_starts, self._alignments, strict=True
+            )
+            for edit_start, edit_end, original_start, original_end in alignment
+        ]
+        return Alignment(edits)
+
+    def _first_reusable_block(self, start: int) -> int:
+        """Index of the last block boundary before ``start`` whose cut context is untouched."""
+        index = bisect_right(self._raw_starts, start) - 1
+        while index > 0:
+            match = _NON_SPACE_PATTERN.search(self._text, self._raw_starts[index])
+            if match is not None and match.start() < start:
+                return index
+            index -= 1
+        return max(index, 0)
+
+    def _boundary(self, index: int) -> tuple[int, int]:
+        """Buffer and normalized offsets where block ``index`` starts, or of the end."""
+        if index < len(self._raw_starts):
+            return self._raw_starts[index], self._normalized_starts[index]
+        return len(self._text), len(self._normalized)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._text!r}, normalizer={self._normalizer!r})"
+
+
+def _block_starts(text: str, start: int, stop: int) -> list[int]:
+    """Split ``text[start:stop]`` at safe cuts into blocks of at least ``_MIN_BLOCK_SIZE``."""
+    starts = []
+    position = start
+    while position < stop:
+        starts.append(position)
+        if position + _MIN_BLOCK_SIZE >= stop:
+            break
+        # With ``endpos`` the lookahead cannot see past ``stop``, which only hides cuts.
+        match = _SAFE_CUT_PATTERN.search(text, position + _MIN_BLOCK_SIZE, stop)
+        if match is None:
+            break
+        position = match.start()
+    return starts
+
+
+__all__ = ["IncrementalNormalizer", "NormalizedChange"]
@@ -0,0 +1,239 @@
+"""Opt-in call counts, sizes, timings and change ratios for the ``persian.core`` functions."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from time import perf_counter_ns
+from types import FunctionType, MethodType, TracebackType
+from typing import Any, Final, NamedTuple
+
+from . import core
+
+DEFAULT_PREFIX: Final = "persian"
+
+# Prometheus metric suffix, help text and ``FunctionStats`` field of each exported counter
+_PROMETHEUS_COUNTERS: Final = (
+    ("calls_total", "Calls of each function.", "calls"),
+    ("input_bytes_total", "UTF-8 bytes of the text passed to each function.", "bytes_in"),
+    ("output_bytes_total", "UTF-8 bytes of the text returned by each function.", "bytes_out"),
+    ("seconds_total", "Time spent in each function, nested calls included.", "seconds"),
+    ("changed_total", "Calls that returned text different from their input.", "changed"),
+    ("unchanged_total", "Calls that returned their input text unchanged.", "unchanged"),
+)
+
+_active_lock = threading.Lock()
+
+
+class FunctionStats(NamedTuple):
+    """Statistics of one function, as returned by ``Instrumentation.stats``.
+
+    ``changed`` and ``unchanged`` count only calls that take and return text;
+    predicates such as ``is_persian_text`` contribute to the other fields.
+    """
+
+    calls: int
+    bytes_in: int
+    bytes_out: int
+    seconds: float
+    changed: int
+    unchanged: int
+
+    @property
+    def change_ratio(self) -> float | None:
+        """Fraction of text-to-text calls that changed their input, or None if none ran."""
+        total = self.changed + self.unchanged
+        return self.changed / total if total else None
+
+
+def _utf8_size(text: object) -> int:
+    if type(text) is not str:
+        return 0
+    return len(text) if text.isascii() else len(text.encode("utf-8", "surrogatepass"))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Instrumentation:
+    """Collector of per-function statistics for the ``persian.core`` functions.
+
+    While enabled, every instrumented function counts its calls, UTF-8 bytes
+    in and out, cumulative time and whether the text changed. The functions
+    check for an enabled collector on entry, so every way of reaching them is
+    recorded, including names imported before enabling, and a disabled
+    collector costs one load and branch per call. ``normalize_persian`` reaches
+    its stages through the same functions, so they are recorded as well; its
+    time includes theirs. ``Normalizer`` and the batch, stream and parallel
+    helpers record each text under the function they match, such as
+    ``convert_ar_characters_many`` as ``convert_ar_characters``, and a full
+    ``Normalizer`` its spacing pass as ``convert_fa_spaces``. Calls that raise
+    are not recorded. Process-pool workers record into their own collector.
+
+    Use it as a context manager, or call ``enable`` once at worker start-up
+    and export periodically. Only one collector can be enabled at a time.
+    Recording is thread-safe.
+
+    Examples:
+        >>> with Instrumentation() as metrics:
+        ...     _ = core.convert_ar_numbers("٣٤٥")
+        ...     _ = core.convert_ar_numbers("345")
+        >>> metrics.stats()["convert_ar_numbers"].change_ratio
+        0.5
+    """
+
+    def __init__(self, functions: Iterable[str] | None = None) -> None:
+        """Create a disabled collector.
+
+        Args:
+            functions: Names of the ``persian.core`` functions to instrument;
+                defaults to every name in ``persian.core.__all__``.
+
+        Raises:
+            ValueError: If a name is not a public ``persian.core`` function.
+        """
+        names = tuple(core.__all__ if functions is None else functions)
+        for name in names:
+            if name not in core.__all__:
+                raise ValueError(f"unknown persian.core function {name!r}")
+        self.functions = names
+        self._names = frozenset(names)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._counters: dict[str, list[int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether this collector is recording."""
+        return core._collector is self
+
+    def _record(self, name: str, argument: object, result: object, elapsed: int) -> None:
+        size_in = _utf8_size(argument)
+        size_out = _utf8_size(result)
+        text = type(argument) is str and type(result) is str
+        changed = text and result is not argument and result != argument
+        with self._lock:
+            counters = self._counters.get(name)
+            if counters is None:
+                counters = self._counters[name] = [0, 0, 0, 0, 0, 0]
+            counters[0] += 1
+            counters[1] += size_in
+            counters[2] += size_out
+            counters[3] += elapsed
+            counters[4] += changed
+            counters[5] += text and not changed
+
+    def _enters(self, function: FunctionType | MethodType, name: str | None = None) -> bool:
+        """Whether to measure a call of ``function``, recorded as ``name``.
+
+        False when the function is not instrumented, and for the call that
+        ``_measure`` makes to run it, which then proceeds as usual.
+        """
+        local = self._local
+        running = getattr(local, "running", None)
+        if running is not None and running == function:
+            local.running = None
+            return False
+        return (name or function.__name__) in self._names
+
+    def _measure(
+        self,
+        function: FunctionType | MethodType,
+        argument: object,
+        *args: Any,
+        name: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Call ``function`` and record the call as ``name``, its name by default."""
+        local = self._local
+        local.running = function
+        start = perf_counter_ns()
+        try:
+            result = function(argument, *args, **kwargs)
+        finally:
+            local.running = None
+        self._record(name or function.__name__, argument, result, perf_counter_ns() - start)
+        return result
+
+    def enable(self) -> None:
+        """Start recording.
+
+        Raises:
+            RuntimeError: If this or another collector is already enabled.
+        """
+        with _active_lock:
+            if core._collector is not None:
+                raise RuntimeError("an Instrumentation is already enabled")
+            core._collector = self
+
+    def disable(self) -> None:
+        """Stop recording; the statistics are kept. Idempotent."""
+        with _active_lock:
+            if core._collector is self:
+                core._collector = None
+
+    def __enter__(self) -> Instrumentation:
+        self.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.disable()
+
+    def reset(self) -> None:
+        """Discard the statistics recorded so far."""
+        with self._lock:
+            self._counters.clear()
+
+    def stats(self) -> dict[str, FunctionStats]:
+        """Return the statistics of every function called at least once, by name."""
+        with self._lock:
+            counters = {name: list(values) for name, values in self._counters.items()}
+        return {
+            name: FunctionStats(calls, bytes_in, bytes_out, elapsed / 1e9, changed, unchanged)
+            for name, (calls, bytes_in, bytes_out, elapsed, changed, unchanged) in sorted(
+                counters.items()
+            )
+        }
+
+    def as_dict(self) -> dict[str, dict[str, int | float | None]]:
+        """Return the statistics as plain dicts, with ``change_ratio`` added, by name."""
+        return {
+            name: {**stats._asdict(), "change_ratio": stats.change_ratio}
+            for name, stats in self.stats().items()
+        }
+
+    def to_prometheus(self, prefix: str = DEFAULT_PREFIX) -> str:
+        """Render the statistics in the Prometheus text exposition format.
+
+        Each counter is one metric family, such as ``persian_calls_total``,
+        with a ``function`` label per function.
+
+        Args:
+            prefix: Prefix of the metric names.
+
+        Returns:
+            The exposition text, ending with a newline.
+        """
+        stats = self.stats()
+        lines: list[str] = []
+        for suffix, description, field in _PROMETHEUS_COUNTERS:
+            metric = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, values in stats.items():
+                value = getattr(values, field)
+                lines.append(f'{metric}{{function="{_escape_label(name)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self) -> str:
+        state = "enabled" if self.enabled else "disabled"
+        return f"{type(self).__name__}({len(self.functions)} functions, {state})"
+
+
+__all__ = ["DEFAULT_PREFIX", "FunctionStats", "Instrumentation"]
@@ -0,0 +1,190 @@
+"""Detecting and fixing text typed on the wrong keyboard layout."""
+
+from __future__ import annotations
+
+import re
+from itertools import repeat
+from operator import add
+from typing import Final
+
+from .constants import EN_TO_FA_KEYBOARD_TABLE, FA_TO_EN_KEYBOARD_TABLE
+from .core import _validate_string_input, translator
+
+# How much more often each bigram of keys occurs in Persian words than in English
+# words, as a rounded natural log of the ratio of their frequencies; negative weights
+# favour English. "_" marks the start or end of a word, and a missing bigram weighs 0.
+# A Persian letter is scored by the key it sits on, so one table serves both layouts.
+# Derived from ranked lists of common words and search terms in both languages.
+_BIGRAM_WEIGHTS: Final[dict[int, str]] = {
+    7: "hk v_",
+    6: ",h ,v _; fh hd hl hv j_ lh nh sj vh",
+    5: (
+        "'h 'v ,_ ,a ,g ,n ;_ ;k ;v _' _, _[ _] aj d; dc dk dl dn dv fd fv gd hc "
+        "hf hg hn hs i, j, jh jk jv kd kf lv nv o, sd v, vd vl vn vs"
+    ),
+    4: (
+        "', '_ 't ,[ ,c ,d ,f ,i ,j ,k ,s ;a ;d ;h ;i ;j [, [_ [h [l ]i _x a' a, "
+        "a; cd cg cn d' d, d[ df dg dh dj ds f, g, gj h, hj hw ih ij jd jf jg ji "
+        "jo jp k' k, k; k[ ka kh kj kk kv l, lg lj ln mc md mh ms n, oh sg td tj "
+        "tv v[ va vc vf vj vk vt wt x,"
+    ),
+    3: (
+        "'c 'g ,] ,l ,o ,r ;, ;[ ;g ;l ;s ;t [a [g [i [n [y ], ]; ]d ]h ]v ]x _j "
+        "_z a[ bh c_ cf cv dt dx f; fc fg fj fn fp fs gc gf gs gt h' hm i_ jl jr "
+        "jt jw kc kg kl kr ks kz l; l[ lc lm lr m, mg mk mv n' n; pj ps pw r, rh "
+        "rj rx s, s; sf sv sx t, tk tp u; uf uj uv uw v' v; vy w, wf wg wv xg xh "
+        "yb yv zi zv"
+    ),
+    2: "_k _v gl k_ kn nk ph",
+    1: "_f _h _l _n a_ af ak cl fi h_ hu ik iv ki lk ls lu ni sh tc vi x_",
+    -1: (
+        "_c _d _g _m _p _s _u ag ai an au av ca ch du ha hr ht ll nd od of ov ra rd si su ti u_ ug"
+    ),
+    -2: (
+        "_e _t _y al b_ bj bs cc cu do eb eh ek fl fo fu ho ia ib in ip it ix la "
+        "lw ma mm ne nf ng o_ oj on ot ox p_ pd rb rf ri sn so ta th ud uy wh xa "
+        "xt"
+    ),
+    -3: (
+        "_q _w aw ba bi br by cr dy ed eg eo ex ff gu hy io je ju lf mb my na ob "
+        "oc oe oi oy pp pu qu r_ rc rr ru sc sl sp st sw sy t_ tl ty ua ue um vo "
+        "wr ws y_ ys"
+    ),
+    -4: (
+        "ab am ap bl bo bu ci ck ct di ec em ep ev ew ey fa fe fr ft ga ge go gr "
+        "ic id ie if ig im ir ke ly mi mp mu nc nu ny og ok ol op os pa po rk rm "
+        "rn rs ry sa ss tr tt tu tw uc ul up wi wn ye yo"
+    ),
+    -5: (
+        "ac as at ay be ce co de ee el es et is le lo m_ me mo no nt om oo ow pe "
+        "pl ro rt to un ur us ut w_ wa we wo"
+    ),
+    -6: "_b ar ea en er he or ou re se te ve",
+    -7: "e_",
+}
+# Acronyms and file extensions typed in lowercase, whose few bigrams can look Persian
+_LATIN_WORDS: Final = (
+    "aka api cpu css csv dll dns doc docx exe gif gpu gps html http https jpeg jpg js json "
+    "jsx kb kg km lcd mkv mov pc pdf php png ppt rar sdk sql ssd svg tv txt ui url usb ux "
+    "vpn vs wav xls xlsx xml zip"
+)
+_BOUNDARY: Final = "_"
+# Mean weight per bigram beyond which a token is switched to the other layout
+_SWITCH_MARGIN: Final = 0.75
+# Shorter tokens have too few bigrams to judge and follow the nearest scored token.
+_MIN_SCORED_LENGTH: Final = 3
+
+_WEIGHTS: Final = {
+    bigram: weight for weight, bigrams in _BIGRAM_WEIGHTS.items() for bigram in bigrams.split()
+}
+
+_KEPT_LATIN_WORDS: Final = frozenset(_LATIN_WORDS.split())
+
+_LATIN_KEYS: Final = re.escape("".join(map(chr, EN_TO_FA_KEYBOARD_TABLE)))
+_PERSIAN_KEYS: Final = re.escape("".join(EN_TO_FA_KEYBOARD_TABLE.values()))
+# A whole word made only of keys of one layout; words with any other character, such as
+# capitals, digits or "آ", are never switched.
+_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(
+    rf"(?<![\w{_LATIN_KEYS}{_PERSIAN_KEYS}])"
+    rf"(?:(?P<latin>[{_LATIN_KEYS}]++)|(?P<persian>[{_PERSIAN_KEYS}]++))"
+    rf"(?![\w{_LATIN_KEYS}{_PERSIAN_KEYS}])"
+)
+
+_to_persian: Final = translator(EN_TO_FA_KEYBOARD_TABLE)
+_to_latin: Final = translator(FA_TO_EN_KEYBOARD_TABLE)
+
+
+def _persian_score(keys: str) -> int:
+    """Sum of the bigram weights of the word typed with ``keys``."""
+    padded = f"{_BOUNDARY}{keys}{_BOUNDARY}"
+    return sum(map(_WEIGHTS.get, map(add, padded, padded[1:]), repeat(0)))
+
+
+def _switch(keys: str, latin: bool) -> bool | None:
+    """Whether the word typed with ``keys`` belongs to the other layout.
+
+    Returns None when the word is too short to tell.
+    """
+    if latin and keys in _KEPT_LATIN_WORDS:
+        return False
+    if len(keys) < _MIN_SCORED_LENGTH:
+        return None
+    threshold = _SWITCH_MARGIN * (len(keys) + 1)
+    score = _persian_score(keys)
+    return score > threshold if latin else score < -threshold
+
+
+def fix_keyboard_layout(text: str) -> str:
+    """Retype the words of ``text`` that were typed on the wrong keyboard layout.
+
+    Each word made only of keys of the English or the Persian layout is scored
+    against a table of English and Persian key bigrams, both as typed and as
+    the other layout would have typed it. It is converted, with
+    ``EN_TO_FA_KEYBOARD_TABLE`` or its inverse ``FA_TO_EN_KEYBOARD_TABLE``,
+    only when the other layout scores clearly higher, so ordinary English and
+    Persian pass unchanged. Words of one or two keys are too short to judge
+    and follow the nearest longer word, unless they read worse on the other
+    layout. Common lowercase acronyms such as "xml" and "jpg" are kept as
+    typed, and words holding capitals, digits or letters off the base layout,
+    such as "آ", are never changed.
+
+    Args:
+        text: Text such as a search query, in any mix of English and Persian.
+
+    Returns:
+        The text with mistyped words retyped, or ``text`` itself when no word
+        was mistyped.
+
+    Raises:
+        TypeError: If `text` is not a string.
+        ValueError: If `text` is None.
+
+    Examples:
+        >>> fix_keyboard_layout("sghl world")
+        'سلام world'
+        >>> fix_keyboard_layout("نثغذخشقی آبی")
+        'keyboard آبی'
+    """
+    _validate_string_input(text, "text")
+    matches = list(_TOKEN_PATTERN.finditer(text))
+    tokens = [
+        (match.group(), True) if match.lastgroup == "latin" else (_to_latin(match.group()), False)
+        for match in matches
+    ]
+    decisions = [_switch(keys, latin) for keys, latin in tokens]
+    short = [decision is None for decision in decisions]
+    # Short words take the decision of the previous scored word, or else the next one.
+    previous = None
+    for index, decision in enumerate(decisions):
+        if decision is None:
+            decisions[index] = previous
+        else:
+            previous = decision
+    following = None
+    for index in reversed(range(len(decisions))):
+        if decisions[index] is None:
+            decisions[index] = following
+        else:
+            following = decisions[index]
+    # A short word only follows a switch when the other layout reads at least as well,
+    # so "it" after a mistyped Persian word stays English.
+    for index, (keys, latin) in enumerate(tokens):
+        if short[index] and decisions[index]:
+            score = _persian_score(keys)
+            decisions[index] = score >= 0 if latin else score <= 0
+    if not any(decisions):
+        return text
+    pieces: list[str] = []
+    copied = 0
+    for match, decision in zip(matches, decisions, strict=True):
+        if decision:
+            start, end = match.span()
+            convert = _to_persian if match.lastgroup == "latin" else _to_latin
+            pieces.append(text[copied:start])
+            pieces.append(convert(match.group()))
+            copied = end
+    pieces.append(text[copied:])
+    return "".join(pieces)
+
+
+__all__ = ["fix_keyboard_layout"]
@@ -0,0 +1,238 @@
+"""Compiled normalization plans that fuse the steps of ``normalize_persian``."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from functools import cache
+
+from . import core
+from .alignment import Alignment, Edit, _compose, _sub_edits, _translate_edits
+from .constants import (
+    AR_DIACRITICS_MAPPING,
+    AR_TO_FA_CHARS_TABLE,
+    AR_TO_FA_DIGITS_TABLE,
+    FA_SPACING_PATTERN,
+    PRESENTATION_FORMS_TABLE,
+    _compose_tables,
+    _key_class,
+)
+from .core import _alternation, _replace_ar_diacritics, _validate_string_input, translator
+
+ZWNJ = "\u200c"
+
+_DIACRITICS_PATTERN = _alternation(AR_DIACRITICS_MAPPING)
+_DIACRITICS_LOOKUP = dict(AR_DIACRITICS_MAPPING)
+
+
+def _replace_diacritic(match: re.Match[str]) -> str:
+    return _DIACRITICS_LOOKUP[match.group()]
+
+
+def _replace_spacing(match: re.Match[str]) -> str:
+    return _spacing_replacement(*match.groups())
+
+
+def _fix_spacing(text: str) -> str:
+    return FA_SPACING_PATTERN.sub(_replace_spacing, text)
+
+
+def _spacing_replacement(
+    prefix: str | None, stem: str | None, suffix: str | None, word: str | None, ending: str | None
+) -> str:
+    """Replacement for a FA_SPACING_PATTERN match, given its groups."""
+    if word is not None:
+        return f"{word}{ZWNJ}{ending}"
+    if suffix is None:
+        return f"{prefix}{ZWNJ}{stem}"
+    return f"{prefix}{ZWNJ}{stem}{ZWNJ}{suffix}"
+
+
+def _equivalent_function(
+    convert_numbers: bool,
+    convert_characters: bool,
+    fix_spacing: bool,
+    normalize_presentation_forms: bool,
+) -> str:
+    """Name of the ``persian.core`` function a plan matches, for instrumentation."""
+    if not normalize_presentation_forms:
+        if convert_numbers and not (convert_characters or fix_spacing):
+            return "convert_ar_numbers"
+        if convert_characters and not (convert_numbers or fix_spacing):
+            return "convert_ar_characters"
+        if fix_spacing and not (convert_numbers or convert_characters):
+            return "convert_fa_spaces"
+    return "normalize_persian"
+
+
+@cache
+def _compile_table(
+    convert_numbers: bool, convert_characters: bool, normalize_presentation_forms: bool
+) -> tuple[
+    dict[int, str] | None,
+    Callable[[str], str] | None,
+    re.Pattern[str] | None,
+    re.Pattern[str] | None,
+]:
+    """Fuse the enabled translation steps, in ``normalize_persian`` order, into one table.
+
+    Returns the table, a function translating with it, a pattern matching its
+    keys and a pattern matching the keys whose replacement is not exactly one
+    character long.
+    """
+    tables = []
+    if normalize_presentation_forms:
+        tables.append(PRESENTATION_FORMS_TABLE)
+    if convert_numbers:
+        tables.append(AR_TO_FA_DIGITS_TABLE)
+    if convert_characters:
+        tables.append(AR_TO_FA_CHARS_TABLE)
+    if not tables:
+        return None, None, None, None
+    table = _compose_tables(*tables)
+    resizing = {key: value for key, value in table.items() if len(value) != 1}
+    return table, translator(table), _key_class(table), _key_class(resizing) if resizing else None
+
+
+class Normalizer:
+    """Reusable normalizer compiled once from ``normalize_persian`` flags.
+
+    Presentation forms, Arabic digits and Arabic letters are converted by one
+    ``translate`` call, made only when a regex pre-scan finds a character to
+    convert. The composed diacritic forms follow as a short loop of
+    ``str.replace`` calls, skipped when the text lacks the kasra they all
+    share, and then a single combined spacing pass. The output is identical to
+    ``normalize_persian`` called with the same flags.
+
+    Args:
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+
+    Examples:
+        >>> normalize = Normalizer()
+        >>> normalize("سلام ٣٤٥ می آیم")
+        'سلام ۳۴۵ می‌آیم'
+    """
+
+    __slots__ = (
+        "_name",
+        "_resizing",
+        "_scan",
+        "_table",
+        "_translate",
+        "convert_characters",
+        "convert_numbers",
+        "fix_spacing",
+        "normalize_presentation_forms",
+    )
+
+    def __init__(
+        self,
+        *,
+        convert_numbers: bool = True,
+        convert_characters: bool = True,
+        fix_spacing: bool = True,
+        normalize_presentation_forms: bool = False,
+    ) -> None:
+        self.convert_numbers = convert_numbers
+        self.convert_characters = convert_characters
+        self.fix_spacing = fix_spacing
+        self.normalize_presentation_forms = normalize_presentation_forms
+        # The composed diacritic forms neither contain nor produce any character touched
+        # by the digit and letter tables, so translating first keeps the legacy step order.
+        self._table, self._translate, self._scan, self._resizing = _compile_table(
+            convert_numbers, convert_characters, normalize_presentation_forms
+        )
+        self._name = _equivalent_function(
+            convert_numbers, convert_characters, fix_spacing, normalize_presentation_forms
+        )
+
+    def __call__(self, input_str: str) -> str:
+        """Normalize ``input_str`` according to the compiled plan.
+
+        Args:
+            input_str: Text to normalize.
+
+        Returns:
+            Normalized Persian text.
+
+        Raises:
+            TypeError: If `input_str` is not a string.
+            ValueError: If `input_str` is None.
+        """
+        _validate_string_input(input_str)
+        return self._apply(input_str)
+
+    def _apply(self, text: str) -> str:
+        """Run the plan on already validated text, returning ``text`` itself if unchanged."""
+        if (collector := core._collector) is not None and collector._enters(
+            self._apply, self._name
+        ):
+            return collector._measure(self._apply, text, name=self._name)
+        # Every rule targets Arabic-script characters, so pure ASCII never changes.
+        if text.isascii():
+            return text
+        result = text
+        if self._translate is not None and self._scan is not None and self._scan.search(result):
+            result = self._translate(result)
+        if self.convert_characters:
+            result = _replace_ar_diacritics(result)
+        if self.fix_spacing:
+            if (
+                (collector := core._collector) is not None
+                and self._name == "normalize_persian"
+                and collector._enters(_fix_spacing, "convert_fa_spaces")
+            ):
+                return collector._measure(_fix_spacing, result, name="convert_fa_spaces")
+            result = _fix_spacing(result)
+        return result
+
+    def normalize_with_alignment(self, input_str: str) -> tuple[str, Alignment]:
+        """Normalize ``input_str`` and map the result back to the input.
+
+        The output text is identical to calling the normalizer; the alignment
+        is assembled from the edits each step makes while it runs.
+
+        Args:
+            input_str: Text to normalize.
+
+        Returns:
+            The normalized text and an ``Alignment`` from its offsets to
+            offsets in ``input_str``.
+
+        Raises:
+            TypeError: If `input_str` is not a string.
+            ValueError: If `input_str` is None.
+
+        Examples:
+            >>> text, alignment = Normalizer().normalize_with_alignment("من می  روم")
+            >>> alignment.original_span(0, len(text))
+            (0, 10)
+        """
+        _validate_string_input(input_str)
+        if input_str.isascii():
+            return input_str, Alignment()
+        result = input_str
+        edits: list[Edit] = []
+        if self._table is not None and self._scan is not None and self._scan.search(result):
+            result, edits = _translate_edits(result, self._table, self._resizing)
+        if self.convert_characters:
+            result, step = _sub_edits(_DIACRITICS_PATTERN, _replace_diacritic, result)
+            edits = _compose(edits, step)
+        if self.fix_spacing:
+            result, step = _sub_edits(FA_SPACING_PATTERN, _replace_spacing, result)
+            edits = _compose(edits, step)
+        return result, Alignment(edits)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(convert_numbers={self.convert_numbers}, "
+            f"convert_characters={self.convert_characters}, fix_spacing={self.fix_spacing}, "
+            f"normalize_presentation_forms={self.normalize_presentation_forms})"
+        )
+
+
+__all__ = ["Normalizer"]
@@ -0,0 +1,281 @@
+"""Spelling numbers out in Persian words and reading them back."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from functools import cache
+from typing import Final
+
+from .constants import (
+    AR_TO_FA_CHARS_TABLE,
+    FA_HUNDREDS_WORDS,
+    FA_ONES_WORDS,
+    FA_SCALE_WORDS,
+    FA_TEENS_WORDS,
+    FA_TENS_WORDS,
+)
+from .core import _validate_string_input
+
+AND: Final = " و "
+NEGATIVE_WORD: Final = "منفی"
+DECIMAL_WORD: Final = "ممیز"
+_AND_WORD: Final = AND.strip()
+_ZERO_WORD: Final = FA_ONES_WORDS[0]
+_ORDINAL_SUFFIX: Final = "م"
+
+
+def _below_thousand_words() -> tuple[str, ...]:
+    """Spell every number from 0 to 999."""
+    words = [_ZERO_WORD]
+    for number in range(1, 1000):
+        hundreds, rest = divmod(number, 100)
+        tens, ones = divmod(rest, 10)
+        parts = [FA_HUNDREDS_WORDS[hundreds]]
+        if tens == 1:
+            parts.append(FA_TEENS_WORDS[ones])
+        else:
+            parts += [FA_TENS_WORDS[tens], FA_ONES_WORDS[ones] if ones else ""]
+        words.append(AND.join(filter(None, parts)))
+    return tuple(words)
+
+
+# Numbers are spelled one group of three digits at a time from this table.
+_BELOW_THOUSAND: Final = _below_thousand_words()
+# Values of the single words a group is made of, with common alternative spellings
+_GROUP_VALUES: Final[dict[str, int]] = {
+    **{word: number for number, word in enumerate(_BELOW_THOUSAND) if " " not in word},
+    "یکصد": 100,
+    "هیجده": 18,
+}
+del _GROUP_VALUES[_ZERO_WORD]
+_SCALE_VALUES: Final[dict[str, int]] = {
+    word: 1000**index for index, word in enumerate(FA_SCALE_WORDS) if index
+}
+_DENOMINATOR_VALUES: Final[dict[str, int]] = {"ده": 10, "صد": 100}
+
+
+def _scale_name(index: int) -> str:
+    """Name of ``1000 ** index``; past the largest scale word, that word repeats."""
+    if index < len(FA_SCALE_WORDS):
+        return FA_SCALE_WORDS[index]
+    repeats, index = divmod(index, len(FA_SCALE_WORDS) - 1)
+    return " ".join(filter(None, [FA_SCALE_WORDS[index], *[FA_SCALE_WORDS[-1]] * repeats]))
+
+
+def _integer_words(number: int) -> str:
+    if number < 1000:
+        return _BELOW_THOUSAND[number]
+    parts = []
+    index = 0
+    while number:
+        number, group = divmod(number, 1000)
+        if not group:
+            pass
+        elif not index:
+            parts.append(_BELOW_THOUSAND[group])
+        elif group == 1 and index == 1:
+            # A thousand is just "هزار"; larger scales keep the "one".
+            parts.append(FA_SCALE_WORDS[1])
+        else:
+            parts.append(f"{_BELOW_THOUSAND[group]} {_scale_name(index)}")
+        index += 1
+    return AND.join(reversed(parts))
+
+
+@cache
+def _denominator_words(digits: int) -> str:
+    """Name of the unit ``10 ** -digits``, such as "صدم" for hundredths."""
+    words = _integer_words(10**digits).removeprefix(f"{FA_ONES_WORDS[1]} ")
+    return f"{words}{_ORDINAL_SUFFIX}"
+
+
+def number_to_words(number: int | float | Decimal) -> str:
+    """Spell a number out in Persian words.
+
+    Integers of any size are spelled in groups of three digits, joined by
+    "و" as in "یک میلیون و دویست هزار". A fraction is read as a count of
+    tenths, hundredths, thousandths and so on, after the word "ممیز" when
+    there is an integer part. Negative numbers start with "منفی".
+
+    Args:
+        number: An ``int``, a finite ``float`` (spelled as its shortest
+            ``repr``) or a finite ``Decimal``.
+
+    Returns:
+        The number in words.
+
+    Raises:
+        TypeError: If `number` is not an int, float or Decimal.
+        ValueError: If `number` is infinite or NaN.
+
+    Examples:
+        >>> number_to_words(1_200_000)
+        'یک میلیون و دویست هزار'
+        >>> number_to_words(2.5)
+        'دو ممیز پنج دهم'
+    """
+    if type(number) is int:
+        return (
+            f"{NEGATIVE_WORD} {_integer_words(-number)}" if number < 0 else _integer_words(number)
+        )
+    if isinstance(number, float):
+        number = Decimal(repr(number))
+    elif isinstance(number, bool) or not isinstance(number, (int, Decimal)):
+        raise TypeError(f"number must be int, float or Decimal, got {type(number).__name__}")
+    if not Decimal(number).is_finite():
+        raise ValueError(f"cannot spell {number!r} in words")
+    text = format(number, "f")
+    negative = text.startswith("-")
+    integer, _, fraction = text.lstrip("-").partition(".")
+    fraction = fraction.rstrip("0")
+    words = _integer_words(int(integer))
+    if fraction:
+        fraction_words = f"{_integer_words(int(fraction))} {_denominator_words(len(fraction))}"
+        words = f"{words} {DECIMAL_WORD} {fraction_words}" if int(integer) else fraction_words
+    if negative and (fraction or int(integer)):
+        return f"{NEGATIVE_WORD} {words}"
+    return words
+
+
+def _read_integer(words: list[str]) -> int | None:
+    """Value of a spelled non-negative integer, or None if the words are not one."""
+    if words == [_ZERO_WORD]:
+        return 0
+    total = group = 0
+    # Count and scale of the phrase being read, the last scale word, and the scale of
+    # the previous phrase; phrases must come in decreasing scale.
+    count = scale = last_scale = 0
+    previous: int | None = None
+    empty = True
+    for word in words:
+        value = _SCALE_VALUES.get(word)
+        if value is not None and scale:
+            # Consecutive scale words multiply, as in "هزار میلیارد".
+            if value < last_scale:
+                return None
+            scale *= value
+            last_scale = value
+            continue
+        if scale:
+            # Anything else, "و" included, ends the phrase.
+            if previous is not None and scale >= previous:
+                return None
+            total += count * scale
+            previous, scale = scale, 0
+        if word == _AND_WORD:
+            continue
+        empty = False
+        if value is not None:
+            count, group, scale = group or 1, 0, value
+            last_scale = value
+            continue
+        value = _GROUP_VALUES.get(word)
+        if value is None:
+            return None
+        # Hundreds may be followed by anything below a hundred, and tens from twenty
+        # up by a single digit; nothing follows teens or digits.
+        if group:
+            tens = group % 100
+            after_hundreds = not tens and value < 100
+            after_tens = tens >= 20 and not tens % 10 and value < 10
+            if not (after_hundreds or after_tens):
+                return None
+        group += value
+    if empty:
+        return None
+    if scale:
+        if previous is not None and scale >= previous:
+            return None
+        total += count * scale
+    return total + group
+
+
+def _read_denominator(words: list[str]) -> tuple[int, int] | None:
+    """Split off a trailing unit such as "صدم": its word count and number of digits."""
+    if not words or not words[-1].endswith(_ORDINAL_SUFFIX):
+        return None
+    base = words[-1].removesuffix(_ORDINAL_SUFFIX)
+    if base in _DENOMINATOR_VALUES:
+        return 1, len(str(_DENOMINATOR_VALUES[base])) - 1
+    if base not in _SCALE_VALUES:
+        return None
+    value = _SCALE_VALUES[base]
+    count = 1
+    # Scale words before the last one multiply it ("هزار میلیاردم"); a leading "ده" or
+    # "صد" makes tens or hundreds of the unit ("صد هزارم").
+    while count < len(words) and words[-count - 1] in _SCALE_VALUES:
+        value *= _SCALE_VALUES[words[-count - 1]]
+        count += 1
+    if count < len(words) and words[-count - 1] in _DENOMINATOR_VALUES:
+        value *= _DENOMINATOR_VALUES[words[-count - 1]]
+        count += 1
+    return count, len(str(value)) - 1
+
+
+def _words_to_number(text: str) -> int | Decimal:
+    """Read spelled-out ``text`` after validation; see ``words_to_number``."""
+    words = text.translate(AR_TO_FA_CHARS_TABLE).split()
+    negative = bool(words) and words[0] == NEGATIVE_WORD
+    if negative:
+        del words[0]
+    value = _read_words(words)
+    if value is None:
+        raise ValueError(f"could not read a number from {text!r}")
+    return -value if negative else value
+
+
+def _read_words(words: list[str]) -> int | Decimal | None:
+    denominator = _read_denominator(words)
+    if denominator is None:
+        return _read_integer(words)
+    count, digits = denominator
+    words = words[:-count]
+    if DECIMAL_WORD in words:
+        split = words.index(DECIMAL_WORD)
+        splits = [(words[:split], words[split + 1 :])]
+    else:
+        # Without "ممیز" the integer part ends at some "و", as in "سه و بیست و پنج
+        # صدم", or is missing. The longest numerator that fits wins.
+        splits = [([_ZERO_WORD], words)]
+        splits += [
+            (words[:index], words[index + 1 :])
+            for index, word in enumerate(words)
+            if word == _AND_WORD
+        ]
+    for integer_words, numerator_words in splits:
+        integer = _read_integer(integer_words)
+        numerator = _read_integer(numerator_words)
+        if integer is not None and numerator is not None and 0 < numerator < 10**digits:
+            return Decimal(f"{integer}.{numerator:0{digits}d}")
+    return None
+
+
+def words_to_number(text: str) -> int | Decimal:
+    """Read a number spelled out in Persian words.
+
+    Accepts what ``number_to_words`` writes, "یک هزار" and "یکصد" for a
+    thousand and a hundred, and Arabic letter forms. Consecutive scale words
+    multiply, as in "هزار میلیارد". A fraction may follow "ممیز" or, as in
+    "سه و بیست و پنج صدم", just "و".
+
+    Args:
+        text: The number in words.
+
+    Returns:
+        An ``int``, or an exact ``Decimal`` if there is a fraction.
+
+    Raises:
+        TypeError: If `text` is not a string.
+        ValueError: If `text` is None or is not a number in words.
+
+    Examples:
+        >>> words_to_number("یک میلیون و دویست هزار")
+        1200000
+        >>> words_to_number("دو ممیز پنج دهم")
+        Decimal('2.5')
+    """
+    _validate_string_input(text, "text")
+    return _words_to_number(text)
+
+
+__all__ = ["number_to_words", "words_to_number"]
@@ -0,0 +1,189 @@
+"""Multi-process and multi-threaded normalization for large corpora."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Final
+
+from .batch import _chunks, _normalize_many, _validate_chunk_size
+from .normalizer import Normalizer
+
+DEFAULT_PARALLEL_CHUNK_SIZE: Final = 1024
+
+# Chunks kept in flight per worker; bounds memory when ``items`` is a generator.
+_PREFETCH_PER_WORKER: Final = 2
+
+_worker_normalizer: Normalizer | None = None
+
+
+def _init_worker(options: dict[str, bool]) -> None:
+    """Compile the normalizer once per worker process."""
+    global _worker_normalizer
+    _worker_normalizer = Normalizer(**options)
+
+
+def _apply_chunk(normalizer: Normalizer, chunk: list[str]) -> list[str]:
+    return list(map(normalizer._apply, chunk))
+
+
+def _normalize_chunk(chunk: list[str]) -> list[str]:
+    normalizer = _worker_normalizer
+    if normalizer is None:  # pragma: no cover - the initializer always runs first
+        raise RuntimeError("worker process was not initialized")
+    return _apply_chunk(normalizer, chunk)
+
+
+def _normalize_in_pool(
+    items: Iterable[str],
+    executor_factory: Callable[[], Executor],
+    normalize_chunk: Callable[[list[str]], list[str]],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[str]:
+    pending: deque[Future[list[str]]] = deque()
+    max_pending = workers * _PREFETCH_PER_WORKER
+    executor = executor_factory()
+    try:
+        for chunk in _chunks(items, chunk_size):
+            pending.append(executor.submit(normalize_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _validate_workers(workers: int | None) -> int:
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be a positive integer, got {workers}")
+    return workers
+
+
+def normalize_parallel(
+    items: Iterable[str],
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    fix_spacing: bool = True,
+    normalize_presentation_forms: bool = False,
+) -> Iterator[str]:
+    """Normalize many strings across a pool of worker processes.
+
+    Each worker compiles its ``Normalizer`` once at start-up, so only the
+    strings themselves are shipped between processes. Work is sent in chunks
+    of ``chunk_size`` strings and only a few chunks per worker are kept in
+    flight, so ``items`` may be an arbitrarily large generator. Results are
+    yielded in input order.
+
+    Args:
+        items: Strings to normalize.
+        workers: Number of worker processes. Defaults to the CPU count; ``1``
+            normalizes in the calling process without starting a pool.
+        chunk_size: Number of strings shipped to a worker per task.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+
+    Returns:
+        An iterator over the normalized strings, in input order.
+
+    Raises:
+        TypeError: If an item is not a string.
+        ValueError: If an item is None, or `workers`/`chunk_size` is not positive.
+
+    Examples:
+        >>> list(normalize_parallel(["سلام ٣٤٥", "من می روم"], workers=2))
+        ['سلام ۳۴۵', 'من می‌روم']
+    """
+    workers = _validate_workers(workers)
+    _validate_chunk_size(chunk_size)
+    options = {
+        "convert_numbers": convert_numbers,
+        "convert_characters": convert_characters,
+        "fix_spacing": fix_spacing,
+        "normalize_presentation_forms": normalize_presentation_forms,
+    }
+    if workers == 1:
+        return _normalize_many(items, Normalizer(**options), chunk_size)
+    return _normalize_in_pool(
+        items,
+        partial(ProcessPoolExecutor, workers, initializer=_init_worker, initargs=(options,)),
+        _normalize_chunk,
+        workers,
+        chunk_size,
+    )
+
+
+def normalize_threaded(
+    items: Iterable[str],
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    fix_spacing: bool = True,
+    normalize_presentation_forms: bool = False,
+) -> Iterator[str]:
+    """Normalize many strings across a pool of threads.
+
+    The threads share one ``Normalizer`` and nothing is pickled, so chunks
+    are handed over at no cost. The compiled patterns and translation tables
+    are immutable and every cache takes a lock, so concurrent use is safe.
+    On free-threaded CPython (3.13t and later) the threads normalize in
+    parallel. With the GIL they take turns, and ``normalize_parallel`` is
+    the way to use several cores. Chunking, the bound on chunks in flight and
+    result order are as in ``normalize_parallel``.
+
+    Args:
+        items: Strings to normalize.
+        workers: Number of threads. Defaults to the CPU count; ``1``
+            normalizes in the calling thread without starting a pool.
+        chunk_size: Number of strings handed to a thread per task.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+
+    Returns:
+        An iterator over the normalized strings, in input order.
+
+    Raises:
+        TypeError: If an item is not a string.
+        ValueError: If an item is None, or `workers`/`chunk_size` is not positive.
+
+    Examples:
+        >>> list(normalize_threaded(["سلام ٣٤٥", "من می روم"], workers=2))
+        ['سلام ۳۴۵', 'من می‌روم']
+    """
+    workers = _validate_workers(workers)
+    _validate_chunk_size(chunk_size)
+    normalizer = Normalizer(
+        convert_numbers=convert_numbers,
+        convert_characters=convert_characters,
+        fix_spacing=fix_spacing,
+        normalize_presentation_forms=normalize_presentation_forms,
+    )
+    if workers == 1:
+        return _normalize_many(items, normalizer, chunk_size)
+    return _normalize_in_pool(
+        items,
+        partial(ThreadPoolExecutor, workers, thread_name_prefix="persian"),
+        partial(_apply_chunk, normalizer),
+        workers,
+        chunk_size,
+    )
+
+
+__all__ = ["DEFAULT_PARALLEL_CHUNK_SIZE", "normalize_parallel", "normalize_threaded"]
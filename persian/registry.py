@@ -0,0 +1,208 @@
+"""User-extensible registry of character mappings compiled into fused tables."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from .constants import (
+    AR_DIACRITICS_MAPPING,
+    AR_TO_FA_CHARS_TABLE,
+    AR_TO_FA_DIGITS_TABLE,
+    EN_TO_FA_DIGITS_TABLE,
+    EN_TO_FA_KEYBOARD_TABLE,
+    FA_TO_EN_DIGITS_TABLE,
+    _compose_tables,
+    _key_class,
+)
+from .core import MappingType, _compile_replacer, _validate_string_input
+
+
+@dataclass(frozen=True)
+class MappingSpec:
+    """A named set of single-character mappings and ordered multi-character rules."""
+
+    name: str
+    characters: tuple[tuple[str, str], ...] = ()
+    rules: MappingType = ()
+
+
+class CompiledMapping:
+    """A fused profile: every rule in one scan, then every character map in one ``translate``.
+
+    Instances are callable and produced by ``MappingRegistry.compile``; identical
+    configurations share one instance, identified by ``key``.
+    """
+
+    __slots__ = ("_replace", "_scan", "key", "table")
+
+    def __init__(self, key: str, table: dict[int, str], rules: MappingType) -> None:
+        self.key = key
+        self.table = table
+        self._scan = _key_class(table) if table else None
+        self._replace = _compile_replacer(rules)
+
+    def __call__(self, input_str: str) -> str:
+        """Apply the profile to ``input_str``.
+
+        Args:
+            input_str: Text to convert.
+
+        Returns:
+            The converted text.
+
+        Raises:
+            TypeError: If `input_str` is not a string.
+            ValueError: If `input_str` is None.
+        """
+        _validate_string_input(input_str)
+        result = self._replace(input_str)
+        if self._scan is not None and self._scan.search(result):
+            result = result.translate(self.table)
+        return result
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(key={self.key!r})"
+
+
+def _table_items(table: Mapping[int, str]) -> tuple[tuple[str, str], ...]:
+    return tuple((chr(key), value) for key, value in table.items())
+
+
+class MappingRegistry:
+    """Thread-safe registry of named mappings with a per-configuration compile cache.
+
+    Profiles are compiled by ``compile``: the rules of every named mapping run
+    first, in the order the names are given, followed by a single ``translate``
+    whose table composes all character maps left to right. The cache is
+    keyed by a stable hash of the resolved content, so re-registering an
+    identical mapping reuses the compiled profile.
+    """
+
+    def __init__(self) -> None:
+        self._specs: dict[str, MappingSpec] = {}
+        self._compiled: dict[str, CompiledMapping] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        *,
+        characters: Mapping[str, str] | None = None,
+        rules: Iterable[tuple[str, str]] = (),
+        replace: bool = False,
+    ) -> MappingSpec:
+        """Register a named mapping.
+
+        Args:
+            name: Name used to refer to the mapping in ``compile``.
+            characters: Single characters mapped to replacement strings; an
+                empty replacement deletes the character.
+            rules: Ordered ``(old, new)`` multi-character replacements.
+            replace: Whether an existing mapping with the same name may be replaced.
+
+        Returns:
+            The registered specification.
+
+        Raises:
+            ValueError: If the name is taken, a character key is not exactly one
+                character, or a rule has an empty pattern.
+        """
+        characters = dict(characters or {})
+        for key in characters:
+            if len(key) != 1:
+                raise ValueError(f"character keys must be single characters, got {key!r}")
+        rules = tuple((old, new) for old, new in rules)
+        if any(not old for old, _ in rules):
+            raise ValueError("rule patterns must be non-empty strings")
+        spec = MappingSpec(name, tuple(characters.items()), rules)
+        with self._lock:
+            if name in self._specs and not replace:
+                raise ValueError(f"mapping {name!r} is already registered")
+            self._specs[name] = spec
+        return spec
+
+    def unregister(self, name: str) -> None:
+        """Remove a named mapping; compiled profiles using it stay valid.
+
+        Raises:
+            ValueError: If no mapping is registered under `name`.
+        """
+        with self._lock:
+            if self._specs.pop(name, None) is None:
+                raise ValueError(f"unknown mapping {name!r}")
+
+    def names(self) -> tuple[str, ...]:
+        """Return the registered mapping names in registration order."""
+        with self._lock:
+            return tuple(self._specs)
+
+    def compile(self, *names: str) -> CompiledMapping:
+        """Compile the named mappings into one fused, cached profile.
+
+        Args:
+            names: Registered mapping names, applied in the given order.
+
+        Returns:
+            A callable profile; identical configurations return the same object.
+
+        Raises:
+            ValueError: If a name is not registered.
+
+        Examples:
+            >>> registry = MappingRegistry()
+            >>> _ = registry.register("yeh", characters={"ي": "ی"})
+            >>> registry.compile("yeh")("علي")
+            'علی'
+        """
+        with self._lock:
+            try:
+                specs = [self._specs[name] for name in names]
+            except KeyError as error:
+                raise ValueError(f"unknown mapping {error.args[0]!r}") from None
+        rules = tuple(rule for spec in specs for rule in spec.rules)
+        table = _compose_tables(
+            *({ord(char): value for char, value in spec.characters} for spec in specs)
+        )
+        payload = json.dumps(
+            [[list(rule) for rule in rules], sorted(table.items())], ensure_ascii=False
+        )
+        key = hashlib.sha256(payload.encode()).hexdigest()[:16]
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is None:
+                compiled = CompiledMapping(key, table, rules)
+                self._compiled[key] = compiled
+        return compiled
+
+
+default_registry = MappingRegistry()
+default_registry.register("arabic_digits", characters=dict(_table_items(AR_TO_FA_DIGITS_TABLE)))
+default_registry.register(
+    "arabic_characters",
+    characters=dict(_table_items(AR_TO_FA_CHARS_TABLE)),
+    rules=AR_DIACRITICS_MAPPING,
+)
+default_registry.register("english_digits", characters=dict(_table_items(EN_TO_FA_DIGITS_TABLE)))
+default_registry.register("persian_digits", characters=dict(_table_items(FA_TO_EN_DIGITS_TABLE)))
+default_registry.register(
+    "english_keyboard", characters=dict(_table_items(EN_TO_FA_KEYBOARD_TABLE))
+)
+
+register_mapping = default_registry.register
+unregister_mapping = default_registry.unregister
+compile_mappings = default_registry.compile
+
+
+__all__ = [
+    "CompiledMapping",
+    "MappingRegistry",
+    "MappingSpec",
+    "compile_mappings",
+    "default_registry",
+    "register_mapping",
+    "unregister_mapping",
+]
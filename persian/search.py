@@ -0,0 +1,84 @@
+"""Folding text to canonical keys for full-text search indexes."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import cache
+from typing import Final
+
+from .core import _validate_string_input
+
+# Bump when the fold changes, and keep the previous versions: an index must be queried
+# with the version it was built with.
+SEARCH_FOLD_VERSION: Final = 1
+
+
+def _fold_table_v1() -> dict[int, str]:
+    # A frozen literal, so that neither edits to ``constants`` nor the interpreter's
+    # ``unicodedata`` can change the keys of an existing index.
+    from ._search_fold_v1 import FOLD_TABLE
+
+    return FOLD_TABLE
+
+
+_FOLD_TABLES: Final[dict[int, Callable[[], dict[int, str]]]] = {1: _fold_table_v1}
+
+
+@cache
+def _fold_table(version: int) -> dict[int, str]:
+    """Translation table of a fold version, loaded on first use."""
+    try:
+        factory = _FOLD_TABLES[version]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"unknown search fold version {version!r}; supported: {sorted(_FOLD_TABLES)}"
+        ) from None
+    return factory()
+
+
+def _fold(text: str, table: dict[int, str]) -> str:
+    if not text.isascii():
+        text = text.translate(table)
+    return " ".join(text.split())
+
+
+def fold_for_search(text: str, *, version: int = SEARCH_FOLD_VERSION) -> str:
+    """Fold ``text`` to the canonical key a search index stores and queries by.
+
+    Replaces the chain ``normalize_persian``, ``remove_arabic_diacritics``,
+    ``convert_fa_numbers`` and hand-written letter folds with a single
+    translation followed by whitespace collapsing:
+
+    - Presentation forms fold to standard letters, and Arabic kaf and yeh to
+      Persian ones.
+    - Alef variants fold to alef, and teh marbuta and heh with yeh above to heh.
+    - Diacritics, the superscript alef, tatweel and invisible formatting marks
+      are dropped.
+    - Persian and Arabic digits become ASCII digits.
+    - ZWNJ counts as a space, so "می\\u200cروم" and "می روم" fold alike, and runs
+      of whitespace collapse to one space with none at either end.
+
+    Keys built by different versions of the fold may differ, so index
+    documents and queries with the same ``version``.
+
+    Args:
+        text: Document or query text.
+        version: Fold version to apply; defaults to the latest,
+            ``SEARCH_FOLD_VERSION``.
+
+    Returns:
+        The search key.
+
+    Raises:
+        TypeError: If `text` is not a string.
+        ValueError: If `text` is None or `version` is unknown.
+
+    Examples:
+        >>> fold_for_search("می\\u200cروم  آبی ۲۴۰")
+        'می روم ابی 240'
+    """
+    _validate_string_input(text, "text")
+    return _fold(text, _fold_table(version))
+
+
+__all__ = ["SEARCH_FOLD_VERSION", "fold_for_search"]
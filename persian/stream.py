@@ -0,0 +1,130 @@
+"""Streaming normalization for files and other text streams."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from typing import Final, TextIO
+
+from .batch import _normalize_many
+from .normalizer import Normalizer
+from .parallel import normalize_parallel
+
+DEFAULT_BUFFER_SIZE: Final = 1 << 16
+
+# Positions where the stream can be split without changing the output. Spacing
+# matches only ever contain Arabic-block letters and whitespace, so a split is safe
+# right after any other character, or at the start of a whitespace run that neither
+# follows the "ی" of a "می" prefix (or an Arabic yeh that becomes one) nor precedes
+# the alef that starts every suffix. Presentation forms may fold into any of these
+# letters, so they are never treated as a boundary.
+_SAFE_CUT_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"(?<=[^\s\u0600-\u06EF\uFB50-\uFDFF\uFE70-\uFEFF])"
+    r"|(?<=[^\s\u0649\u064A\u06CC\uFB50-\uFDFF\uFE70-\uFEFF])"
+    r"(?=\s+[^\s\u0627\uFB50-\uFDFF\uFE70-\uFEFF])"
+)
+# Text without a safe cut is held back up to this many characters, then passed on
+# whole. Only a single spacing match or letter run longer than this can then be
+# normalized differently from ``normalize_persian``.
+MAX_PENDING: Final = 1 << 20
+
+
+def _last_safe_cut(text: str) -> int:
+    """Return the last safe split offset in ``text``, or 0 if there is none."""
+    cut = 0
+    for match in _SAFE_CUT_PATTERN.finditer(text):
+        cut = match.start()
+    return cut
+
+
+def _segments(stream: TextIO, buffer_size: int) -> Iterator[str]:
+    """Read ``stream`` in blocks and yield segments that normalize independently.
+
+    A position is settled as a cut or not once the first non-whitespace
+    character after it is read, so each search covers only the last block
+    holding such a character, the whitespace-only blocks after it and the new
+    block. The total work is linear in the length of the stream.
+    """
+    held: list[str] = []
+    size = 0
+    # Index in ``held`` of the last block with a non-whitespace character, and its
+    # offset in the held text; positions before it are settled non-cuts.
+    open_index = open_offset = 0
+    while block := stream.read(buffer_size):
+        held.append(block)
+        size += len(block)
+        if not block.isspace():
+            cut = _last_safe_cut("".join(held[open_index:]))
+            if cut:
+                text = "".join(held)
+                cut += open_offset
+                yield text[:cut]
+                held = [text[cut:]]
+                size -= cut
+                open_index = open_offset = 0
+                continue
+            open_index, open_offset = len(held) - 1, size - len(block)
+        if size > MAX_PENDING:
+            yield "".join(held)
+            held = []
+            size = open_index = open_offset = 0
+    if size:
+        yield "".join(held)
+
+
+def normalize_stream(
+    stream: TextIO,
+    *,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    fix_spacing: bool = True,
+    normalize_presentation_forms: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    workers: int = 1,
+) -> Iterator[str]:
+    """Normalize a text stream incrementally with the options of ``normalize_persian``.
+
+    The stream is read ``buffer_size`` characters at a time and split only at
+    positions no spacing rule can match across, so joining the yielded pieces
+    gives exactly ``normalize_persian(stream.read())``. Text without such a
+    position is held back for at most ``MAX_PENDING`` characters and then passed
+    on anyway, so memory use depends on the buffer size and that limit, not on
+    the size of the stream. Only a spacing match or a run of letters longer
+    than the limit can then normalize differently.
+
+    Args:
+        stream: Text stream to read, such as an open file or ``sys.stdin``.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+        buffer_size: Number of characters read per block.
+        workers: Number of worker processes; see ``normalize_parallel``.
+
+    Returns:
+        An iterator over normalized pieces of the stream, in order.
+
+    Raises:
+        ValueError: If `buffer_size` or `workers` is not positive.
+
+    Examples:
+        >>> import io
+        >>> "".join(normalize_stream(io.StringIO("سلام ٣٤٥ می آیم")))
+        'سلام ۳۴۵ می‌آیم'
+    """
+    if buffer_size < 1:
+        raise ValueError(f"buffer_size must be a positive integer, got {buffer_size}")
+    options = {
+        "convert_numbers": convert_numbers,
+        "convert_characters": convert_characters,
+        "fix_spacing": fix_spacing,
+        "normalize_presentation_forms": normalize_presentation_forms,
+    }
+    segments = _segments(stream, buffer_size)
+    if workers == 1:
+        return _normalize_many(segments, Normalizer(**options), 1)
+    return normalize_parallel(segments, workers=workers, chunk_size=1, **options)
+
+
+__all__ = ["DEFAULT_BUFFER_SIZE", "MAX_PENDING", "normalize_stream"]
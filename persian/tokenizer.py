@@ -0,0 +1,206 @@
+"""Tokenization into ``(start, end)`` spans, with ZWNJ as an intra-word joiner."""
+
+from __future__ import annotations
+
+import re
+from array import array
+from collections.abc import Iterator
+from typing import Final
+
+from .constants import _FA_SPACING_REGEX
+from .core import _validate_string_input
+from .normalizer import ZWNJ, Normalizer, _spacing_replacement
+
+# Word characters: ``\w`` plus the combining marks it leaves out (Latin accents, Arabic
+# harakat, superscript alef and Quranic annotation marks), so diacritics stay in words.
+_WORD_CHAR: Final = r"\w\u0300-\u036F\u064B-\u065F\u0670\u06D6-\u06ED"
+# Zero-width formatting characters (ZWSP, ZWNJ, ZWJ, LRM, RLM) never form tokens.
+_FORMAT_CHAR: Final = r"\u200B-\u200F"
+
+# A word is a run of word characters, and runs separated only by ZWNJ join into one
+# token, which is how ``convert_fa_spaces`` marks affixes. Any other character that is
+# neither whitespace nor a formatting mark is a token of its own.
+_WORD_REGEX: Final = rf"[{_WORD_CHAR}]++(?:\u200C++[{_WORD_CHAR}]++)*+"
+_SYMBOL_REGEX: Final = rf"[^\s{_WORD_CHAR}{_FORMAT_CHAR}]"
+TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(f"{_WORD_REGEX}|{_SYMBOL_REGEX}")
+_WORD_PATTERN: Final[re.Pattern[str]] = re.compile(_WORD_REGEX)
+# Word pieces without the ZWNJ joins, for tokenizing a replacement piece by piece
+_PIECE_PATTERN: Final[re.Pattern[str]] = re.compile(rf"(?P<word>[{_WORD_CHAR}]++)|{_SYMBOL_REGEX}")
+
+# One scan that applies the spacing rules and finds tokens. The first branch is
+# FA_SPACING_PATTERN. A spacing match starts at whitespace or at an Arabic-block
+# character followed by whitespace and a suffix. A word gives back its last character
+# when that character starts such a match, so the scan tries the spacing branch
+# everywhere ``FA_SPACING_PATTERN.sub`` would and finds the same matches.
+_FUSED_PATTERN: Final[re.Pattern[str]] = re.compile(
+    rf"(?P<spacing>{_FA_SPACING_REGEX})"
+    rf"|(?P<word>[{_WORD_CHAR}]+(?:\u200C+[{_WORD_CHAR}]+)*"
+    r"(?!(?<=[\u0600-\u06EF])\s++(?:ای|ایی|اند|ایم|اید|ام)))"
+    f"|{_SYMBOL_REGEX}"
+)
+
+
+def tokenize(text: str) -> Iterator[tuple[int, int]]:
+    """Yield the ``(start, end)`` span of every token of ``text``.
+
+    No substring is created; slice ``text`` with a span to get its token.
+    Words joined by ZWNJ, as ``convert_fa_spaces`` writes affixes, form one
+    token. Punctuation and symbols are one token per character, and whitespace
+    separates tokens without forming any.
+
+    Args:
+        text: Text to tokenize, usually already normalized.
+
+    Returns:
+        An iterator over token spans, in order.
+
+    Raises:
+        TypeError: If `text` is not a string.
+        ValueError: If `text` is None.
+
+    Examples:
+        >>> text = "من می‌روم."
+        >>> [text[start:end] for start, end in tokenize(text)]
+        ['من', 'می\\u200cروم', '.']
+    """
+    _validate_string_input(text, "text")
+    return (match.span() for match in TOKEN_PATTERN.finditer(text))
+
+
+def tokenize_array(text: str) -> array[int]:
+    """Return the token spans of ``text`` as one flat array.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        An ``array("Q")`` holding ``start, end`` pairs: token ``i`` spans
+        ``spans[2 * i]`` to ``spans[2 * i + 1]``.
+
+    Raises:
+        TypeError: If `text` is not a string.
+        ValueError: If `text` is None.
+    """
+    _validate_string_input(text, "text")
+    spans = array("Q")
+    for match in TOKEN_PATTERN.finditer(text):
+        spans.extend(match.span())
+    return spans
+
+
+def _add_token(spans: array[int], start: int, end: int, word: bool, joinable: bool) -> bool:
+    """Append a token piece, extending the last token if both are joined words.
+
+    ``joinable`` tells whether the last token is a word followed only by ZWNJ.
+    Returns the same for the text written up to ``end``.
+    """
+    if word and joinable:
+        spans[-1] = end
+    else:
+        spans.extend((start, end))
+    return word
+
+
+def _add_pieces(spans: array[int], piece: str, offset: int, joinable: bool) -> bool:
+    """Tokenize ``piece``, written at ``offset`` of the output, into ``spans``."""
+    # A spacing fix nearly always writes whitespace and then a single word.
+    body = piece.lstrip()
+    if _WORD_PATTERN.fullmatch(body):
+        start = len(piece) - len(body)
+        return _add_token(spans, offset + start, offset + len(piece), True, joinable and not start)
+    position = 0
+    for match in _PIECE_PATTERN.finditer(piece):
+        start, end = match.span()
+        if start > position and piece[position:start].strip(ZWNJ):
+            joinable = False
+        word = match.lastgroup == "word"
+        joinable = _add_token(spans, offset + start, offset + end, word, joinable)
+        position = end
+    return joinable and not piece[position:].strip(ZWNJ)
+
+
+def _fused_scan(text: str) -> tuple[str, array[int]]:
+    """Apply the spacing rules to ``text`` and tokenize the result in the same scan."""
+    pieces: list[str] = []
+    spans = array("Q")
+    copied = previous = 0
+    # Output offset minus input offset after the spacing fixes so far.
+    delta = 0
+    # Whether the last token is a word, and whether it ends a spacing fix. Two words
+    # found by the pattern never join: a word extends across ZWNJ by itself and only
+    # stops early before a spacing match.
+    joinable = fixed = False
+    for match in _FUSED_PATTERN.finditer(text):
+        start, end = match.span()
+        kind = match.lastgroup
+        if kind == "spacing":
+            # Groups 2 to 6 are those of FA_SPACING_PATTERN.
+            piece = _spacing_replacement(*match.group(2, 3, 4, 5, 6))
+            joinable = joinable and not text[previous:start].strip(ZWNJ)
+            joinable = fixed = _add_pieces(spans, piece, start + delta, joinable)
+            pieces.append(text[copied:start])
+            pieces.append(piece)
+            copied = end
+            delta += len(piece) - (end - start)
+        elif fixed and kind == "word" and not text[previous:start].strip(ZWNJ):
+            spans[-1] = end + delta
+            fixed = False
+        else:
+            spans.extend((start + delta, end + delta))
+            joinable = kind == "word"
+            fixed = False
+        previous = end
+    if not pieces:
+        return text, spans
+    pieces.append(text[copied:])
+    return "".join(pieces), spans
+
+
+def tokenize_normalized(
+    text: str,
+    *,
+    convert_numbers: bool = True,
+    convert_characters: bool = True,
+    fix_spacing: bool = True,
+    normalize_presentation_forms: bool = False,
+) -> tuple[str, array[int]]:
+    """Normalize ``text`` like ``normalize_persian`` and tokenize the result.
+
+    The spacing rules and the tokenizer share a single regex scan, so the
+    text is not scanned again after the spacing fix. Spans refer to the
+    normalized text and equal ``tokenize_array`` of it.
+
+    Args:
+        text: Text to normalize and tokenize.
+        convert_numbers: Whether to convert Arabic digits to Persian.
+        convert_characters: Whether to convert Arabic characters to Persian.
+        fix_spacing: Whether to fix improper spaces with ZWNJ.
+        normalize_presentation_forms: Whether to fold Arabic Presentation Forms
+            to standard letters.
+
+    Returns:
+        The normalized text and its token spans, laid out as in ``tokenize_array``.
+
+    Raises:
+        TypeError: If `text` is not a string.
+        ValueError: If `text` is None.
+
+    Examples:
+        >>> normalized, spans = tokenize_normalized("من می روم")
+        >>> normalized[spans[2] : spans[3]]
+        'می\\u200cروم'
+    """
+    _validate_string_input(text, "text")
+    normalizer = Normalizer(
+        convert_numbers=convert_numbers,
+        convert_characters=convert_characters,
+        fix_spacing=False,
+        normalize_presentation_forms=normalize_presentation_forms,
+    )
+    result = normalizer._apply(text)
+    if fix_spacing:
+        return _fused_scan(result)
+    return result, tokenize_array(result)
+
+
+__all__ = ["TOKEN_PATTERN", "tokenize", "tokenize_array", "tokenize_normalized"]
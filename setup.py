@@ -0,0 +1,15 @@
+"""Build the optional C accelerator; all other metadata lives in pyproject.toml.
+
+The extension is optional: without a compiler, or with PERSIAN_PURE_PYTHON set,
+the package installs as pure Python and uses ``persian._native``.
+"""
+
+import os
+
+from setuptools import Extension, setup
+
+ext_modules = []
+if not os.environ.get("PERSIAN_PURE_PYTHON"):
+    ext_modules.append(Extension("persian._speedups", ["persian/_speedups.c"], optional=True))
+
+setup(ext_modules=ext_modules)
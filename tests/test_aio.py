@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import persian
+from persian import aio
+
+from .test_normalizer import SAMPLES
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.submitted = 0
+        self.release = threading.Event()
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+
+        def blocked():
+            self.release.wait(5)
+            return fn(*args, **kwargs)
+
+        return super().submit(blocked)
+
+
+class TestAnormalize(unittest.IsolatedAsyncioTestCase):
+    async def test_matches_normalize_persian(self):
+        for text in SAMPLES:
+            with self.subTest(text=text):
+                self.assertEqual(persian.normalize_persian(text), await aio.anormalize(text))
+
+    async def test_large_input_is_offloaded_in_segments(self):
+        text = "كتاب ٣ را می خوانم و آمده ای " * 10_000
+        with _CountingExecutor() as executor:
+            executor.release.set()
+            result = await aio.anormalize(text, inline_limit=1000, executor=executor)
+        self.assertEqual(persian.normalize_persian(text), result)
+        self.assertGreater(executor.submitted, 1)
+
+    async def test_small_input_stays_inline(self):
+        with _CountingExecutor() as executor:
+            await aio.anormalize("می روم", executor=executor)
+        self.assertEqual(0, executor.submitted)
+
+    async def test_cancellation_stops_remaining_segments(self):
+        text = "می روم " * 100_000
+        with _CountingExecutor() as executor:
+            task = asyncio.create_task(aio.anormalize(text, inline_limit=0, executor=executor))
+            while executor.submitted == 0:
+                await asyncio.sleep(0)
+            task.cancel()
+            executor.release.set()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        self.assertEqual(1, executor.submitted)
+
+    async def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            await aio.anormalize(None)  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            await aio.anormalize(b"bytes")  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            await aio.anormalize("text", inline_limit=-1)
+
+
+class TestAnormalizeMany(unittest.IsolatedAsyncioTestCase):
+    async def test_matches_normalize_persian_in_order(self):
+        items = [*SAMPLES, "می روم " * 5000]
+        expected = [persian.normalize_persian(item) for item in items]
+        self.assertEqual(expected, await aio.anormalize_many(items, inline_limit=100))
+
+    async def test_yields_to_event_loop(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        await aio.anormalize_many(["می روم"] * 1000, inline_limit=100)
+        task.cancel()
+        self.assertGreater(ticks, 10)
+
+    async def test_invalid_item(self):
+        with self.assertRaises(TypeError):
+            await aio.anormalize_many(["ok", 3])  # type: ignore[list-item]
+
+
+if __name__ == "__main__":
+    unittest.main()
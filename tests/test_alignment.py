@@ -0,0 +1,74 @@
+import itertools
+import unittest
+
+import persian
+from persian.alignment import Alignment
+from persian.normalizer import Normalizer
+
+from .test_normalizer import SAMPLES
+
+
+class TestAlignment(unittest.TestCase):
+    def test_maps_spacing_fix_back_to_original(self):
+        text, alignment = persian.normalize_persian("من می  روم", return_alignment=True)
+        self.assertEqual("من می‌روم", text)
+        self.assertEqual((3, 10), alignment.original_span(3, 9))
+        self.assertEqual((5, 7), alignment.original_span(5, 6))
+        self.assertEqual((7, 10), alignment.original_span(6, 9))
+
+    def test_maps_expanded_ligature_to_single_character(self):
+        source = "ﻻ ﷲ"
+        text, alignment = persian.normalize_persian(
+            source, normalize_presentation_forms=True, return_alignment=True
+        )
+        self.assertEqual("لا الله", text)
+        self.assertEqual((0, 1), alignment.original_span(0, 2))
+        self.assertEqual((2, 3), alignment.original_span(4, 6))
+
+    def test_maps_removed_diacritics(self):
+        source = "دِ ب"
+        text, alignment = persian.normalize_persian(source, return_alignment=True)
+        self.assertEqual("د ب", text)
+        self.assertEqual((0, 2), alignment.original_span(0, 1))
+        self.assertEqual((2, 4), alignment.original_span(1, 3))
+        self.assertEqual((3, 4), alignment.original_span(2, 3))
+
+    def test_unchanged_text_has_no_edits(self):
+        for source in ("Hello 123", "سلام دنیا"):
+            with self.subTest(source=source):
+                text, alignment = persian.normalize_persian(source, return_alignment=True)
+                self.assertEqual(source, text)
+                self.assertEqual(0, len(alignment))
+                self.assertEqual((2, 5), alignment.original_span(2, 5))
+
+    def test_text_matches_normalize_persian_and_spans_cover_input(self):
+        names = ("convert_numbers", "convert_characters", "fix_spacing")
+        for flags in itertools.product((True, False), repeat=len(names)):
+            options = dict(zip(names, flags, strict=True))
+            for source in SAMPLES:
+                with self.subTest(source=source, **options):
+                    text, alignment = Normalizer(
+                        normalize_presentation_forms=True, **options
+                    ).normalize_with_alignment(source)
+                    expected = persian.normalize_persian(
+                        source, normalize_presentation_forms=True, **options
+                    )
+                    self.assertEqual(expected, text)
+                    self.assertEqual((0, len(source)), alignment.original_span(0, len(text)))
+                    starts = [alignment.original_offset(i) for i in range(len(text) + 1)]
+                    self.assertEqual(sorted(starts), starts)
+
+    def test_rejects_invalid_spans(self):
+        alignment = Alignment([(1, 2, 1, 3)])
+        with self.assertRaises(ValueError):
+            alignment.original_span(3, 2)
+        with self.assertRaises(ValueError):
+            alignment.original_offset(-1)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            persian.normalize_persian(None, return_alignment=True)  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
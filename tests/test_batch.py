@@ -0,0 +1,84 @@
+import unittest
+
+import persian
+from persian import batch
+
+SAMPLES = [
+    "",
+    "Hello world",
+    "Phone 0912",
+    "سلام ٣٤٥ می آیم",
+    "۱۳۹۹ كتاب",
+    "علي دِبِ",
+    "آمده ای ولی من رفته ام",
+    "sghl",
+]
+
+
+class TestBatchConversions(unittest.TestCase):
+    def test_matches_single_item_functions(self):
+        pairs = [
+            (batch.convert_en_numbers_many, persian.convert_en_numbers),
+            (batch.convert_en_characters_many, persian.convert_en_characters),
+            (batch.convert_ar_numbers_many, persian.convert_ar_numbers),
+            (batch.convert_fa_numbers_many, persian.convert_fa_numbers),
+            (batch.convert_ar_characters_many, persian.convert_ar_characters),
+            (batch.convert_fa_spaces_many, persian.convert_fa_spaces),
+            (batch.normalize_many, persian.normalize_persian),
+            (batch.fold_for_search_many, persian.fold_for_search),
+        ]
+        for many, single in pairs:
+            with self.subTest(function=single.__name__):
+                self.assertEqual([single(text) for text in SAMPLES], list(many(SAMPLES)))
+
+    def test_normalize_many_flags(self):
+        result = persian.normalize_many(["علي ٣ می روم"], convert_numbers=False, fix_spacing=False)
+        self.assertEqual(["علی ٣ می روم"], list(result))
+
+    def test_unchanged_strings_are_not_copied(self):
+        text = "".join(["Hello ", "world"])
+        persian_text = "".join(["سلام ", "دنیا"])
+        self.assertIs(text, next(persian.normalize_many([text])))
+        self.assertIs(persian_text, next(persian.normalize_many([persian_text])))
+        self.assertIs(persian_text, next(persian.convert_fa_numbers_many([persian_text])))
+
+    def test_chunking_preserves_order_and_laziness(self):
+        items = (str(number) for number in range(10))
+        result = persian.convert_en_numbers_many(items, chunk_size=3)
+        self.assertEqual("۰", next(result))
+        self.assertEqual(["۱", "۲", "۳"], [next(result) for _ in range(3)])
+        self.assertEqual(6, len(list(result)))
+
+    def test_number_batches_match_single_item_functions(self):
+        texts = ["۱\u066c۲۳۴", "٣٤\u066b٥", "42", " -۷ "]
+        numbers = [persian.parse_number(text) for text in texts]
+        self.assertEqual(numbers, list(persian.parse_number_many(texts, chunk_size=3)))
+        self.assertEqual(
+            [persian.format_number(number, digits="ar") for number in numbers],
+            list(persian.format_number_many(numbers, digits="ar", chunk_size=3)),
+        )
+
+    def test_invalid_numbers(self):
+        with self.assertRaises(ValueError):
+            list(persian.parse_number_many(["۱", "x"]))
+        for text in ("nan", "1_000", "1,2,3"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                list(persian.parse_number_many(["۱", text]))
+        with self.assertRaises(TypeError):
+            list(persian.parse_number_many([1]))  # type: ignore[list-item]
+        with self.assertRaises(TypeError):
+            list(persian.format_number_many([1, "2"]))  # type: ignore[list-item]
+        with self.assertRaises(ValueError):
+            persian.format_number_many([1], digits="xx")  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            persian.format_number_many([1], decimals=-1)
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            persian.normalize_many([], chunk_size=0)
+
+    def test_invalid_items(self):
+        with self.assertRaises(ValueError):
+            list(persian.normalize_many(["ok", None]))  # type: ignore[list-item]
+        with self.assertRaises(TypeError):
+            list(persian.convert_en_numbers_many([123]))  # type: ignore[list-item]
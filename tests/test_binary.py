@@ -0,0 +1,93 @@
+import mmap
+import tempfile
+import unittest
+from pathlib import Path
+
+import persian
+from persian import binary
+
+from .test_normalizer import SAMPLES
+
+
+class TestNormalizeBytes(unittest.TestCase):
+    def test_matches_normalize_persian_without_spacing(self):
+        for text in SAMPLES:
+            for chunk_size in (1, 7, binary.DEFAULT_BYTE_CHUNK_SIZE):
+                with self.subTest(text=text, chunk_size=chunk_size):
+                    expected = persian.normalize_persian(text, fix_spacing=False).encode()
+                    self.assertEqual(
+                        expected, persian.normalize_bytes(text.encode(), chunk_size=chunk_size)
+                    )
+
+    def test_accepts_buffers(self):
+        data = "علي ٣".encode()
+        for buffer in (data, bytearray(data), memoryview(data)):
+            with self.subTest(type=type(buffer).__name__):
+                self.assertEqual("علی ۳", persian.normalize_bytes(buffer).decode())
+
+    def test_rule_split_across_chunks(self):
+        data = ("ab" + "دِ" * 50).encode()
+        expected = ("ab" + "د" * 50).encode()
+        for chunk_size in range(1, 12):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(expected, persian.normalize_bytes(data, chunk_size=chunk_size))
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            persian.normalize_bytes(b"abc", chunk_size=0)
+
+
+class TestByteTranslator(unittest.TestCase):
+    def test_rewrites_in_place(self):
+        buffer = bytearray("كتاب ٣٤٥".encode())
+        written = binary.AR_TO_FA_DIGITS_BYTES.translate_into(buffer, buffer)
+        self.assertEqual("كتاب ۳۴۵", buffer[:written].decode())
+
+    def test_shrinking_table_compacts_in_place(self):
+        buffer = bytearray("سال ۱۴۰۲".encode())
+        written = binary.FA_TO_EN_DIGITS_BYTES.translate_into(buffer, buffer, chunk_size=3)
+        self.assertEqual("سال 1402", buffer[:written].decode())
+
+    def test_growing_table_refuses_in_place(self):
+        self.assertTrue(binary.EN_TO_FA_DIGITS_BYTES.grows)
+        buffer = bytearray(b"123")
+        with self.assertRaises(ValueError):
+            binary.EN_TO_FA_DIGITS_BYTES.translate_into(buffer, buffer)
+        target = bytearray(6)
+        self.assertEqual(6, binary.EN_TO_FA_DIGITS_BYTES.translate_into(b"123", target))
+        self.assertEqual("۱۲۳", target.decode())
+
+    def test_target_too_small(self):
+        with self.assertRaises(ValueError):
+            binary.EN_TO_FA_DIGITS_BYTES.translate_into(b"123", bytearray(4))
+
+    def test_works_on_mmap(self):
+        with tempfile.TemporaryFile() as file:
+            file.write("علي ٣".encode())
+            file.flush()
+            with mmap.mmap(file.fileno(), 0) as mapped:
+                self.assertEqual("علی ۳", persian.normalize_bytes(mapped).decode())
+
+    def test_rejects_self_referencing_table(self):
+        with self.assertRaises(ValueError):
+            binary.ByteTranslator({ord("a"): "ab"})
+
+
+class TestNormalizeFile(unittest.TestCase):
+    def test_rewrites_file_in_place_and_truncates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "corpus.txt"
+            path.write_bytes("دِبِ علي ٣٤٥\n".encode() * 100)
+            size = persian.normalize_file(path, chunk_size=64)
+            self.assertEqual(("دب علی ۳۴۵\n" * 100).encode(), path.read_bytes())
+            self.assertEqual(path.stat().st_size, size)
+
+    def test_empty_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "empty.txt"
+            path.write_bytes(b"")
+            self.assertEqual(0, persian.normalize_file(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import threading
+import unittest
+
+import persian
+from persian.cache import CacheInfo, cached
+
+
+class TestCached(unittest.TestCase):
+    def test_results_match_wrapped_function(self):
+        normalize = cached(persian.normalize_persian)
+        for text in ("سلام ٣٤٥ می آیم", "سلام ٣٤٥ می آیم", "Hello"):
+            self.assertEqual(persian.normalize_persian(text), normalize(text))
+        self.assertEqual(CacheInfo(1, 2, 0, 0, 2, 4096), normalize.cache_info())
+
+    def test_options_are_part_of_the_key(self):
+        normalize = cached(persian.normalize_persian)
+        self.assertEqual("من می‌روم ٣", normalize("من می روم ٣", convert_numbers=False))
+        self.assertEqual("من می‌روم ۳", normalize("من می روم ٣"))
+        self.assertEqual("من می‌روم ٣", normalize("من می روم ٣", convert_numbers=False))
+        self.assertEqual(1, normalize.cache_info().hits)
+
+    def test_evicts_least_recently_used(self):
+        calls = []
+
+        @cached(maxsize=2)
+        def convert(text):
+            calls.append(text)
+            return text.upper()
+
+        convert("a")
+        convert("b")
+        convert("a")
+        convert("c")
+        convert("a")
+        convert("b")
+        self.assertEqual(["a", "b", "c", "b"], calls)
+        info = convert.cache_info()
+        self.assertEqual((2, 2), (info.evictions, info.currsize))
+
+    def test_long_strings_skip_the_cache(self):
+        convert = cached(persian.convert_en_numbers, max_len=3)
+        self.assertEqual("۱۲۳۴", convert("1234"))
+        self.assertEqual("۱۲۳۴", convert("1234"))
+        self.assertEqual(CacheInfo(0, 0, 0, 2, 0, 4096), convert.cache_info())
+
+    def test_wraps_normalizer_and_keeps_metadata(self):
+        self.assertEqual("convert_fa_spaces", cached(persian.convert_fa_spaces).__name__)
+        normalize = cached(persian.Normalizer(), maxsize=8)
+        self.assertEqual("من می‌روم", normalize("من می روم"))
+
+    def test_cache_clear(self):
+        convert = cached(persian.convert_en_numbers)
+        convert("1")
+        convert.cache_clear()
+        self.assertEqual(CacheInfo(0, 0, 0, 0, 0, 4096), convert.cache_info())
+
+    def test_invalid_input_is_passed_through(self):
+        convert = cached(persian.convert_en_numbers)
+        with self.assertRaises(ValueError):
+            convert(None)  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            convert(b"1")  # type: ignore[arg-type]
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            cached(persian.convert_en_numbers, maxsize=0)
+        with self.assertRaises(ValueError):
+            cached(persian.convert_en_numbers, max_len=-1)
+        with self.assertRaises(ValueError):
+            cached(maxsize=0)
+
+    def test_thread_safety(self):
+        normalize = cached(persian.normalize_persian, maxsize=16)
+        texts = [f"می روم {index}" for index in range(64)]
+        errors = []
+
+        def worker():
+            for _ in range(50):
+                errors.extend(
+                    text for text in texts if normalize(text) != persian.normalize_persian(text)
+                )
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        info = normalize.cache_info()
+        self.assertEqual(8 * 50 * 64, info.hits + info.misses)
+        self.assertLessEqual(info.currsize, 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+import persian
+
+try:
+    import pandas as pd
+    import pyarrow as pa
+
+    from persian import frame
+except ImportError:  # the frame extra is optional
+    pd = pa = frame = None
+
+from .test_normalizer import SAMPLES
+
+FLAGS = (
+    {},
+    {"convert_numbers": False},
+    {"convert_characters": False, "fix_spacing": False},
+    {"normalize_presentation_forms": True},
+)
+
+
+def _expected(values, **flags):
+    return [
+        None if value is None else persian.normalize_persian(value, **flags) for value in values
+    ]
+
+
+@unittest.skipIf(frame is None, "requires pandas and pyarrow")
+class TestNormalizeArrow(unittest.TestCase):
+    def setUp(self):
+        self.values = [*SAMPLES, None, "دِل ٣ كتاب ها  ای", None]
+
+    def test_matches_normalize_persian(self):
+        for string_type in (pa.string(), pa.large_string()):
+            for flags in FLAGS:
+                with self.subTest(type=string_type, flags=flags):
+                    result = frame.normalize_arrow(pa.array(self.values, string_type), **flags)
+                    self.assertEqual(string_type, result.type)
+                    self.assertEqual(_expected(self.values, **flags), result.to_pylist())
+
+    def test_sliced_and_chunked_arrays(self):
+        array = pa.array(self.values)
+        self.assertEqual(
+            _expected(self.values[2:5]), frame.normalize_arrow(array.slice(2, 3)).to_pylist()
+        )
+        chunked = pa.chunked_array([array.slice(0, 3), array.slice(3)])
+        result = frame.normalize_arrow(chunked)
+        self.assertIsInstance(result, pa.ChunkedArray)
+        self.assertEqual(_expected(self.values), result.to_pylist())
+
+    def test_unicode_whitespace_matches_python_semantics(self):
+        values = ["من می روم", "آمده ای", "می　روم x", "من می\x1cروم"]
+        self.assertEqual(_expected(values), frame.normalize_arrow(pa.array(values)).to_pylist())
+
+    def test_tables_keep_utf8_lengths(self):
+        translator = frame._table_translator(True, True)
+        self.assertFalse(translator.grows)
+        for old, new in translator._table:
+            self.assertEqual(len(old), len(new))
+
+    def test_all_null_and_invalid_types(self):
+        self.assertEqual([None, None], frame.normalize_arrow(pa.array([None, None])).to_pylist())
+        with self.assertRaises(TypeError):
+            frame.normalize_arrow(pa.array([1, 2]))
+        with self.assertRaises(ValueError):
+            frame.normalize_arrow(pa.array(["x"]), chunk_size=0)
+
+
+@unittest.skipIf(frame is None, "requires pandas and pyarrow")
+class TestSeriesAccessor(unittest.TestCase):
+    def test_preserves_nulls_dtype_index_and_name(self):
+        values = ["سلام ٣٤٥", None, "من می روم", "Hello"]
+        dtypes = [
+            "string[pyarrow]",
+            "string[python]",
+            object,
+            pd.ArrowDtype(pa.large_string()),
+        ]
+        for dtype in dtypes:
+            with self.subTest(dtype=dtype):
+                series = pd.Series(values, dtype=dtype, index=[10, 11, 12, 13], name="text")
+                result = series.persian.normalize()
+                self.assertEqual(series.dtype, result.dtype)
+                self.assertEqual("text", result.name)
+                self.assertEqual([10, 11, 12, 13], result.index.tolist())
+                self.assertTrue(series.isna().equals(result.isna()))
+                self.assertEqual(["سلام ۳۴۵", "من می‌روم", "Hello"], result.dropna().tolist())
+                self.assertEqual("سلام ٣٤٥", series[10])
+
+    def test_flags_are_forwarded(self):
+        series = pd.Series(["٣ می روم"], dtype="string[pyarrow]")
+        self.assertEqual("٣ می‌روم", series.persian.normalize(convert_numbers=False)[0])
+
+    def test_non_string_values_raise(self):
+        with self.assertRaises(TypeError):
+            pd.Series(["x", 3], dtype=object).persian.normalize()
+        with self.assertRaises(TypeError):
+            pd.Series([1, 2], dtype=pd.ArrowDtype(pa.int64())).persian.normalize()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import random
+import unittest
+from unittest import mock
+
+import persian
+from persian import incremental
+from persian.incremental import IncrementalNormalizer, NormalizedChange
+
+
+class TestIncrementalNormalizer(unittest.TestCase):
+    def test_initial_text_is_normalized(self):
+        buffer = IncrementalNormalizer("سلام ٣٤٥ می آیم")
+        self.assertEqual("سلام ٣٤٥ می آیم", buffer.text)
+        self.assertEqual("سلام ۳۴۵ می‌آیم", buffer.normalized)
+
+    def test_typing_completes_spacing_rules(self):
+        buffer = IncrementalNormalizer()
+        for character in "من می روم و آمده ای":
+            buffer.insert(len(buffer.text), character)
+        self.assertEqual("من می‌روم و آمده‌ای", buffer.normalized)
+
+    def test_delete_restores_space(self):
+        buffer = IncrementalNormalizer("آمده ای")
+        self.assertEqual("آمده‌ای", buffer.normalized)
+        buffer.delete(5, 7)
+        self.assertEqual("آمده ", buffer.normalized)
+
+    def test_change_patches_previous_normalized_text(self):
+        buffer = IncrementalNormalizer("کتاب " * 100 + "آمده")
+        before = buffer.normalized
+        change = buffer.insert(len(buffer.text), " ام")
+        self.assertIsInstance(change, NormalizedChange)
+        self.assertEqual(
+            buffer.normalized, before[: change.start] + change.text + before[change.end :]
+        )
+
+    def test_edits_touch_only_a_window(self):
+        with mock.patch.object(incremental, "_MIN_BLOCK_SIZE", 16):
+            buffer = IncrementalNormalizer("كتاب شماره ٣ را می خوانم و آمده ای " * 50)
+            change = buffer.insert(800, "ب")
+        self.assertLess(change.end - change.start, 100)
+        self.assertEqual(persian.normalize_persian(buffer.text), buffer.normalized)
+
+    def test_random_edits_match_full_normalization(self):
+        rng = random.Random(7)
+        pieces = ["می", " ", "  ", "ای", "اند", "ام", "ب", "x", "\n", "ي", "٣", "دِ"]
+        with mock.patch.object(incremental, "_MIN_BLOCK_SIZE", 2):
+            buffer = IncrementalNormalizer("".join(rng.choices(pieces, k=40)))
+            for _ in range(300):
+                start = rng.randint(0, len(buffer.text))
+                end = rng.randint(start, min(len(buffer.text), start + 5))
+                buffer.replace(start, end, "".join(rng.choices(pieces, k=rng.randint(0, 3))))
+                expected = persian.normalize_persian(buffer.text)
+                self.assertEqual(expected, buffer.normalized)
+                self.assertEqual((0, len(buffer.text)), buffer.original_span(0, len(expected)))
+
+    def test_offset_mapping(self):
+        buffer = IncrementalNormalizer("من می  روم")
+        self.assertEqual((3, 10), buffer.original_span(3, 9))
+        buffer.insert(0, "و ")
+        self.assertEqual((5, 12), buffer.original_span(5, 11))
+        self.assertEqual(buffer.original_span(5, 11), buffer.alignment().original_span(5, 11))
+
+    def test_flags_are_forwarded(self):
+        buffer = IncrementalNormalizer("٣ می روم", convert_numbers=False, fix_spacing=False)
+        self.assertEqual("٣ می روم", buffer.normalized)
+
+    def test_invalid_edits(self):
+        buffer = IncrementalNormalizer("abc")
+        with self.assertRaises(ValueError):
+            buffer.replace(2, 1, "")
+        with self.assertRaises(ValueError):
+            buffer.insert(4, "x")
+        with self.assertRaises(TypeError):
+            buffer.insert(0, 1)  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            buffer.original_span(0, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
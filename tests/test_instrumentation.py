@@ -0,0 +1,201 @@
+import threading
+import unittest
+from operator import itemgetter
+
+import persian
+from persian import core
+from persian.instrumentation import FunctionStats, Instrumentation
+from persian.normalizer import Normalizer
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_enable_sets_the_collector_checked_by_the_functions(self):
+        originals = {name: getattr(core, name) for name in core.__all__}
+        metrics = Instrumentation()
+        with metrics:
+            self.assertTrue(metrics.enabled)
+            self.assertIs(metrics, core._collector)
+        self.assertFalse(metrics.enabled)
+        self.assertIsNone(core._collector)
+        self.assertEqual(originals, {name: getattr(core, name) for name in core.__all__})
+
+    def test_names_imported_before_enabling(self):
+        from persian import normalize_persian
+        from persian.core import convert_ar_numbers
+
+        with Instrumentation(["normalize_persian", "convert_ar_numbers"]) as metrics:
+            normalize_persian("٣")
+            convert_ar_numbers("٣")
+        stats = metrics.stats()
+        self.assertEqual(1, stats["normalize_persian"].calls)
+        self.assertEqual(2, stats["convert_ar_numbers"].calls)
+
+    def test_normalizer_and_batch_helpers(self):
+        with Instrumentation() as metrics:
+            Normalizer()("علي می روم")
+            list(persian.normalize_many(["٣", "abc"]))
+            list(persian.convert_ar_characters_many(["علي"]))
+            list(persian.convert_en_numbers_many(["12", "ab"]))
+            list(persian.parse_number_many(["۱۲"]))
+            list(persian.format_number_many([12]))
+        stats = metrics.stats()
+        self.assertEqual((3, 2, 1), itemgetter(0, 4, 5)(stats["normalize_persian"]))
+        self.assertEqual((2, 1, 1), itemgetter(0, 4, 5)(stats["convert_fa_spaces"]))
+        self.assertEqual((1, 1, 0), itemgetter(0, 4, 5)(stats["convert_ar_characters"]))
+        self.assertEqual((2, 1, 1), itemgetter(0, 4, 5)(stats["convert_en_numbers"]))
+        self.assertEqual(1, stats["parse_number"].calls)
+        self.assertEqual(1, stats["format_number"].calls)
+
+    def test_batch_results_unchanged_while_enabled(self):
+        items = ["سلام ٣٤٥ می آیم", "abc", "علي  می روم", "12"]
+        expected = list(persian.normalize_many(items)), list(persian.convert_en_numbers_many(items))
+        with Instrumentation():
+            actual = (
+                list(persian.normalize_many(items)),
+                list(persian.convert_en_numbers_many(items)),
+            )
+        self.assertEqual(expected, actual)
+
+    def test_counts_bytes_and_changes(self):
+        with Instrumentation(["convert_ar_characters"]) as metrics:
+            persian.convert_ar_characters("علي")
+            persian.convert_ar_characters("علی")
+            persian.convert_ar_characters("abc")
+        stats = metrics.stats()["convert_ar_characters"]
+        self.assertEqual(3, stats.calls)
+        self.assertEqual(6 + 6 + 3, stats.bytes_in)
+        self.assertEqual(6 + 6 + 3, stats.bytes_out)
+        self.assertEqual((1, 2), (stats.changed, stats.unchanged))
+        self.assertAlmostEqual(1 / 3, stats.change_ratio)
+        self.assertGreater(stats.seconds, 0)
+
+    def test_keyword_arguments(self):
+        with Instrumentation(["convert_ar_characters", "normalize_persian"]) as metrics:
+            persian.convert_ar_characters(input_str="علي")
+            persian.normalize_persian(input_str="سلام", fix_spacing=False)
+        stats = metrics.stats()
+        # normalize_persian converts the characters of its input as well
+        self.assertEqual(6 + 8, stats["convert_ar_characters"].bytes_in)
+        self.assertEqual((1, 1), stats["convert_ar_characters"][4:])
+        self.assertEqual(8, stats["normalize_persian"].bytes_in)
+        self.assertEqual(1, stats["normalize_persian"].unchanged)
+
+    def test_normalize_persian_records_its_stages(self):
+        with Instrumentation() as metrics:
+            persian.normalize_persian("سلام ٣٤٥ می آیم")
+        stats = metrics.stats()
+        for name in ["normalize_persian", "convert_ar_numbers", "convert_ar_characters"]:
+            self.assertEqual(1, stats[name].calls, name)
+        self.assertEqual(1, stats["convert_ar_numbers"].changed)
+        self.assertEqual(1, stats["convert_ar_characters"].unchanged)
+        self.assertGreaterEqual(
+            stats["normalize_persian"].seconds, stats["convert_fa_spaces"].seconds
+        )
+
+    def test_non_text_results(self):
+        with Instrumentation(["is_persian_text", "format_number"]) as metrics:
+            persian.is_persian_text("سلام")
+            persian.format_number(1234)
+        stats = metrics.stats()
+        self.assertEqual(
+            FunctionStats(1, 8, 0, stats["is_persian_text"].seconds, 0, 0), stats["is_persian_text"]
+        )
+        self.assertIsNone(stats["is_persian_text"].change_ratio)
+        self.assertEqual(0, stats["format_number"].bytes_in)
+        self.assertEqual(len("۱٬۲۳۴".encode()), stats["format_number"].bytes_out)
+
+    def test_failed_calls_are_not_recorded(self):
+        with Instrumentation(["convert_en_numbers"]) as metrics, self.assertRaises(ValueError):
+            persian.convert_en_numbers(None)
+        self.assertEqual({}, metrics.stats())
+
+    def test_statistics_survive_disable_until_reset(self):
+        metrics = Instrumentation(["decode_url"])
+        metrics.enable()
+        persian.decode_url("%D8%B3")
+        metrics.disable()
+        metrics.disable()
+        persian.decode_url("%D8%B3")
+        self.assertEqual(1, metrics.stats()["decode_url"].calls)
+        metrics.reset()
+        self.assertEqual({}, metrics.stats())
+
+    def test_one_collector_at_a_time(self):
+        with Instrumentation(["decode_url"]) as metrics:
+            with self.assertRaises(RuntimeError):
+                Instrumentation().enable()
+            with self.assertRaises(RuntimeError):
+                metrics.enable()
+        with Instrumentation():
+            pass
+
+    def test_unknown_function(self):
+        with self.assertRaises(ValueError):
+            Instrumentation(["normalize"])
+
+    def test_concurrent_calls(self):
+        barrier = threading.Barrier(4)
+
+        def run():
+            barrier.wait()
+            for _ in range(500):
+                core.convert_en_numbers("12")
+
+        with Instrumentation(["convert_en_numbers"]) as metrics:
+            threads = [threading.Thread(target=run) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        stats = metrics.stats()["convert_en_numbers"]
+        self.assertEqual((2000, 2000, 8000), (stats.calls, stats.changed, stats.bytes_out))
+
+    def test_concurrent_nested_calls(self):
+        barrier = threading.Barrier(4)
+        normalize = Normalizer()
+
+        def run():
+            barrier.wait()
+            for _ in range(200):
+                persian.normalize_persian("من می آیم")
+                normalize("من می آیم")
+
+        with Instrumentation(["normalize_persian", "convert_fa_spaces"]) as metrics:
+            threads = [threading.Thread(target=run) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        stats = metrics.stats()
+        self.assertEqual(
+            (1600, 1600), (stats["normalize_persian"].calls, stats["normalize_persian"].changed)
+        )
+        self.assertEqual(1600, stats["convert_fa_spaces"].changed)
+
+    def test_as_dict(self):
+        with Instrumentation(["convert_fa_numbers"]) as metrics:
+            persian.convert_fa_numbers("۱۲")
+        exported = metrics.as_dict()
+        self.assertEqual(["convert_fa_numbers"], list(exported))
+        self.assertEqual(1, exported["convert_fa_numbers"]["calls"])
+        self.assertEqual(4, exported["convert_fa_numbers"]["bytes_in"])
+        self.assertEqual(1.0, exported["convert_fa_numbers"]["change_ratio"])
+
+    def test_to_prometheus(self):
+        with Instrumentation(["convert_fa_numbers"]) as metrics:
+            persian.convert_fa_numbers("۱۲")
+            persian.convert_fa_numbers("12")
+        lines = metrics.to_prometheus(prefix="app").splitlines()
+        self.assertIn("# TYPE app_calls_total counter", lines)
+        self.assertIn('app_calls_total{function="convert_fa_numbers"} 2', lines)
+        self.assertIn('app_changed_total{function="convert_fa_numbers"} 1', lines)
+        self.assertIn('app_unchanged_total{function="convert_fa_numbers"} 1', lines)
+        self.assertIn('app_input_bytes_total{function="convert_fa_numbers"} 6', lines)
+        self.assertTrue(metrics.to_prometheus().startswith("# HELP persian_calls_total "))
+
+    def test_exported(self):
+        self.assertIs(Instrumentation, persian.Instrumentation)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+import persian
+from persian.constants import EN_TO_FA_KEYBOARD_TABLE, FA_TO_EN_KEYBOARD_TABLE
+from persian.keyboard import fix_keyboard_layout
+
+# Words that use only keys of the base layouts, so they can be mistyped both ways
+ENGLISH = ["hello", "keyboard", "youtube", "download", "weather", "summer", "kitchen"]
+PERSIAN = ["سلام", "خوبی", "کتاب", "خیابان", "دانشگاه", "تهران", "پنجره", "ممنون"]
+
+
+def _on_english_layout(text):
+    return text.translate(FA_TO_EN_KEYBOARD_TABLE)
+
+
+def _on_persian_layout(text):
+    return text.translate(EN_TO_FA_KEYBOARD_TABLE)
+
+
+class TestFixKeyboardLayout(unittest.TestCase):
+    def test_tables_are_inverse(self):
+        for word in ENGLISH:
+            self.assertEqual(word, _on_english_layout(_on_persian_layout(word)))
+        for word in PERSIAN:
+            self.assertEqual(word, _on_persian_layout(_on_english_layout(word)))
+
+    def test_correct_text_is_unchanged(self):
+        for word in ENGLISH + PERSIAN:
+            with self.subTest(word=word):
+                self.assertIs(word, fix_keyboard_layout(word))
+        text = "hello دوست, how are you? خوبی"
+        self.assertIs(text, fix_keyboard_layout(text))
+
+    def test_persian_typed_on_english_layout(self):
+        for word in PERSIAN:
+            with self.subTest(word=word):
+                self.assertEqual(word, fix_keyboard_layout(_on_english_layout(word)))
+
+    def test_english_typed_on_persian_layout(self):
+        for word in ENGLISH:
+            with self.subTest(word=word):
+                self.assertEqual(word, fix_keyboard_layout(_on_persian_layout(word)))
+
+    def test_only_mistyped_words_change(self):
+        text = f"{_on_english_layout('سلام')} world {_on_persian_layout('keyboard')} آبی"
+        self.assertEqual("سلام world keyboard آبی", fix_keyboard_layout(text))
+
+    def test_short_words_follow_their_neighbours(self):
+        self.assertEqual("سلام و خوبی", fix_keyboard_layout("sghl , o,fd"))
+        self.assertEqual("how to buy", fix_keyboard_layout(_on_persian_layout("how to buy")))
+        self.assertEqual("سلام hi", fix_keyboard_layout("سلام hi"))
+        self.assertEqual("hi", fix_keyboard_layout("hi"))
+
+    def test_short_words_follow_only_when_they_read_as_well(self):
+        self.assertEqual("سلام it", fix_keyboard_layout("sghl it"))
+        self.assertEqual("is خوبی", fix_keyboard_layout("is o,fd"))
+
+    def test_latin_acronyms_are_kept(self):
+        for text in ["xml", "jpg", "sghl xml", "csv ok", "sghl ui"]:
+            with self.subTest(text=text):
+                self.assertEqual(text.replace("sghl", "سلام"), fix_keyboard_layout(text))
+
+    def test_words_off_the_base_layout_are_unchanged(self):
+        for text in ["Sghl", "sghl2", "آبی", "sghl_x", "می‌روم"]:
+            with self.subTest(text=text):
+                self.assertEqual(text, fix_keyboard_layout(text))
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            fix_keyboard_layout(None)
+        with self.assertRaises(TypeError):
+            fix_keyboard_layout(42)
+
+    def test_exported(self):
+        self.assertIs(fix_keyboard_layout, persian.fix_keyboard_layout)
+
+
+if __name__ == "__main__":
+    unittest.main()
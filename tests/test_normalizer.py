@@ -0,0 +1,105 @@
+import itertools
+import unittest
+
+import persian
+from persian import constants
+from persian.normalizer import Normalizer
+
+SAMPLES = [
+    "",
+    "Hello 123",
+    "سلام ٣٤٥ می آیم",
+    "كتاب شماره ٣ را می خوانم",
+    "آمده ای ولی من رفته ام و می آییم",
+    "من می روم ام",
+    "او می می رود",
+    "دِبِ زِذِ شِسِ دِِ",
+    "علي  می\tروم اند",
+    "رفته ایی ام",
+    "می روم\nمی آیم",
+    "٣ ای",
+    "ﻣﯽ ﺭﻭﻡ ﻛﺘﺎﺏ ﻋﻠﻲ ﷲ",
+    "من ﻣﯽ روم ﺍﻡ ﹺ",
+]
+
+
+class TestNormalizer(unittest.TestCase):
+    def test_default_example(self):
+        self.assertEqual("سلام ۳۴۵ می‌آیم", Normalizer()("سلام ٣٤٥ می آیم"))
+
+    def test_matches_normalize_persian_for_every_flag_combination(self):
+        names = (
+            "convert_numbers",
+            "convert_characters",
+            "fix_spacing",
+            "normalize_presentation_forms",
+        )
+        for flags in itertools.product((True, False), repeat=len(names)):
+            options = dict(zip(names, flags, strict=True))
+            normalize = Normalizer(**options)
+            for text in SAMPLES:
+                with self.subTest(text=text, **options):
+                    self.assertEqual(persian.normalize_persian(text, **options), normalize(text))
+
+    def test_prefix_and_suffix_fixed_in_one_pass(self):
+        self.assertEqual("من می‌روم‌ام", Normalizer()("من می روم ام"))
+
+    def test_input_validation(self):
+        normalize = Normalizer()
+        with self.assertRaises(ValueError):
+            normalize(None)  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            normalize(b"bytes")  # type: ignore[arg-type]
+
+    def test_repr(self):
+        self.assertEqual(
+            "Normalizer(convert_numbers=True, convert_characters=False, fix_spacing=True, "
+            "normalize_presentation_forms=False)",
+            repr(Normalizer(convert_characters=False)),
+        )
+
+
+class TestPresentationForms(unittest.TestCase):
+    def test_folds_presentation_forms_to_persian_letters(self):
+        text = "ﻛﺘﺎﺏ ﻋﻠﻲ ﯼ ﷲ"
+        self.assertEqual(
+            "کتاب علی ی الله", persian.normalize_persian(text, normalize_presentation_forms=True)
+        )
+
+    def test_disabled_by_default(self):
+        self.assertEqual("ﻛﺘﺎﺏ", persian.normalize_persian("ﻛﺘﺎﺏ"))
+
+    def test_leaves_other_compatibility_characters_alone(self):
+        text = "ﬁ ² ｱ"
+        self.assertEqual(text, persian.normalize_persian(text, normalize_presentation_forms=True))
+
+    def test_isolated_harakat_do_not_introduce_spaces(self):
+        result = persian.normalize_persian(
+            "مﹺ", normalize_presentation_forms=True, convert_characters=False
+        )
+        self.assertEqual("مِ", result)
+
+    def test_matches_folding_in_a_separate_pass_first(self):
+        forms = "".join(map(chr, constants.PRESENTATION_FORMS_TABLE))
+        texts = [*SAMPLES, forms, " ".join(forms[::7]), "ﻛِّ ﹽﹹ ٣ ﻋﻠﻲ"]
+        for numbers, characters, spacing in itertools.product((True, False), repeat=3):
+            options = {
+                "convert_numbers": numbers,
+                "convert_characters": characters,
+                "fix_spacing": spacing,
+            }
+            for text in texts:
+                with self.subTest(text=text[:20], **options):
+                    folded = text.translate(constants.PRESENTATION_FORMS_TABLE)
+                    self.assertEqual(
+                        persian.normalize_persian(folded, **options),
+                        persian.normalize_persian(
+                            text, normalize_presentation_forms=True, **options
+                        ),
+                    )
+
+    def test_only_phrase_ligatures_fold_to_spaces(self):
+        spaced = {
+            code for code, folded in constants.PRESENTATION_FORMS_TABLE.items() if " " in folded
+        }
+        self.assertEqual({0xFDFA, 0xFDFB}, spaced)
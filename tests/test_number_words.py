@@ -0,0 +1,111 @@
+import random
+import unittest
+from decimal import Decimal
+
+import persian
+from persian.number_words import number_to_words, words_to_number
+
+
+class TestNumberToWords(unittest.TestCase):
+    def test_small_numbers(self):
+        cases = {
+            0: "صفر",
+            7: "هفت",
+            13: "سیزده",
+            40: "چهل",
+            45: "چهل و پنج",
+            100: "صد",
+            205: "دویست و پنج",
+            999: "نهصد و نود و نه",
+        }
+        for number, words in cases.items():
+            with self.subTest(number=number):
+                self.assertEqual(words, number_to_words(number))
+
+    def test_scales(self):
+        self.assertEqual("هزار", number_to_words(1000))
+        self.assertEqual("دو هزار و یک", number_to_words(2001))
+        self.assertEqual("یک میلیون و دویست هزار", number_to_words(1_200_000))
+        self.assertEqual("سه میلیارد و چهار", number_to_words(3_000_000_004))
+
+    def test_numbers_beyond_the_largest_scale(self):
+        self.assertEqual("یک دسیلیون", number_to_words(10**33))
+        self.assertEqual("پنج هزار دسیلیون", number_to_words(5 * 10**36))
+        self.assertEqual("یک دسیلیون دسیلیون", number_to_words(10**66))
+
+    def test_fractions_and_sign(self):
+        self.assertEqual("منفی هفت", number_to_words(-7))
+        self.assertEqual("دو ممیز پنج دهم", number_to_words(2.5))
+        self.assertEqual("بیست و پنج صدم", number_to_words(0.25))
+        self.assertEqual("منفی یک ده هزارم", number_to_words(Decimal("-0.00010")))
+        self.assertEqual("هفت میلیونم", number_to_words(7e-6))
+        self.assertEqual("سه", number_to_words(Decimal("3.000")))
+
+    def test_invalid_numbers(self):
+        for value in ("12", None, True, [1]):
+            with self.subTest(value=value), self.assertRaises(TypeError):
+                number_to_words(value)  # type: ignore[arg-type]
+        for value in (float("inf"), float("nan"), Decimal("NaN")):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                number_to_words(value)
+
+
+class TestWordsToNumber(unittest.TestCase):
+    def test_round_trips(self):
+        rng = random.Random(0)
+        for _ in range(2000):
+            number = rng.randrange(-(10 ** rng.choice((3, 9, 40))), 10**40)
+            self.assertEqual(number, words_to_number(number_to_words(number)))
+            fraction = Decimal(rng.randrange(-(10**6), 10**6)).scaleb(-rng.randint(0, 8))
+            self.assertEqual(fraction, words_to_number(number_to_words(fraction)))
+
+    def test_result_types(self):
+        self.assertIsInstance(words_to_number("صد"), int)
+        self.assertEqual(Decimal("2.5"), words_to_number("دو ممیز پنج دهم"))
+
+    def test_common_variants(self):
+        self.assertEqual(1000, words_to_number("یک هزار"))
+        self.assertEqual(120, words_to_number("یکصد و بیست"))
+        self.assertEqual(10**12, words_to_number("هزار میلیارد"))
+        self.assertEqual(1, words_to_number("يك"))
+        self.assertEqual(Decimal("3.25"), words_to_number("سه و بیست و پنج صدم"))
+        self.assertEqual(Decimal("1000.5"), words_to_number("هزار و پنج دهم"))
+        self.assertEqual(Decimal("3e-12"), words_to_number("سه هزار میلیاردم"))
+
+    def test_invalid_words(self):
+        for text in (
+            "",
+            "و",
+            "منفی",
+            "بیست بیست",
+            "پنج بیست",
+            "صد صد",
+            "یازده یک",
+            "میلیون هزار",
+            "هزار و یک میلیون",
+            "هزار و دو هزار و سه",
+            "صفر و یک",
+            "ده دهم",
+            "نهم",
+            "دو ممیز",
+            "ممیز پنج دهم",
+            "سلام",
+        ):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                words_to_number(text)
+        with self.assertRaises(ValueError):
+            words_to_number(None)  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            words_to_number(5)  # type: ignore[arg-type]
+
+    def test_batch_forms(self):
+        numbers = [0, 12, -1_200_000, Decimal("0.5")]
+        words = list(persian.number_to_words_many(numbers, chunk_size=3))
+        self.assertEqual([number_to_words(number) for number in numbers], words)
+        self.assertEqual(numbers, list(persian.words_to_number_many(words, chunk_size=3)))
+        with self.assertRaises(TypeError):
+            list(persian.words_to_number_many([12]))  # type: ignore[list-item]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+import persian
+from persian.parallel import normalize_parallel, normalize_threaded
+
+SAMPLES = ["سلام ٣٤٥ می آیم", "Hello", "علي رفته ام", "", "كتاب ٣"]
+
+
+class TestNormalizeParallel(unittest.TestCase):
+    def test_matches_normalize_persian_in_order(self):
+        items = SAMPLES * 50
+        expected = [persian.normalize_persian(text) for text in items]
+        self.assertEqual(expected, list(normalize_parallel(items, workers=2, chunk_size=7)))
+
+    def test_accepts_generator_and_flags(self):
+        items = (text for text in SAMPLES)
+        result = normalize_parallel(items, workers=2, chunk_size=2, fix_spacing=False)
+        expected = [persian.normalize_persian(text, fix_spacing=False) for text in SAMPLES]
+        self.assertEqual(expected, list(result))
+
+    def test_single_worker_runs_inline(self):
+        self.assertEqual(["۳"], list(normalize_parallel(["٣"], workers=1)))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            normalize_parallel([], workers=0)
+        with self.assertRaises(ValueError):
+            normalize_parallel([], chunk_size=0)
+        with self.assertRaises(TypeError):
+            list(normalize_parallel(["ok", 1], workers=2))  # type: ignore[list-item]
+
+
+class TestNormalizeThreaded(unittest.TestCase):
+    def test_matches_normalize_persian_in_order(self):
+        items = SAMPLES * 50
+        expected = [persian.normalize_persian(text) for text in items]
+        self.assertEqual(expected, list(normalize_threaded(items, workers=4, chunk_size=7)))
+
+    def test_accepts_generator_and_flags(self):
+        items = (text for text in SAMPLES)
+        result = normalize_threaded(items, workers=2, chunk_size=2, convert_numbers=False)
+        expected = [persian.normalize_persian(text, convert_numbers=False) for text in SAMPLES]
+        self.assertEqual(expected, list(result))
+
+    def test_single_worker_runs_inline(self):
+        self.assertEqual(["۳"], list(normalize_threaded(["٣"], workers=1)))
+
+    def test_exported(self):
+        self.assertIs(persian.normalize_threaded, normalize_threaded)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            normalize_threaded([], workers=0)
+        with self.assertRaises(ValueError):
+            normalize_threaded([], chunk_size=0)
+        with self.assertRaises(TypeError):
+            list(normalize_threaded(["ok", 1], workers=2))  # type: ignore[list-item]
@@ -1,52 +1,95 @@
-import time
+import random
+import re
 import unittest
+from unittest import mock
 
 import persian
+from persian import constants
+
+# The spacing patterns as first written, whose nested quantifiers could backtrack
+# exponentially; the linear-time versions must give the same output.
+_ORIGINAL_MI_PATTERN = re.compile(r"((\s\u0645\u06CC)+([\s])+([\u0600-\u06EF]{1,}){1,})")
+_ORIGINAL_DE_YII_PATTERN = re.compile(r"(([\u0600-\u06EF]{1,})+([\s])+(ای|ایی|اند|ایم|اید|ام){1})")
 
 
 class TestPerformance(unittest.TestCase):
-    """Performance smoke tests to prevent regressions."""
+    """Deterministic guards for the hot paths; timings live in ``benchmarks/``."""
 
     def setUp(self) -> None:
-        self.small_input = "1234567890" * 10  # 100 chars
-        self.medium_input = "1234567890" * 100  # 1,000 chars
         self.large_input = "1234567890" * 10000  # 100,000 chars
 
     def test_convert_en_numbers_large_string(self) -> None:
-        start = time.perf_counter()
         result = persian.convert_en_numbers(self.large_input)
-        elapsed = time.perf_counter() - start
-
-        self.assertLess(
-            elapsed,
-            0.010,
-            f"Large string conversion took {elapsed:.3f}s, expected < 0.010s",
-        )
+        self.assertEqual(len(self.large_input), len(result))
         self.assertTrue(all(c in "۰۱۲۳۴۵۶۷۸۹" for c in result))
 
-    def test_convert_fa_spaces_performance(self) -> None:
-        test_input = "می روم به خانه ام و می آیم" * 1000
-        start = time.perf_counter()
-        persian.convert_fa_spaces(test_input)
-        elapsed = time.perf_counter() - start
-
-        self.assertLess(
-            elapsed,
-            0.050,
-            f"Space conversion took {elapsed:.3f}s, expected < 0.050s",
-        )
+    def test_convert_fa_spaces_large_string(self) -> None:
+        result = persian.convert_fa_spaces("من می روم به خانه ام و می آیم " * 1000)
+        self.assertEqual("من می‌روم به خانه‌ام و می‌آیم " * 1000, result)
 
     def test_repeated_calls_no_compilation_overhead(self) -> None:
-        test_input = "می روم به خانه"
-        persian.convert_fa_spaces(test_input)
-
-        start = time.perf_counter()
-        for _ in range(1000):
-            persian.convert_fa_spaces(test_input)
-        elapsed = time.perf_counter() - start
-
-        self.assertLess(
-            elapsed,
-            0.100,
-            f"1000 calls took {elapsed:.3f}s, expected < 0.100s",
-        )
+        test_input = "می روم به خانه ام"
+        expected = persian.convert_fa_spaces(test_input)
+        with (
+            mock.patch.object(re, "compile", side_effect=AssertionError("compiled")),
+            mock.patch.object(re, "sub", side_effect=AssertionError("module-level re.sub")),
+        ):
+            for _ in range(1000):
+                self.assertEqual(expected, persian.convert_fa_spaces(test_input))
+                persian.normalize_persian(test_input)
+
+    def test_unchanged_input_is_not_copied(self) -> None:
+        for text in ("Hello world", "سلام دنیا"):
+            with self.subTest(text=text):
+                self.assertIs(text, persian.convert_fa_spaces(text))
+
+    def test_spacing_matches_original_patterns(self) -> None:
+        # Short words only: the original patterns are exponential on long letter runs.
+        words = ["می", "ب", "کتاب", "ای", "ایی", "اند", "ایم", "اید", "ام", "x", "رو"]
+        generator = random.Random(14)
+        for _ in range(2000):
+            text = "".join(
+                generator.choice(words) + generator.choice([" ", "  ", "\n", ""])
+                for _ in range(generator.randrange(1, 8))
+            )
+            expected = _ORIGINAL_MI_PATTERN.sub("\\2\u200c\\4", text)
+            expected = _ORIGINAL_DE_YII_PATTERN.sub("\\2\u200c\\4", expected)
+            with self.subTest(text=text):
+                self.assertEqual(expected, persian.convert_fa_spaces(text))
+
+    def test_spacing_patterns_have_no_nested_quantifiers(self) -> None:
+        for name in ("MI_PATTERN", "DE_YII_PATTERN", "FA_SPACING_PATTERN"):
+            with self.subTest(name=name):
+                pattern = getattr(constants, name)
+                self.assertFalse(_has_nested_repeat(re._parser.parse(pattern.pattern)))
+        for pattern in (_ORIGINAL_MI_PATTERN, _ORIGINAL_DE_YII_PATTERN):
+            self.assertTrue(_has_nested_repeat(re._parser.parse(pattern.pattern)))
+
+    def test_pathological_input_keeps_original_output(self) -> None:
+        self.assertEqual("ب" * 50 + " x", persian.convert_fa_spaces("ب" * 50 + " x"))
+        self.assertEqual("ب" * 50 + "\u200cای", persian.convert_fa_spaces("ب" * 50 + "  ای"))
+        self.assertEqual(" می\u200cمی", persian.convert_fa_spaces(" می می"))
+
+
+_REPEATS = {re._constants.MAX_REPEAT, re._constants.MIN_REPEAT, re._constants.POSSESSIVE_REPEAT}
+
+
+def _has_nested_repeat(items, inside_repeat: bool = False) -> bool:
+    """Whether a parsed pattern has a quantifier inside another quantifier."""
+    for op, argument in items:
+        if op in _REPEATS:
+            if inside_repeat:
+                return True
+            # An optional item, at most one repetition, cannot multiply the paths.
+            if _has_nested_repeat(argument[2], inside_repeat or argument[1] > 1):
+                return True
+        elif op is re._constants.SUBPATTERN:
+            if _has_nested_repeat(argument[3], inside_repeat):
+                return True
+        elif op is re._constants.BRANCH:
+            if any(_has_nested_repeat(branch, inside_repeat) for branch in argument[1]):
+                return True
+        elif op is re._constants.ATOMIC_GROUP:
+            if _has_nested_repeat(argument, inside_repeat):
+                return True
+    return False
@@ -1,4 +1,5 @@
 import unittest
+from decimal import Decimal
 
 import persian
 
@@ -40,6 +41,80 @@ class TestNumberConversions(unittest.TestCase):
         self.assertEqual("۱۲۳", persian.convert_en_numbers("۱۲۳"))
 
 
+class TestNumberParsing(unittest.TestCase):
+    def test_parse_digits_of_every_script(self):
+        self.assertEqual(1234, persian.parse_number("۱۲۳۴"))
+        self.assertEqual(1234, persian.parse_number("١٢٣٤"))
+        self.assertEqual(1234, persian.parse_number("1234"))
+        self.assertEqual(1234, persian.parse_number("۱2٣4"))
+
+    def test_parse_separators(self):
+        self.assertEqual(1234567, persian.parse_number("۱\u066c۲۳۴\u066c۵۶۷"))
+        self.assertEqual(1234.56, persian.parse_number("۱\u066c۲۳۴\u066b۵۶"))
+        self.assertEqual(1234.5, persian.parse_number("1,234.5"))
+        self.assertIsInstance(persian.parse_number("۱\u066b۰"), float)
+
+    def test_parse_sign_exponent_and_whitespace(self):
+        self.assertEqual(-42, persian.parse_number(" -۴۲ "))
+        self.assertEqual(-3, persian.parse_number("\u2212۳"))
+        self.assertEqual(1500.0, persian.parse_number("۱\u066b۵e۳"))
+
+    def test_parse_invalid(self):
+        for text in ("", "abc", "۱\u066b۲\u066b۳", "\u066b", "۱۲ تومان", "1e", "--1"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                persian.parse_number(text)
+        with self.assertRaises(ValueError):
+            persian.parse_number(None)  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            persian.parse_number(12)  # type: ignore[arg-type]
+
+    def test_parse_rejects_what_int_and_float_allow(self):
+        for text in ("nan", "-inf", "Infinity", "1e999", "1_000", "۱_۰۰۰", "1_000.5"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                persian.parse_number(text)
+
+    def test_parse_requires_groups_of_three(self):
+        for text in ("1,2,3", "١\u066c٢", "12,34", "1234,567", ",123", "1,234,", "1\u066c234,567"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                persian.parse_number(text)
+        self.assertEqual(-1234567.5, persian.parse_number("-1,234,567.5"))
+        self.assertEqual(12345, persian.parse_number("۱۲\u066c۳۴۵"))
+
+    def test_format_digits_and_separators(self):
+        self.assertEqual("۱\u066c۲۳۴\u066c۵۶۷", persian.format_number(1234567))
+        self.assertEqual("١\u066c٢٣٤\u066b٥", persian.format_number(1234.5, digits="ar"))
+        self.assertEqual("1,234.5", persian.format_number(1234.5, digits="en"))
+        self.assertEqual("-۱۲۳۴", persian.format_number(-1234, grouping=False))
+
+    def test_format_decimals(self):
+        self.assertEqual("۱\u066c۲۳۴\u066b۵۰", persian.format_number(1234.5, decimals=2))
+        self.assertEqual("۱\u066c۲۳۵", persian.format_number(1234.6, decimals=0))
+        self.assertEqual("۱۲\u066b۵۰", persian.format_number(Decimal("12.50")))
+
+    def test_format_never_uses_exponents(self):
+        self.assertEqual("۱" + "\u066c۰۰۰" * 7, persian.format_number(1e21))
+        self.assertEqual("0.0000001", persian.format_number(1e-7, digits="en"))
+        self.assertEqual(
+            "-25000000000000000000", persian.format_number(-2.5e19, digits="en", grouping=False)
+        )
+        self.assertEqual("۱۰۰\u066c۰۰۰", persian.format_number(Decimal("1E+5")))
+
+    def test_format_round_trips(self):
+        for number in (0, 7, -1234567, 0.25, 1234.5, 10**20, 1e20, 1e-7, 1.5e-12):
+            for digits in ("fa", "ar", "en"):
+                formatted = persian.format_number(number, digits=digits)  # type: ignore[arg-type]
+                self.assertEqual(number, persian.parse_number(formatted))
+
+    def test_format_invalid(self):
+        for value in ("12", None, True, [1]):
+            with self.subTest(value=value), self.assertRaises(TypeError):
+                persian.format_number(value)  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            persian.format_number(1, digits="hi")  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            persian.format_number(1, decimals=-1)
+
+
 class TestCharacterConversions(unittest.TestCase):
     def test_convert_keyboard_layout(self):
         self.assertEqual(
@@ -85,6 +160,37 @@ class TestNormalizationAndDetection(unittest.TestCase):
         self.assertFalse(persian.contains_arabic_digits(text))
         self.assertTrue(persian.is_persian_text(text))
 
+    def test_detection_helpers_negative(self):
+        for text in ("", "Hello 123", "é ñ 😀"):
+            with self.subTest(text=text):
+                self.assertFalse(persian.contains_persian_digits(text))
+                self.assertFalse(persian.contains_arabic_digits(text))
+                self.assertFalse(persian.is_persian_text(text))
+        self.assertTrue(persian.contains_arabic_digits("é ٣"))
+
+    def test_count_persian_chars_and_ratio(self):
+        self.assertEqual(0, persian.count_persian_chars("Hello"))
+        self.assertEqual(6, persian.count_persian_chars("Hello سلام ۱۲"))
+        self.assertEqual(0.0, persian.persian_ratio(" \n"))
+        self.assertEqual(1.0, persian.persian_ratio("می\u200cروم ۱۲"))
+        self.assertAlmostEqual(4 / 6, persian.persian_ratio("سلام ab"))
+
+    def test_script_profile(self):
+        self.assertEqual(
+            {
+                "persian": 3,
+                "persian_digits": 4,
+                "arabic_digits": 1,
+                "latin": 3,
+                "digits": 4,
+                "whitespace": 5,
+                "other": 1,
+            },
+            persian.script_profile("سال ۱۴۰۲ is 2023 ٣ é!"),
+        )
+        with self.assertRaises(TypeError):
+            persian.script_profile(b"bytes")  # type: ignore[arg-type]
+
 
 class TestBackwardCompatibility(unittest.TestCase):
     """Ensure legacy examples from README continue to work."""
@@ -103,3 +209,40 @@ class TestLegacyModule(unittest.TestCase):
 
         legacy = importlib.import_module("persian.persian")
         self.assertEqual("۱۲۳", legacy.convert_en_numbers("123"))
+
+
+class TestMultipleReplace(unittest.TestCase):
+    """The compiled replacer must match ordered str.replace calls exactly."""
+
+    @staticmethod
+    def _sequential(mapping, text):
+        for old, new in mapping:
+            text = text.replace(old, new)
+        return text
+
+    def test_matches_sequential_replacement(self):
+        import random
+
+        from persian.core import _multiple_replace
+
+        rng = random.Random(1404)
+        alphabet = "abcde"
+        for _ in range(300):
+            keys = {
+                "".join(rng.choices(alphabet, k=rng.randint(1, 3)))
+                for _ in range(rng.randint(1, 12))
+            }
+            mapping = tuple(
+                (key, "".join(rng.choices(alphabet + "xyz", k=rng.randint(0, 2)))) for key in keys
+            )
+            text = "".join(rng.choices(alphabet, k=40))
+            with self.subTest(mapping=mapping, text=text):
+                self.assertEqual(self._sequential(mapping, text), _multiple_replace(mapping, text))
+
+    def test_large_mapping_uses_single_scan(self):
+        from persian.core import _compile_replacer, _multiple_replace
+
+        mapping = tuple((f"{letter}ِ", letter) for letter in "ابپتثجچحخدذرزژسش")
+        text = "دِبِ پِژِ سلام"
+        self.assertEqual("دب پژ سلام", _multiple_replace(mapping, text))
+        self.assertIs(_compile_replacer(mapping), _compile_replacer(mapping))
@@ -0,0 +1,54 @@
+import unittest
+
+import persian
+from persian.registry import MappingRegistry, compile_mappings
+
+
+class TestMappingRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MappingRegistry()
+
+    def test_builtin_profile_matches_core_functions(self):
+        profile = compile_mappings("arabic_digits", "arabic_characters")
+        text = "علي دِبِ ٣٤٥ كتاب"
+        expected = persian.convert_ar_characters(persian.convert_ar_numbers(text))
+        self.assertEqual(expected, profile(text))
+
+    def test_character_maps_compose_in_order(self):
+        self.registry.register("first", characters={"a": "b"})
+        self.registry.register("second", characters={"b": "c", "x": ""})
+        profile = self.registry.compile("first", "second")
+        self.assertEqual("ccy", profile("abxy"))
+        self.assertEqual({ord("a"): "c", ord("b"): "c", ord("x"): ""}, profile.table)
+
+    def test_rules_run_before_character_maps(self):
+        self.registry.register("rules", rules=[("ab", "a")], characters={"a": "z"})
+        self.assertEqual("zz", self.registry.compile("rules")("aba"))
+
+    def test_identical_configurations_share_compiled_profile(self):
+        self.registry.register("one", characters={"ي": "ی"})
+        self.registry.register("two", characters={"ي": "ی"})
+        first = self.registry.compile("one")
+        self.assertIs(first, self.registry.compile("one"))
+        self.assertIs(first, self.registry.compile("two"))
+        self.assertEqual(16, len(first.key))
+
+    def test_registration_errors(self):
+        self.registry.register("name", characters={"a": "b"})
+        with self.assertRaises(ValueError):
+            self.registry.register("name")
+        self.registry.register("name", characters={"a": "c"}, replace=True)
+        self.assertEqual(("name",), self.registry.names())
+        with self.assertRaises(ValueError):
+            self.registry.register("bad", characters={"ab": "c"})
+        with self.assertRaises(ValueError):
+            self.registry.register("bad", rules=[("", "c")])
+        with self.assertRaises(ValueError):
+            self.registry.compile("missing")
+        self.registry.unregister("name")
+        with self.assertRaises(ValueError):
+            self.registry.unregister("name")
+
+    def test_input_validation(self):
+        with self.assertRaises(TypeError):
+            compile_mappings("arabic_digits")(1)  # type: ignore[arg-type]
@@ -0,0 +1,88 @@
+import hashlib
+import unittest
+
+import persian
+from persian.search import SEARCH_FOLD_VERSION, _fold_table, fold_for_search
+
+# Realistic document text: spacing affixes, Arabic letters and digits, diacritics,
+# alef and heh variants, presentation forms and irregular whitespace.
+DOCUMENTS = [
+    "من می روم و کتاب ها را می خوانم.",
+    "آنها رفته اند ولی ما آمده ایم\n\t٣٤٥ كتاب",
+    "مُحَمَّد در مدرسة إسلامی درس خواند",
+    "خانۀ ما در أصفهان است ۱۴۰۲",
+    "ﻷﻟﻣ ﺍﻟﺴﻼﻡ",
+    "Python 3.12 و  persian   ",
+]
+
+
+def _legacy_chain(text):
+    """The multi-pass pipeline ``fold_for_search`` replaces."""
+    text = persian.normalize_persian(text, normalize_presentation_forms=True)
+    text = persian.remove_arabic_diacritics(text)
+    text = text.translate(str.maketrans("آأإ", "ااا")).replace("ة", "ه").replace("ۀ", "ه")
+    text = persian.convert_fa_numbers(text)
+    return " ".join(text.replace("\u200c", " ").split())
+
+
+class TestFoldForSearch(unittest.TestCase):
+    def test_matches_legacy_chain(self):
+        for text in DOCUMENTS:
+            with self.subTest(text=text):
+                self.assertEqual(_legacy_chain(text), fold_for_search(text))
+
+    def test_spacing_variants_fold_alike(self):
+        keys = {fold_for_search(text) for text in ("می روم", "می\u200cروم", " می  روم\u200c")}
+        self.assertEqual({"می روم"}, keys)
+
+    def test_letter_and_digit_variants(self):
+        self.assertEqual("ابی", fold_for_search("آبی"))
+        self.assertEqual("مدرسه", fold_for_search("مدرسة"))
+        self.assertEqual("کتاب 34", fold_for_search("كتاب ٣۴"))
+        self.assertEqual("الله", fold_for_search("ﷲ"))
+
+    def test_invisible_marks_and_tatweel_are_dropped(self):
+        self.assertEqual("کتاب", fold_for_search("\u200fک\u0640\u0640تا\u200dب\ufeff"))
+        self.assertEqual("a b", fold_for_search("a\u200bb"))
+
+    def test_ascii_only_collapses_whitespace(self):
+        self.assertEqual("Hello World", fold_for_search("  Hello \t World\n"))
+        self.assertEqual("", fold_for_search(""))
+
+    def test_version(self):
+        self.assertEqual(1, SEARCH_FOLD_VERSION)
+        self.assertEqual(fold_for_search("مدرسة"), fold_for_search("مدرسة", version=1))
+        for version in (0, 2, "1", None):
+            with self.subTest(version=version), self.assertRaises(ValueError):
+                fold_for_search("text", version=version)  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            persian.fold_for_search_many([], version=2)
+
+    def test_version_1_table_is_frozen(self):
+        # Changing any entry changes the keys of existing indexes; fold changes need a
+        # new version instead.
+        items = repr(sorted(_fold_table(1).items())).encode()
+        self.assertEqual(
+            "5322ae685b7b3aaec125f0d4488ac51a2c608d2aae547405fc1450064330a9c2",
+            hashlib.sha256(items).hexdigest(),
+        )
+
+    def test_batch(self):
+        texts = [*DOCUMENTS, "Hello"]
+        expected = [fold_for_search(text) for text in texts]
+        self.assertEqual(expected, list(persian.fold_for_search_many(texts, chunk_size=2)))
+
+    def test_exported(self):
+        self.assertIs(persian.fold_for_search, fold_for_search)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            fold_for_search(None)  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            fold_for_search(123)  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            list(persian.fold_for_search_many(["ok", 1]))  # type: ignore[list-item]
+
+
+if __name__ == "__main__":
+    unittest.main()
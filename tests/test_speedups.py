@@ -0,0 +1,173 @@
+"""The C kernels in ``persian._speedups`` against their pure-Python fallbacks."""
+
+import json
+import random
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from persian import _native, core
+from persian.constants import (
+    AR_TO_FA_CHARS_TABLE,
+    AR_TO_FA_DIGITS_TABLE,
+    EN_TO_FA_KEYBOARD_TABLE,
+    PRESENTATION_FORMS_TABLE,
+)
+
+try:
+    from persian import _speedups
+except ImportError:  # pragma: no cover - depends on the build
+    _speedups = None
+
+ROOT = Path(__file__).resolve().parents[1]
+
+ALPHABET = "ab \u200cكية\u064e٣۵ﻻﺍ\U0001f600x"
+TABLES = [
+    AR_TO_FA_CHARS_TABLE,
+    AR_TO_FA_DIGITS_TABLE,
+    EN_TO_FA_KEYBOARD_TABLE,
+    PRESENTATION_FORMS_TABLE,
+    {ord("a"): "", ord("b"): "bbb", 0x1F600: "ا", ord("x"): None, ord(" "): 0x06F1},
+]
+PAIRS = [
+    [("ab", "ا"), ("a", "x"), ("ك", "ک")],
+    [("ﻻ", "لا"), ("\u200c", ""), ("b", "\U0001f600")],
+    [("aa", ""), ("a", "")],
+    [["ab", "x"], ["\u200c", " "], ["كي", "کی"]],
+]
+RANGES = [(0x0600, 0x06FF), (0x06F0, 0x06F9), (0x0660, 0x0669), (0x61, 0x62), (0x1F600, 0x1F600)]
+
+
+def _texts(count=300, seed=7):
+    generator = random.Random(seed)
+    random_texts = (
+        "".join(generator.choices(ALPHABET, k=generator.randrange(40))) for _ in range(count)
+    )
+    return ["", "plain ascii", "سلام", *random_texts]
+
+
+@unittest.skipUnless(_speedups, "persian._speedups is not built")
+class TestSpeedups(unittest.TestCase):
+    def test_translator(self):
+        for table in TABLES:
+            fast, slow = _speedups.translator(table), _native.translator(table)
+            for text in _texts():
+                with self.subTest(table=len(table), text=text):
+                    self.assertEqual(slow(text), fast(text))
+
+    def test_replacer(self):
+        for pairs in PAIRS:
+            fast, slow = _speedups.replacer(pairs), _native.replacer(pairs)
+            for text in _texts():
+                with self.subTest(pairs=pairs, text=text):
+                    self.assertEqual(slow(text), fast(text))
+
+    def test_ranges(self):
+        for first, last in RANGES:
+            for text in _texts():
+                with self.subTest(first=first, last=last, text=text):
+                    self.assertEqual(
+                        _native.has_range(text, first, last),
+                        _speedups.has_range(text, first, last),
+                    )
+                    self.assertEqual(
+                        _native.count_range(text, first, last),
+                        _speedups.count_range(text, first, last),
+                    )
+
+    def test_unchanged_input_is_returned(self):
+        text = "unchanged سلام"
+        self.assertIs(text, _speedups.translator(AR_TO_FA_DIGITS_TABLE)(text))
+        self.assertIs(text, _speedups.replacer([("zz", "y")])(text))
+
+    def test_str_subclass_comes_back_as_str(self):
+        class Text(str):
+            pass
+
+        for text in (Text("unchanged"), Text("كي")):
+            for backend in (_speedups, _native):
+                with self.subTest(text=text, backend=backend.__name__):
+                    self.assertIs(str, type(backend.translator(AR_TO_FA_CHARS_TABLE)(text)))
+                    self.assertIs(str, type(backend.replacer([("ي", "ی")])(text)))
+
+    def test_core_uses_the_extension(self):
+        self.assertIs(_speedups.translator, core.translator)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            _speedups.translator([("a", "b")])
+        with self.assertRaises(TypeError):
+            _speedups.translator({"a": "b"})
+        with self.assertRaises(TypeError):
+            _speedups.translator(AR_TO_FA_DIGITS_TABLE)(None)
+        with self.assertRaises(TypeError):
+            _speedups.replacer([("", "x")])
+        with self.assertRaises(TypeError):
+            _speedups.replacer([("a", "b", "c")])
+        with self.assertRaises(TypeError):
+            _speedups.replacer([1])
+        with self.assertRaises(TypeError):
+            _speedups.replacer([("a", "b")])(42)
+        with self.assertRaises(TypeError):
+            _speedups.has_range(42, 0, 1)
+        with self.assertRaises(TypeError):
+            _speedups.count_range("a", 0)
+
+
+# Run ``persian.core`` in a fresh interpreter with the extension blocked, so that it
+# falls back to ``persian._native``, and print its results for the texts on stdin.
+_PURE_PYTHON_PROBE = """
+import json, sys
+sys.modules["persian._speedups"] = None
+from persian import _native, core
+assert core.translator is _native.translator
+print(json.dumps([
+    [core.normalize_persian(text), core.is_persian_text(text), core.count_persian_chars(text),
+     core.contains_persian_digits(text), core.remove_arabic_diacritics(text)]
+    for text in json.load(sys.stdin)
+]))
+"""
+
+
+class TestPurePythonCore(unittest.TestCase):
+    def test_matches_the_loaded_backend(self):
+        texts = [*_texts(), "كتاب ٣٤٥ را می خوانم و آمده ای", "مُحَمَّد sghl ۱۲"]
+        completed = subprocess.run(
+            [sys.executable, "-c", _PURE_PYTHON_PROBE],
+            cwd=ROOT,
+            input=json.dumps(texts),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        expected = [
+            [
+                core.normalize_persian(text),
+                core.is_persian_text(text),
+                core.count_persian_chars(text),
+                core.contains_persian_digits(text),
+                core.remove_arabic_diacritics(text),
+            ]
+            for text in texts
+        ]
+        self.assertEqual(expected, json.loads(completed.stdout))
+
+
+class TestNative(unittest.TestCase):
+    def test_translator(self):
+        self.assertEqual("کx", _native.translator(AR_TO_FA_CHARS_TABLE)("كx"))
+
+    def test_replacer_prefers_earlier_pairs(self):
+        replace = _native.replacer([("ab", "1"), ("a", "2")])
+        self.assertEqual("12c", replace("abac"))
+
+    def test_ranges(self):
+        self.assertTrue(_native.has_range("x۵", 0x06F0, 0x06F9))
+        self.assertFalse(_native.has_range("ascii", 0x06F0, 0x06F9))
+        self.assertEqual(3, _native.count_range("سaلا", 0x0600, 0x06FF))
+        self.assertEqual(0, _native.count_range("ascii", 0x0600, 0x06FF))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import persian
+from persian import constants
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Print the modules the statement adds to those a bare interpreter has loaded.
+_PROBE = """
+import json, sys
+before = set(sys.modules)
+{statement}
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def _run_json(code: str):
+    """Run ``code`` in a fresh interpreter and decode the JSON it prints."""
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout)
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    """Run ``statement`` in a fresh interpreter and return the modules it imported."""
+    return set(_run_json(_PROBE.format(statement=statement)))
+
+
+class TestLazyImport(unittest.TestCase):
+    """Import-cost guards; timings against a budget live in ``benchmarks/``."""
+
+    def test_import_loads_no_submodules(self):
+        loaded = _loaded_modules("import persian")
+        self.assertLessEqual(
+            {name for name in loaded if name.startswith("persian")},
+            {
+                "persian",
+                "persian._version",
+            },
+        )
+        for heavy in ("re", "typing", "urllib.parse", "unicodedata", "concurrent.futures"):
+            with self.subTest(module=heavy):
+                self.assertNotIn(heavy, loaded)
+
+    def test_attribute_access_loads_only_its_submodule(self):
+        loaded = _loaded_modules("import persian; persian.convert_fa_spaces('من می روم')")
+        self.assertIn("persian.core", loaded)
+        for unused in (
+            "persian.normalizer",
+            "persian.parallel",
+            "persian.alignment",
+            "urllib.parse",
+        ):
+            with self.subTest(module=unused):
+                self.assertNotIn(unused, loaded)
+
+    def test_constants_are_built_on_first_use(self):
+        built = _run_json(
+            "import json, persian\n"
+            "from persian import constants\n"
+            "persian.convert_fa_spaces('من می روم')\n"
+            "print(json.dumps(sorted(set(constants._LAZY_CONSTANTS) & set(vars(constants)))))"
+        )
+        self.assertEqual(["DE_YII_PATTERN", "MI_PATTERN"], built)
+
+    def test_every_export_resolves(self):
+        for name in persian.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(persian, name))
+        self.assertLessEqual(set(persian.__all__), set(dir(persian)))
+        self.assertIs(persian.normalize_persian, persian.core.normalize_persian)
+
+    def test_deprecated_helpers_remain_importable(self):
+        from persian import enToPersianNumb
+
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual("۱۲", enToPersianNumb("12"))
+
+    def test_lazy_constants_match_eager_definitions(self):
+        self.assertEqual("\u200c", constants.MI_PATTERN.sub("\\2\u200c\\4", " می رو")[3])
+        self.assertEqual("ب", constants.PRESENTATION_FORMS_TABLE[0xFE8F])
+        self.assertIs(constants.SCRIPT_RUN_PATTERN, constants.SCRIPT_RUN_PATTERN)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            persian.no_such_name  # noqa: B018
+        with self.assertRaises(AttributeError):
+            constants.NO_SUCH_PATTERN  # noqa: B018
+
+
+if __name__ == "__main__":
+    unittest.main()
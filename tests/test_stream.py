@@ -0,0 +1,104 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import persian
+from persian import stream
+from persian.cli import main
+from persian.stream import normalize_stream
+
+TEXT = "كتاب شماره ٣ را می خوانم. آمده ای ولی من رفته ام\nو می آییم مي روم\n" * 20
+
+
+class TestNormalizeStream(unittest.TestCase):
+    def test_matches_whole_text_for_every_buffer_size(self):
+        expected = persian.normalize_persian(TEXT)
+        for buffer_size in (1, 2, 3, 7, 64, 4096):
+            with self.subTest(buffer_size=buffer_size):
+                pieces = normalize_stream(io.StringIO(TEXT), buffer_size=buffer_size)
+                self.assertEqual(expected, "".join(pieces))
+
+    def test_matches_across_buffer_edges(self):
+        text = "من می روم ام"
+        expected = persian.normalize_persian(text)
+        for buffer_size in range(1, len(text) + 1):
+            with self.subTest(buffer_size=buffer_size):
+                pieces = normalize_stream(io.StringIO(text), buffer_size=buffer_size)
+                self.assertEqual(expected, "".join(pieces))
+
+    def test_flags_and_workers(self):
+        expected = persian.normalize_persian(TEXT, convert_numbers=False)
+        pieces = normalize_stream(
+            io.StringIO(TEXT), convert_numbers=False, buffer_size=16, workers=2
+        )
+        self.assertEqual(expected, "".join(pieces))
+
+    def test_long_text_without_safe_cut(self):
+        # No position in a run of "می" prefixes is safe to split at.
+        for text in ["می " * 20_000, "ب" * 60_000, " " * 60_000 + "ای"]:
+            with self.subTest(text=text[:8]):
+                pieces = normalize_stream(io.StringIO(text), buffer_size=16)
+                self.assertEqual(persian.normalize_persian(text), "".join(pieces))
+
+    def test_pending_text_is_capped(self):
+        text = "می " * 1_000
+        with mock.patch.object(stream, "MAX_PENDING", 100):
+            pieces = list(normalize_stream(io.StringIO(text), buffer_size=16))
+        self.assertGreater(len(pieces), 1)
+        self.assertTrue(all(len(piece) <= 100 + 16 for piece in pieces))
+
+    def test_invalid_buffer_size(self):
+        with self.assertRaises(ValueError):
+            normalize_stream(io.StringIO(""), buffer_size=0)
+
+
+class TestCommandLine(unittest.TestCase):
+    def test_normalizes_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory) / "input.txt"
+            target = Path(directory) / "output.txt"
+            source.write_text(TEXT, encoding="utf-8")
+            status = main([str(source), "-o", str(target), "--no-fix-spacing"])
+            self.assertEqual(0, status)
+            self.assertEqual(
+                persian.normalize_persian(TEXT, fix_spacing=False),
+                target.read_text(encoding="utf-8"),
+            )
+
+    def test_rejects_invalid_workers(self):
+        with self.assertRaises(SystemExit):
+            main(["--workers", "0"])
+
+    def test_missing_input_leaves_output_alone(self):
+        with tempfile.TemporaryDirectory() as directory:
+            target = Path(directory) / "output.txt"
+            target.write_text("keep", encoding="utf-8")
+            with self.assertRaises(SystemExit) as raised, contextlib.redirect_stderr(io.StringIO()):
+                main([str(Path(directory) / "missing.txt"), "-o", str(target)])
+            self.assertEqual(2, raised.exception.code)
+            self.assertEqual("keep", target.read_text(encoding="utf-8"))
+
+    def test_refuses_output_that_is_an_input(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory) / "input.txt"
+            source.write_text(TEXT, encoding="utf-8")
+            with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+                main([str(source), "-o", str(Path(directory) / "." / "input.txt")])
+            self.assertEqual(TEXT, source.read_text(encoding="utf-8"))
+
+    def test_reports_undecodable_input(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory) / "input.txt"
+            source.write_bytes(b"abc \xff\xfe")
+            errors = io.StringIO()
+            with contextlib.redirect_stderr(errors):
+                status = main([str(source), "-o", str(Path(directory) / "output.txt")])
+            self.assertEqual(1, status)
+            self.assertIn("input.txt", errors.getvalue())
+
+    def test_rejects_unknown_encoding(self):
+        with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+            main(["--encoding", "no-such-codec"])
@@ -0,0 +1,155 @@
+"""Concurrent use of the shared patterns, tables and caches from many threads.
+
+Each test releases its threads together from a barrier and, on GIL builds,
+shortens the switch interval so that threads interleave inside the library
+calls. On free-threaded builds they run truly in parallel.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+import persian
+from persian import core
+
+ROOT = Path(__file__).resolve().parents[1]
+THREADS = 8
+ROUNDS = 20
+
+TEXTS = [
+    "",
+    "Hello world 0912 sghl",
+    "سلام ٣٤٥ می آیم و كتاب ها را خوانده ام",
+    "علي دِبِ آنها رفته اند ۱۳۹۹",
+    "ﻻ ﺍﻟﺴﻼﻡ %D8%B3%D9%84%D8%A7%D9%85",
+    "من می  روم\u200c و آمده ای",
+]
+NUMBER_TEXTS = ["۲٬۳۴۴", "٣٤٫٢", "42", "-۱.۵"]
+NUMBERS = [2344, 34.2, -1, 10**15]
+NUMBER_FUNCTIONS = {"format_number": NUMBERS, "parse_number": NUMBER_TEXTS}
+
+# Threads access lazy exports and lazy constants for the first time together.
+COLD_TEXTS = ["سلام ٣٤٥ می آیم", "ﻻ كتاب ها", "۱۲ آمده ای"]
+_COLD_START = """
+import json, sys, threading
+sys.setswitchinterval(1e-6)
+import persian
+
+texts = {texts!r}
+barrier = threading.Barrier(8)
+results = [None] * 8
+
+def run(index):
+    barrier.wait()
+    results[index] = [
+        [persian.normalize_persian(text, normalize_presentation_forms=True) for text in texts],
+        [persian.fold_for_search(text) for text in texts],
+        [persian.convert_en_numbers(str(index)), persian.number_to_words(index)],
+        list(persian.tokenize_array(texts[0])),
+    ]
+
+threads = [threading.Thread(target=run, args=(index,)) for index in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(json.dumps(results))
+"""
+
+
+def _hammer(function, inputs):
+    """Call ``function`` on every input from ``THREADS`` threads at once.
+
+    Returns the results of each thread, in thread order, and re-raises the
+    first exception a thread hit.
+    """
+    barrier = threading.Barrier(THREADS)
+    results = [None] * THREADS
+    errors = []
+
+    def run(index):
+        try:
+            barrier.wait()
+            results[index] = [[function(item) for item in inputs] for _ in range(ROUNDS)]
+        except BaseException as error:
+            errors.append(error)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    if errors:
+        raise errors[0]
+    return results
+
+
+class TestConcurrentUse(unittest.TestCase):
+    def assertDeterministic(self, function, inputs):
+        expected = [function(item) for item in inputs]
+        for results in _hammer(function, inputs):
+            for result in results:
+                self.assertEqual(expected, result)
+
+    def test_every_core_function(self):
+        for name in core.__all__:
+            with self.subTest(function=name):
+                self.assertDeterministic(getattr(core, name), NUMBER_FUNCTIONS.get(name, TEXTS))
+
+    def test_shared_normalizer(self):
+        normalizer = persian.Normalizer(normalize_presentation_forms=True)
+        self.assertDeterministic(normalizer, TEXTS)
+        self.assertDeterministic(lambda text: normalizer.normalize_with_alignment(text)[0], TEXTS)
+
+    def test_tokenizer_search_and_number_words(self):
+        self.assertDeterministic(persian.tokenize_normalized, TEXTS)
+        self.assertDeterministic(persian.fold_for_search, TEXTS)
+        self.assertDeterministic(persian.number_to_words, NUMBERS)
+
+    def test_cached_function(self):
+        normalize = persian.cached(persian.normalize_persian, maxsize=2)
+        self.assertDeterministic(normalize, TEXTS)
+        info = normalize.cache_info()
+        calls = len(TEXTS) * (THREADS * ROUNDS + 1)
+        self.assertEqual(calls, info.hits + info.misses)
+
+    def test_threaded_batch(self):
+        items = TEXTS * 100
+        expected = [persian.normalize_persian(text) for text in items]
+
+        def normalize(chunk_size):
+            return list(persian.normalize_threaded(items, workers=4, chunk_size=chunk_size))
+
+        for results in _hammer(normalize, [7, 64]):
+            for result in results:
+                self.assertEqual([expected, expected], result)
+
+    def test_cold_start(self):
+        completed = subprocess.run(
+            [sys.executable, "-c", _COLD_START.format(texts=COLD_TEXTS)],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        normalized = [
+            persian.normalize_persian(text, normalize_presentation_forms=True)
+            for text in COLD_TEXTS
+        ]
+        folded = [persian.fold_for_search(text) for text in COLD_TEXTS]
+        spans = list(persian.tokenize_array(COLD_TEXTS[0]))
+        for index, result in enumerate(json.loads(completed.stdout)):
+            numbers = [persian.convert_en_numbers(str(index)), persian.number_to_words(index)]
+            self.assertEqual([normalized, folded, numbers, spans], result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import itertools
+import random
+import unittest
+from array import array
+
+import persian
+from persian.tokenizer import tokenize, tokenize_array, tokenize_normalized
+
+
+def _tokens(text):
+    return [text[start:end] for start, end in tokenize(text)]
+
+
+class TestTokenize(unittest.TestCase):
+    def test_spans_cover_words_and_punctuation(self):
+        text = "سلام، دنیا! hello 123"
+        self.assertEqual(["سلام", "،", "دنیا", "!", "hello", "123"], _tokens(text))
+
+    def test_zwnj_joins_words(self):
+        text = "کتاب\u200cها را می\u200cخوانم"
+        self.assertEqual(["کتاب\u200cها", "را", "می\u200cخوانم"], _tokens(text))
+
+    def test_zwnj_at_word_edges_is_not_a_token(self):
+        self.assertEqual(["کتاب", "ها"], _tokens("\u200cکتاب\u200c ها\u200c"))
+
+    def test_diacritics_stay_in_words(self):
+        text = "کتابِ مَن cafe\u0301"
+        self.assertEqual(["کتابِ", "مَن", "cafe\u0301"], _tokens(text))
+
+    def test_whitespace_and_format_characters_separate_tokens(self):
+        self.assertEqual([], _tokens(" \t\n\u200b\u200f "))
+        self.assertEqual(["a", "b"], _tokens("a\u200bb"))
+
+    def test_spans_index_the_original_text(self):
+        text = "  ۱۲ کتاب. "
+        self.assertEqual([(2, 4), (5, 9), (9, 10)], list(tokenize(text)))
+
+    def test_tokenize_array_is_flat(self):
+        spans = tokenize_array("من می\u200cروم.")
+        self.assertIsInstance(spans, array)
+        self.assertEqual(array("Q", [0, 2, 3, 9, 9, 10]), spans)
+
+    def test_exported(self):
+        self.assertIs(persian.tokenize, tokenize)
+        self.assertIs(persian.tokenize_array, tokenize_array)
+        self.assertIs(persian.tokenize_normalized, tokenize_normalized)
+
+    def test_invalid_input(self):
+        for function in (tokenize, tokenize_array, tokenize_normalized):
+            with self.assertRaises(ValueError):
+                function(None)
+            with self.assertRaises(TypeError):
+                function(123)
+
+
+class TestTokenizeNormalized(unittest.TestCase):
+    def test_spacing_fix_forms_one_token(self):
+        normalized, spans = tokenize_normalized("من می روم و آمده ای")
+        self.assertEqual("من می\u200cروم و آمده\u200cای", normalized)
+        self.assertEqual(array("Q", [0, 2, 3, 9, 10, 11, 12, 19]), spans)
+
+    def test_punctuation_inside_a_spacing_fix_is_split(self):
+        normalized, spans = tokenize_normalized("من می روم،")
+        self.assertEqual(array("Q", [0, 2, 3, 9, 9, 10]), spans)
+        self.assertEqual("،", normalized[9:10])
+
+    def test_unchanged_text_is_returned_as_is(self):
+        text = "کتاب خوب است"
+        normalized, _ = tokenize_normalized(text)
+        self.assertIs(text, normalized)
+
+    def test_matches_normalizing_then_tokenizing(self):
+        pieces = [
+            "می",
+            "ام",
+            "ای",
+            "ایی",
+            "اند",
+            "روم",
+            "کتاب",
+            " ",
+            "  ",
+            "\n",
+            "\u200c",
+            "،",
+            ".",
+            "٣",
+            "12",
+            "abc",
+            "ِ",
+            "ك",
+            "ﻻ",
+            "\u200b",
+        ]
+        rng = random.Random(0)
+        flags = list(itertools.product((False, True), repeat=4))
+        for _ in range(3000):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            numbers, characters, spacing, forms = rng.choice(flags)
+            options = {
+                "convert_numbers": numbers,
+                "convert_characters": characters,
+                "fix_spacing": spacing,
+                "normalize_presentation_forms": forms,
+            }
+            normalized = persian.normalize_persian(text, **options)
+            self.assertEqual(
+                (normalized, tokenize_array(normalized)),
+                tokenize_normalized(text, **options),
+                (text, options),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()